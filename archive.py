@@ -0,0 +1,240 @@
+import os
+import sys
+import json
+import time
+import struct
+import argparse
+from array import array
+from bisect import bisect_left, bisect_right
+
+from engine import parse_result, result_flags, flags_result
+
+# 레코드: 회차(uint32), 수집 시각(float64, unix time), 결과 플래그(uint8) - 13바이트 고정 길이
+RECORD = struct.Struct('<IdB')
+# 인덱스: 회차(uint32), 레코드 번호(uint32) - 회차순 정렬
+INDEX = struct.Struct('<II')
+
+
+class ResultArchive:
+    """관측한 모든 회차 결과를 고정 길이 바이너리 파일에 쌓아두는 보관소
+
+    데이터 파일(.arc)은 들어온 순서대로 레코드를 덧붙이기만 하고, 회차순으로 정렬된
+    인덱스 파일(.idx)로 범위 조회를 한다. 같은 회차는 한 번만 저장한다.
+    인덱스의 레코드 수가 데이터 파일과 다르면 (비정상 종료 등) 데이터 파일을 읽어 다시 만든다.
+    """
+
+    def __init__(self, path=os.path.join('betting_logs', 'power_ladder.arc')):
+        self.path = path
+        self.index_path = os.path.splitext(path)[0] + '.idx'
+        self.rounds = array('I')     # 회차순 정렬
+        self.positions = array('I')  # rounds 와 같은 순서의 레코드 번호
+        self.index_dirty = False
+
+        self.file = open(path, 'a+b')
+        self.file.seek(0, os.SEEK_END)
+        self.count = self.file.tell() // RECORD.size
+        self.load_index()
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, round_num):
+        round_num = int(round_num)
+        i = bisect_left(self.rounds, round_num)
+        return i < len(self.rounds) and self.rounds[i] == round_num
+
+    def load_index(self):
+        """인덱스 파일을 읽고, 데이터 파일과 맞지 않으면 다시 만듦"""
+        if os.path.exists(self.index_path) and os.path.getsize(self.index_path) == self.count * INDEX.size:
+            with open(self.index_path, 'rb') as f:
+                data = f.read()
+            pairs = array('I', data)
+            self.rounds = pairs[0::2]
+            self.positions = pairs[1::2]
+            return
+
+        self.file.seek(0)
+        records = struct.iter_unpack(RECORD.format, self.file.read(self.count * RECORD.size))
+        entries = sorted((round_num, position) for position, (round_num, _, _) in enumerate(records))
+        self.rounds = array('I', (round_num for round_num, _ in entries))
+        self.positions = array('I', (position for _, position in entries))
+        self.index_dirty = True
+        self.save_index()
+
+    def save_index(self):
+        """변경된 인덱스를 파일로 저장"""
+        if not self.index_dirty:
+            return
+        pairs = array('I', bytes(len(self.rounds) * INDEX.size))
+        pairs[0::2] = self.rounds
+        pairs[1::2] = self.positions
+        temp_path = self.index_path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(pairs.tobytes())
+        os.replace(temp_path, self.index_path)
+        self.index_dirty = False
+
+    def append(self, result, observed=None):
+        """결과 한 회차 추가 (이미 있는 회차면 False)"""
+        round_num = int(result[0])
+        if round_num in self:
+            return False
+
+        position = self.count
+        self.file.write(RECORD.pack(round_num, observed if observed is not None else time.time(),
+                                    result_flags(result)))
+        self.file.flush()
+        self.count += 1
+
+        if not self.rounds or round_num > self.rounds[-1]:
+            # 최신 회차는 인덱스 끝에 바로 덧붙임
+            self.rounds.append(round_num)
+            self.positions.append(position)
+            if not self.index_dirty:
+                with open(self.index_path, 'ab') as f:
+                    f.write(INDEX.pack(round_num, position))
+        else:
+            # 과거 회차(백필)는 정렬 위치에 끼워 넣고 닫을 때 인덱스를 다시 저장
+            i = bisect_left(self.rounds, round_num)
+            self.rounds.insert(i, round_num)
+            self.positions.insert(i, position)
+            self.index_dirty = True
+        return True
+
+    def extend(self, results, observed=None):
+        """여러 회차 추가 후 인덱스 저장, 새로 추가된 수를 반환"""
+        added = sum(self.append(result, observed) for result in results)
+        self.save_index()
+        return added
+
+    def read_records(self, positions):
+        """레코드 번호들의 (회차, 수집 시각, 플래그) 를 한 번의 읽기로 가져옴"""
+        if not positions:
+            return []
+        first, last = min(positions), max(positions)
+        self.file.seek(first * RECORD.size)
+        data = self.file.read((last - first + 1) * RECORD.size)
+        return [RECORD.unpack_from(data, (position - first) * RECORD.size) for position in positions]
+
+    def range(self, start=None, end=None):
+        """start 이상 end 이하 회차의 결과를 회차순으로 반환"""
+        lo = bisect_left(self.rounds, int(start)) if start is not None else 0
+        hi = bisect_right(self.rounds, int(end)) if end is not None else len(self.rounds)
+        return [flags_result(round_num, flags)
+                for round_num, _, flags in self.read_records(self.positions[lo:hi])]
+
+    def latest(self, count):
+        """최근 count 개 회차의 결과를 회차순으로 반환"""
+        lo = max(0, len(self.rounds) - count)
+        return [flags_result(round_num, flags)
+                for round_num, _, flags in self.read_records(self.positions[lo:])]
+
+    def before(self, round_num, count, offset=0):
+        """round_num 보다 앞선 회차를 최신순으로 offset 번째부터 count 개 (round_num 이 None 이면 최신부터)"""
+        hi = bisect_left(self.rounds, int(round_num)) if round_num is not None else len(self.rounds)
+        hi = max(0, hi - offset)
+        lo = max(0, hi - count)
+        return [flags_result(round_num, flags)
+                for round_num, _, flags in reversed(self.read_records(self.positions[lo:hi]))]
+
+    def count_before(self, round_num):
+        """round_num 보다 앞선 회차 수"""
+        return bisect_left(self.rounds, int(round_num)) if round_num is not None else len(self.rounds)
+
+    def missing_rounds(self, start=None, end=None):
+        """start ~ end 사이에 비어 있는 회차 번호 목록 (기본은 보관된 첫 회차 ~ 마지막 회차)"""
+        if not self.rounds and (start is None or end is None):
+            return []
+        start = int(start) if start is not None else self.rounds[0]
+        end = int(end) if end is not None else self.rounds[-1]
+        lo = bisect_left(self.rounds, start)
+        hi = bisect_right(self.rounds, end)
+        present = set(self.rounds[lo:hi])
+        return [round_num for round_num in range(start, end + 1) if round_num not in present]
+
+    def close(self):
+        self.save_index()
+        self.file.close()
+
+
+def load_dump(path):
+    """result.json 응답을 한 줄에 하나씩 저장한 JSON Lines 덤프 (또는 응답 배열 JSON) 읽기"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    if text.lstrip().startswith('['):
+        return [parse_result(data) for data in json.loads(text)]
+    return [parse_result(json.loads(line)) for line in text.splitlines() if line.strip()]
+
+
+def fetch_history(session, base_url, game, start, end, page_size=1000, timeout=10):
+    """로컬 대체 서버(stub_server.py)의 history.json 에서 회차 범위를 페이지 단위로 가져옴"""
+    results = []
+    for page_start in range(start, end + 1, page_size):
+        page_end = min(end, page_start + page_size - 1)
+        response = session.get(f"{base_url}/data/json/games/{game}/history.json",
+                               params={'start': page_start, 'end': page_end}, timeout=timeout)
+        response.raise_for_status()
+        results.extend(parse_result(data) for data in response.json())
+    return results
+
+
+def group_ranges(rounds):
+    """정렬된 회차 번호를 연속 구간 [(시작, 끝), ...] 으로 묶음"""
+    ranges = []
+    for round_num in rounds:
+        if ranges and ranges[-1][1] + 1 == round_num:
+            ranges[-1][1] = round_num
+        else:
+            ranges.append([round_num, round_num])
+    return [tuple(pair) for pair in ranges]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="회차 결과 보관소 관리")
+    parser.add_argument('--archive', default=os.path.join('betting_logs', 'power_ladder.arc'))
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    backfill = commands.add_parser('backfill', help="덤프 파일이나 로컬 대체 서버로 빠진 회차 채우기")
+    backfill.add_argument('--dump', nargs='*', default=[], help="result.json 응답 JSON Lines 파일")
+    backfill.add_argument('--url', help="대체 서버 주소 (예: http://127.0.0.1:8000)")
+    backfill.add_argument('--game', default='power_ladder')
+    backfill.add_argument('--start', type=int, help="채울 첫 회차 (기본: 보관된 첫 회차)")
+    backfill.add_argument('--end', type=int, help="채울 마지막 회차 (기본: 보관된 마지막 회차)")
+
+    commands.add_parser('info', help="보관 현황 출력")
+
+    export = commands.add_parser('export', help="회차 범위를 JSON Lines 로 출력")
+    export.add_argument('--start', type=int)
+    export.add_argument('--end', type=int)
+    args = parser.parse_args(argv)
+
+    archive = ResultArchive(args.archive)
+    try:
+        if args.command == 'backfill':
+            for path in args.dump:
+                added = archive.extend(load_dump(path))
+                print(f"{path}: {added}회차 추가")
+            if args.url:
+                import requests
+                session = requests.Session()
+                missing = archive.missing_rounds(args.start, args.end)
+                for start, end in group_ranges(missing):
+                    added = archive.extend(fetch_history(session, args.url, args.game, start, end))
+                    print(f"{start}~{end}회차: {added}회차 추가")
+        elif args.command == 'export':
+            for round_num, direction, line, parity in archive.range(args.start, args.end):
+                print(json.dumps({'r': int(round_num), 's': 'LEFT' if direction == '좌' else 'RIGHT',
+                                  'l': int(line), 'o': 'ODD' if parity == '홀' else 'EVEN'}))
+
+        if archive.rounds:
+            print(f"보관 {len(archive)}회차 ({archive.rounds[0]}~{archive.rounds[-1]}회차), "
+                  f"빈 회차 {len(archive.missing_rounds())}개", file=sys.stderr)
+        else:
+            print("보관된 회차가 없습니다", file=sys.stderr)
+    finally:
+        archive.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+import sys
+import json
+import copy
+import time
+import argparse
+
+from engine import (ODDS, BETTING_PATTERNS, default_betting_methods, parse_result, custom_picks,
+                    build_round_bets, settle_round, is_winning_round, step_martingale, is_martingale)
+
+
+class BacktestReport:
+    """백테스트 결과 요약"""
+
+    def __init__(self, method, initial_asset, equity_curve, win_count, lose_count, max_drawdown):
+        self.method = method
+        self.initial_asset = initial_asset
+        self.equity_curve = equity_curve  # 회차별 자산 (초기자산 + 누적 순수익)
+        self.win_count = win_count
+        self.lose_count = lose_count
+        self.max_drawdown = max_drawdown  # 최고 자산 대비 최대 하락폭
+
+    @property
+    def rounds(self):
+        return self.win_count + self.lose_count
+
+    @property
+    def final_asset(self):
+        return self.equity_curve[-1] if self.equity_curve else self.initial_asset
+
+    @property
+    def total_profit(self):
+        return self.final_asset - self.initial_asset
+
+    @property
+    def win_rate(self):
+        return self.win_count / self.rounds * 100 if self.rounds else 0
+
+    def summary(self):
+        return (f"{self.method}: {self.rounds}회차, 승률 {self.win_rate:.1f}% "
+                f"({self.win_count}승 {self.lose_count}패), 순수익 {self.total_profit:,.0f}원, "
+                f"최종자산 {self.final_asset:,.0f}원, 최대낙폭 {self.max_drawdown:,.0f}원")
+
+
+class Backtester:
+    """과거 결과를 실시간 베팅과 같은 방식으로 재생하는 화면 없는 백테스터
+
+    회차마다 LadderGameGUI.update_prediction 과 같은 build_round_bets 로 베팅을 만들고
+    check_prediction_result 와 같은 settle_round 로 정산한다.
+    pay_combination 이면 적중한 조합 베팅에도 당첨금을 지급한다 (settle_round 참고).
+    """
+
+    def __init__(self, method='method1', mode='rotation', selected_picks=('좌', '3', '홀'),
+                 initial_asset=500000, betting_methods=None, betting_patterns=None, odds=None,
+                 pay_combination=False):
+        self.method = method
+        self.mode = mode
+        self.selected_picks = tuple(selected_picks)
+        self.initial_asset = initial_asset
+        self.betting_methods = betting_methods if betting_methods is not None else default_betting_methods()
+        self.betting_patterns = betting_patterns if betting_patterns is not None else BETTING_PATTERNS
+        self.odds = odds if odds is not None else ODDS
+        self.pay_combination = pay_combination
+
+    def run(self, results):
+        """(회차, 방향, 줄수, 홀짝) 결과들을 오래된 순서대로 재생"""
+        # 마틴 단계가 바뀌므로 설정은 복사해서 사용
+        method_config = copy.deepcopy(self.betting_methods[self.method])
+        method = self.method
+        martingale = is_martingale(method)
+        odds = self.odds
+        pay_combination = self.pay_combination
+        patterns = self.betting_patterns
+        pattern_index = 0
+
+        chance_pick = self.selected_picks[2] != '없음'
+        fixed_prediction = custom_picks(self.selected_picks)
+
+        asset = self.initial_asset
+        peak = asset
+        max_drawdown = 0
+        win_count = 0
+        lose_count = 0
+        equity_curve = []
+
+        for round_num, direction, line, parity in results:
+            if self.mode == 'rotation':
+                pattern_type, predicted_direction, predicted_line, predicted_parity = patterns[pattern_index]
+                pattern_index = (pattern_index + 1) % len(patterns)
+                prediction = (predicted_direction, predicted_line, predicted_parity)
+            else:
+                pattern_type = 'custom'
+                prediction = fixed_prediction
+
+            round_info = build_round_bets(round_num, method, method_config, prediction, pattern_type, chance_pick)
+            win_amount, correct_picks, _ = settle_round(round_info, (direction, line, parity), odds,
+                                                      pay_combination)
+
+            won = is_winning_round(correct_picks)
+            if won:
+                win_count += 1
+            else:
+                lose_count += 1
+            if martingale:
+                step_martingale(method_config, won)
+
+            asset += win_amount - round_info.total_bet
+            equity_curve.append(asset)
+            if asset > peak:
+                peak = asset
+            elif peak - asset > max_drawdown:
+                max_drawdown = peak - asset
+
+        return BacktestReport(method, self.initial_asset, equity_curve, win_count, lose_count, max_drawdown)
+
+
+def load_results(path):
+    """result.json 응답을 한 줄에 하나씩 저장한 JSON Lines 파일 (또는 .arc 보관소) 을 회차순으로 읽음"""
+    if path.endswith('.arc'):
+        from archive import ResultArchive
+        archive = ResultArchive(path)
+        try:
+            return archive.range()
+        finally:
+            archive.close()
+    
+    results = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                results.append(parse_result(json.loads(line)))
+    results.sort(key=lambda result: int(result[0]))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="베팅 방법 백테스트")
+    parser.add_argument('results', help="result.json 응답 JSON Lines 파일 또는 .arc 보관소")
+    parser.add_argument('--method', default='all', help="method1 ~ method5 또는 all")
+    parser.add_argument('--mode', default='rotation', choices=['rotation', 'custom'])
+    parser.add_argument('--picks', nargs=3, default=['좌', '3', '홀'], help="선택 모드 픽 3개")
+    parser.add_argument('--initial-asset', type=int, default=500000)
+    parser.add_argument('--pay-combination', action='store_true', help="적중한 조합 베팅에도 당첨금 지급")
+    args = parser.parse_args(argv)
+
+    results = load_results(args.results)
+    methods = sorted(default_betting_methods()) if args.method == 'all' else [args.method]
+    for method in methods:
+        started = time.perf_counter()
+        report = Backtester(method, args.mode, args.picks, args.initial_asset,
+                            pay_combination=args.pay_combination).run(results)
+        elapsed = time.perf_counter() - started
+        print(f"{report.summary()} [{elapsed * 1000:.1f}ms]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
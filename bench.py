@@ -0,0 +1,150 @@
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import platform
+import tempfile
+
+from stub_server import make_result
+from engine import parse_result
+from metrics import METRICS, LatencyHistogram
+
+# 결과 처리 경로 벤치마크
+#   python bench.py                                   기본: 화면 없이 (null) 1,000 / 10,000회차
+#   python bench.py --rounds 1000 10000 100000        100,000회차까지 (수 분 걸림)
+#   python bench.py --backend tk --output bench.json  실제 위젯까지 그림 (디스플레이 필요, 없으면 xvfb-run)
+# --backend null 은 views.NullView 로 위젯 작업 없이 앱 로직만 잰다.
+# 실제 LadderGameGUI.update_data 경로(정산, 로그, 결과 목록, 통계, 보관소, 저널)를 그대로 사용하고,
+# 결과는 stub_server 와 같은 합성 result.json 응답을 네트워크 없이 바로 넣는다.
+
+
+def current_rss():
+    """현재 프로세스 메모리 사용량 (바이트, 알 수 없으면 None)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        return None
+
+
+def create_app(backend):
+    """벤치마크용 LadderGameGUI (네트워크 조회 없음)"""
+    from test import LadderGameGUI
+    from views import create_view
+    view = create_view(backend)
+    view.root.withdraw()
+    return LadderGameGUI(view.root, start_fetcher=False, view=view)
+
+
+def run_stream(backend, rounds, game='power_ladder', first_round=1000000, sample_every=1000):
+    """빈 데이터 폴더에서 앱을 만들고 rounds 개의 합성 결과를 순서대로 처리"""
+    app = create_app(backend)
+    latency = LatencyHistogram()
+    memory = []
+    METRICS.reset()
+    rss_start = current_rss()
+    started = time.perf_counter()
+    try:
+        for index in range(rounds):
+            payload = make_result(game, first_round + index)
+            round_started = time.perf_counter()
+            app.update_data(parse_result(payload))
+            app.root.update_idletasks()
+            latency.add(time.perf_counter() - round_started)
+            if (index + 1) % sample_every == 0:
+                memory.append((index + 1, current_rss()))
+        elapsed = time.perf_counter() - started
+        rss_end = current_rss()
+    finally:
+        app.on_closing()
+
+    growth = None
+    if rss_start is not None and rss_end is not None:
+        growth = (rss_end - rss_start) / rounds * 1000
+    return {
+        'rounds': rounds,
+        'seconds': elapsed,
+        'rounds_per_second': rounds / elapsed if elapsed else 0.0,
+        'latency': latency.summary(),
+        'rss_start': rss_start,
+        'rss_end': rss_end,
+        'rss_growth_per_1k_rounds': growth,
+        'memory_samples': memory,
+        'stages': METRICS.snapshot()
+    }
+
+
+def compare(results, baseline_path):
+    """이전 결과 파일과 처리량/지연 비교 출력"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {run['rounds']: run for run in json.load(f)['runs']}
+    for run in results['runs']:
+        old = baseline.get(run['rounds'])
+        if not old:
+            continue
+        print(f"{run['rounds']:>7}회차: 처리량 {run['rounds_per_second'] / old['rounds_per_second'] * 100 - 100:+.1f}%, "
+              f"p95 {run['latency']['p95_ms'] - old['latency']['p95_ms']:+.3f}ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="결과 처리 경로 벤치마크")
+    parser.add_argument('--rounds', type=int, nargs='+', default=[1000, 10000],
+                        help="처리할 회차 수들 (100000 은 직접 지정)")
+    parser.add_argument('--backend', default='null', choices=['null', 'tk'],
+                        help="null: 화면 없이 (기본), tk: 실제 위젯 (디스플레이 필요)")
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--baseline', help="비교할 이전 결과 JSON")
+    parser.add_argument('--log-level', default='WARNING')
+    args = parser.parse_args(argv)
+    output = os.path.abspath(args.output)
+    baseline = os.path.abspath(args.baseline) if args.baseline else None
+
+    # 앱이 쓰는 betting_logs / ladder_game.log 는 실행마다 임시 폴더에 만든다
+    workdir = tempfile.mkdtemp(prefix='ladder_bench_')
+    cwd = os.getcwd()
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    os.chdir(workdir)
+    try:
+        import test  # 로깅 설정이 여기서 적용되므로 임시 폴더로 옮긴 뒤 가져옴
+        logging.getLogger().setLevel(args.log_level)
+
+        runs = []
+        for rounds in args.rounds:
+            run_dir = os.path.join(workdir, str(rounds))
+            os.makedirs(run_dir)
+            os.chdir(run_dir)
+            run = run_stream(args.backend, rounds)
+            runs.append(run)
+            print(f"{rounds:>7}회차: {run['seconds']:.2f}s, {run['rounds_per_second']:,.0f}회차/s, "
+                  f"p50 {run['latency']['p50_ms']:.3f}ms / p95 {run['latency']['p95_ms']:.3f}ms / "
+                  f"p99 {run['latency']['p99_ms']:.3f}ms, 메모리 증가 "
+                  f"{(run['rss_growth_per_1k_rounds'] or 0) / 1024:,.0f}KB/1000회차")
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    results = {
+        'time': time.time(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'backend': args.backend,
+        'runs': runs
+    }
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {output}")
+    if baseline:
+        compare(results, baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
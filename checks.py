@@ -0,0 +1,455 @@
+import os
+import sys
+import shutil
+import itertools
+import argparse
+import tempfile
+from email.utils import formatdate
+
+from stub_server import make_result
+from engine import parse_result
+
+# 화면/네트워크 없이 돌리는 동작 확인
+#   python checks.py              전체 확인
+#   python checks.py restart      이름으로 골라서 확인
+# 각 확인은 실패하면 AssertionError 를 올리고, 앱이 쓰는 파일은 확인마다 임시 폴더에 만든다.
+
+FIRST_ROUND = 1000000
+BET_METHODS = ('method1', 'method2', 'method3', 'method4', 'method5')
+
+CHECKS = {}
+
+
+class CheckSkipped(Exception):
+    """필요한 선택 패키지가 없어 확인을 건너뜀"""
+
+
+def check(name):
+    """확인 함수 등록 (함수 데코레이터)"""
+    def register(func):
+        CHECKS[name] = func
+        return func
+    return register
+
+
+def open_app():
+    """현재 폴더의 betting_logs 를 쓰는 화면 없는 LadderGameGUI (네트워크 조회 없음)"""
+    from test import LadderGameGUI
+    from views import NullView
+    view = NullView()
+    return LadderGameGUI(view.root, start_fetcher=False, view=view)
+
+
+def stub_result(round_num):
+    return parse_result(make_result('power_ladder', round_num))
+
+
+def feed(app, first_round, count):
+    """합성 결과 count 개를 순서대로 넣고 화면 갱신까지 처리"""
+    for round_num in range(first_round, first_round + count):
+        app.update_data(stub_result(round_num))
+        app.root.update_idletasks()
+
+
+@check('restart')
+def check_restart_settlement():
+    """종료 전에 베팅한 회차를 재시작 후 정산하면 저장소에 남고, 다시 재시작해도 그대로인지"""
+    app = open_app()
+    app.betting_method.set('method5')
+    feed(app, FIRST_ROUND, 10)
+    pending_round = app.engine.next_round
+    app.on_closing()
+
+    app = open_app()
+    assert app.betting_method.get() == 'method5', "베팅 방법 선택이 복원되지 않음"
+    result = stub_result(int(pending_round))
+    feed(app, int(pending_round), 1)
+    settled = app.round_store.get_round(pending_round)
+    assert settled.result == result[1:], f"재시작 후 정산 결과가 저장되지 않음: {settled}"
+    assert app.result_tree.item(pending_round)['values'] == app.format_result_row(result)[0]
+    app.on_closing()
+
+    app = open_app()
+    reloaded = app.round_store.get_round(pending_round)
+    assert reloaded.result == result[1:] and reloaded.win_amount == settled.win_amount, \
+        f"다시 재시작한 뒤 정산 결과가 사라짐: {reloaded}"
+    app.on_closing()
+
+
+@check('settlement')
+def check_settlement():
+    """settle_round 가 원래 화면 정산과 같이 적중한 단식 x ODDS['single'] 만 지급하고 (조합은 베팅금만 차감),
+    실시간 엔진과 Backtester 가 같은 결과로 같은 순수익을 내는지"""
+    from engine import (ODDS, BETTING_PATTERNS, SINGLE_MARKETS, BettingEngine, default_betting_methods,
+                        build_round_bets, settle_round)
+    from backtest import Backtester
+
+    outcomes = [(direction, line, parity) for direction in ('좌', '우') for line in ('3', '4') for parity in ('홀', '짝')]
+    for method in BET_METHODS:
+        for pattern in BETTING_PATTERNS:
+            for outcome in outcomes:
+                round_info = build_round_bets('1', method, default_betting_methods()[method],
+                                              tuple(pattern[1:]), pattern[0])
+                actual = dict(zip(SINGLE_MARKETS, outcome))
+                actual['direction_line'] = (outcome[0], outcome[1])
+                actual['direction_parity'] = (outcome[0], outcome[2])
+                expected = sum(bet.stake * ODDS['single'] for bet in round_info.bets
+                               if bet.market in SINGLE_MARKETS and bet.pick == actual[bet.market])
+                win_amount, correct_picks, _ = settle_round(round_info, outcome)
+                assert abs(win_amount - expected) < 1e-6, f"{method} {pattern[0]} {outcome}: {win_amount} != {expected}"
+                assert correct_picks == sum(1 for bet in round_info.bets
+                                            if bet.market in SINGLE_MARKETS and bet.pick == actual[bet.market])
+
+    # 엔진은 첫 결과에서 다음 회차부터 베팅하므로 두 번째 결과부터 Backtester 와 비교
+    results = [stub_result(round_num) for round_num in range(FIRST_ROUND, FIRST_ROUND + 2000)]
+    for method in BET_METHODS:
+        engine = BettingEngine()
+        for result in results:
+            engine.process_result(result, method, 'rotation', ['좌', '3', '홀'])
+        report = Backtester(method).run(results[1:])
+        assert abs(engine.total_net_profit - report.total_profit) < 1e-6, \
+            f"{method}: 엔진 {engine.total_net_profit} != 백테스트 {report.total_profit}"
+
+
+@check('combination_payout')
+def check_combination_payout():
+    """조합만 적중한 한 회차의 자산: 기본(기존 화면 정산)은 베팅금만 차감, pay_combination 이면
+    조합 베팅금 x ODDS['combination'] 만큼 더 많음"""
+    from engine import ODDS, BettingEngine, default_betting_methods
+
+    # method1 로테이션 첫 패턴 좌+3+홀 로 베팅한 회차에 우/4/짝 이 나오면 단식 3개는 모두 빗나가고 우+4 조합만 적중
+    config = default_betting_methods()['method1']
+    total_bet = config['single_bet'] * 3 + config['hedge_bet']
+    expected = {False: 500000 - total_bet,
+                True: 500000 - total_bet + config['hedge_bet'] * ODDS['combination']}
+    assert expected == {False: 425000, True: 479000}
+    for pay_combination, asset in expected.items():
+        engine = BettingEngine(pay_combination=pay_combination)
+        engine.process_result(('1', '좌', '3', '홀'), 'method1', 'rotation', ['좌', '3', '홀'])
+        settlement, _ = engine.process_result(('2', '우', '4', '짝'), 'method1', 'rotation', ['좌', '3', '홀'])
+        engine.cancel_bets()
+        assert settlement.correct_picks == 0 and not settlement.won
+        assert abs(engine.current_asset - asset) < 1e-6, \
+            f"pay_combination={pay_combination}: 자산 {engine.current_asset} != {asset}"
+        combo_results = [amount for bet, amount in settlement.pick_results if bet.market == 'direction_line']
+        assert combo_results == ([config['hedge_bet'] * ODDS['combination']] if pay_combination else [])
+
+
+@check('simulator')
+def check_simulator():
+    """NumPy 시뮬레이터의 한 세션이 같은 결과를 재생한 Backtester 와 같은 순수익을 내는지"""
+    try:
+        import numpy as np
+    except ImportError:
+        raise CheckSkipped("numpy 없음")
+    from simulator import simulate
+    from backtest import Backtester
+
+    results = [stub_result(round_num) for round_num in range(FIRST_ROUND, FIRST_ROUND + 2000)]
+    session = [np.array([[result[1] == '좌' for result in results]]),
+               np.array([[result[2] == '3' for result in results]]),
+               np.array([[result[3] == '홀' for result in results]])]
+    initial_asset = 10 ** 9  # 파산으로 멈추지 않도록
+    for method in BET_METHODS:
+        for mode, picks in (('rotation', ('좌', '3', '홀')), ('custom', ('우', '4', '없음'))):
+            for pay_combination in (False, True):
+                report = simulate(method, session, mode, picks, initial_asset=initial_asset,
+                                  pay_combination=pay_combination)
+                expected = Backtester(method, mode, picks, initial_asset=initial_asset,
+                                      pay_combination=pay_combination).run(results).total_profit
+                assert abs(report.final_assets[0] - initial_asset - expected) < 1e-3, \
+                    f"{method} {mode} 조합지급={pay_combination}: " \
+                    f"시뮬레이터 {report.final_assets[0] - initial_asset} != 백테스트 {expected}"
+
+
+def legacy_round_bets(method, method_config, prediction, chance_pick):
+    """표 방식(BET_PLANS) 이전의 방법별 if/elif 베팅 구성 [(종목, 픽, 금액), ...] (비교 기준)"""
+    if method == 'method5':
+        current_bet = method_config['martin_steps'][method_config['current_step']]
+        stakes = (current_bet, current_bet, current_bet)
+    elif method == 'method2':
+        stakes = (method_config['single_bet_a'], method_config['single_bet_bc'], method_config['single_bet_bc'])
+    elif method == 'method3':
+        stakes = (method_config['single_bet'], method_config['single_bet'],
+                  method_config['chance_bet'] if chance_pick else 0)
+    else:
+        stakes = (method_config['single_bet'],) * 3
+    bets = [(market, pick, stake) for market, pick, stake in zip(('direction', 'line', 'parity'), prediction, stakes)
+            if pick and stake]
+    if method == 'method4':
+        bets.append(('direction_line', ('우', '4'), method_config['hedge_bet1']))
+        bets.append(('direction_parity', ('우', '짝'), method_config['hedge_bet2']))
+    elif method != 'method5':
+        bets.append(('direction_line', ('우', '4'), method_config['hedge_bet']))
+    return bets
+
+
+def legacy_describe(method, method_config, chance_pick):
+    """표 방식 이전의 '현재베팅' 문구 (비교 기준)"""
+    if method == 'method5':
+        current_bet = method_config['martin_steps'][method_config['current_step']]
+        return f"단식 베팅: {current_bet:,}원 × 3 (마틴 {method_config['current_step'] + 1}단계)"
+    if method == 'method1':
+        return f"단식 베팅: {method_config['single_bet']:,}원 × 3, 조합 베팅: {method_config['hedge_bet']:,}원"
+    if method == 'method2':
+        return (f"주력픽: {method_config['single_bet_a']:,}원, 일반픽: {method_config['single_bet_bc']:,}원 × 2, "
+                f"조합: {method_config['hedge_bet']:,}원")
+    if method == 'method3':
+        if chance_pick:
+            return (f"기본픽: {method_config['single_bet']:,}원 × 2, 찬스픽: {method_config['chance_bet']:,}원, "
+                    f"조합: {method_config['hedge_bet']:,}원")
+        return f"기본픽: {method_config['single_bet']:,}원 × 2, 조합: {method_config['hedge_bet']:,}원"
+    return (f"단식: {method_config['single_bet']:,}원 × 3, 조합1: {method_config['hedge_bet1']:,}원, "
+            f"조합2: {method_config['hedge_bet2']:,}원")
+
+
+@check('bet_plans')
+def check_bet_plans():
+    """BET_PLANS 로 만든 베팅/합계/문구가 이전 if/elif 구현과 모든 경우에 같은지"""
+    from engine import SINGLE_MARKETS, default_betting_methods, build_round_bets, describe_bets
+
+    cases = 0
+    for method in BET_METHODS:
+        for chance_pick in (True, False):
+            for step in range(10):
+                for prediction in itertools.product((None, '좌', '우'), (None, '3', '4'), (None, '홀', '짝')):
+                    method_config = dict(default_betting_methods()[method], current_step=step)
+                    round_info = build_round_bets('1', method, method_config, prediction, 'check', chance_pick)
+                    expected = legacy_round_bets(method, method_config, prediction, chance_pick)
+                    bets = [(bet.market, bet.pick, bet.stake) for bet in round_info.bets]
+                    assert bets == expected, f"{method} {prediction} 찬스픽={chance_pick}: {bets} != {expected}"
+                    assert round_info.total_bet == sum(stake for _, _, stake in expected)
+                    assert round_info.total_picks == sum(1 for market, _, _ in expected if market in SINGLE_MARKETS)
+                    assert describe_bets(method, method_config, chance_pick) == \
+                        legacy_describe(method, method_config, chance_pick)
+                    cases += 1
+    assert cases == 2700
+
+
+@check('poll_schedule')
+def check_poll_schedule():
+    """결과가 마감 12초 뒤에 올라오는 하루를 PollScheduler 로 조회하면 요청 수가 고정 5초 조회(17,280회)보다
+    훨씬 적고 (1,000회 미만), 새 회차는 발표 후 약 1초(연속 조회 간격) 안에 잡는지"""
+    from datetime import datetime, timedelta
+    from scheduler import PollScheduler
+
+    publish_delay = timedelta(seconds=12)
+    scheduler = PollScheduler('power_ladder')
+    start = datetime(2024, 1, 1)
+    now = start
+    seen = None
+    requests = 0
+    latencies = []
+    while now < start + timedelta(days=1):
+        now += timedelta(seconds=scheduler.next_delay(now))
+        requests += 1
+        # 발표된 가장 최근 회차 = 12초 전 시점 기준 직전 마감
+        latest_draw = scheduler.next_draw_after(now - publish_delay) - timedelta(seconds=scheduler.cycle_seconds)
+        changed = latest_draw != seen
+        if changed and seen is not None:
+            latencies.append((now - latest_draw - publish_delay).total_seconds())
+        seen = latest_draw
+        scheduler.on_poll(changed, now)
+
+    assert requests < 1000, f"하루 요청 수 {requests}"
+    settled = latencies[10:]  # 발표 지연 추정치가 자리잡은 뒤
+    assert max(settled) <= scheduler.burst_interval + 1e-6, f"최대 감지 지연 {max(settled):.1f}초"
+    print(f"  하루 {requests}회 요청, 감지 지연 평균 {sum(settled) / len(settled):.2f}초 / 최대 {max(settled):.2f}초")
+
+
+@check('clock_sync')
+def check_clock_sync():
+    """Date 헤더 없이 결과가 늘 마감 10초 뒤에 올라와도 offset/카운트다운은 그대로이고
+    발표 지연만 그 게임에 10초로 잡히는지. Date 헤더가 있으면 offset 은 서버 시계를 따라가는지"""
+    from datetime import datetime
+    from clock_sync import ClockSync
+    from timer import config, get_remaining_seconds
+
+    local = [1700000000.0]
+    clock_sync = ClockSync(clock=lambda: local[0])
+    cycle_seconds = config['power_ladder']['returnMinute'] * 60
+    draw = clock_sync.nearest_draw('power_ladder', local[0])
+    for _ in range(50):
+        draw += cycle_seconds
+        # 발표(마감 + 10초) 0.5초 전과 0.5초 뒤에 조회 (중간이 발표 시각)
+        clock_sync.observe_round('power_ladder', draw + 10.5, draw + 9.5)
+        local[0] = draw + 20
+        assert clock_sync.offset == 0.0, f"Date 헤더 없이 offset 이 {clock_sync.offset:.1f}초 움직임"
+        assert get_remaining_seconds('power_ladder', clock_sync.now_datetime()) == \
+            get_remaining_seconds('power_ladder', datetime.fromtimestamp(local[0]))
+    assert abs(clock_sync.get_publish_delay('power_ladder') - 10) < 1e-6, clock_sync.get_publish_delay('power_ladder')
+    assert clock_sync.get_publish_delay('powerball') == clock_sync.default_publish_delay
+
+    # 서버 시계가 40초 빠르면 Date 헤더로 offset 을 잡고, 발표 지연은 서버 기준 10초로 유지
+    server_skew = 40.0
+    sent = local[0]
+    date_header = formatdate(sent + server_skew, usegmt=True)
+    clock_sync.observe_response(date_header, sent, sent)
+    assert abs(clock_sync.offset - server_skew) <= 0.5, clock_sync.offset
+    for _ in range(50):
+        draw += cycle_seconds
+        clock_sync.observe_round('power_ladder', draw + 10.5 - server_skew, draw + 9.5 - server_skew)
+    assert abs(clock_sync.get_publish_delay('power_ladder') - (10 + clock_sync.offset - server_skew)) < 1e-3
+
+
+class FailingGameSession:
+    """failing_game 주소는 503 (Retry-After 5초), 나머지는 합성 결과로 응답하는 requests 세션 대역"""
+
+    def __init__(self, failing_game):
+        self.failing_game = failing_game
+        self.requests = []
+
+    def get(self, url, **kwargs):
+        import json
+        import requests
+        game = url.split('/')[-2]
+        self.requests.append(game)
+        response = requests.Response()
+        response.url = url
+        if game == self.failing_game:
+            response.status_code = 503
+            response.headers['Retry-After'] = '5'
+            response._content = b''
+        else:
+            response.status_code = 200
+            response._content = json.dumps(make_result(game, FIRST_ROUND)).encode()
+        return response
+
+
+@check('fetch_isolation')
+def check_fetch_isolation():
+    """한 게임이 503 으로 재시도 대기 중이어도 같은 워커의 다른 게임은 바로 조회되는지"""
+    import queue
+    import time
+    from fetcher import ResultFetcher
+
+    session = FailingGameSession('powerball')
+    result_queue = queue.Queue()
+    fetcher = ResultFetcher(session, result_queue, games=('powerball', 'power_ladder'))
+    started = time.monotonic()
+    fetcher.start()
+    try:
+        kind, game, _ = result_queue.get(timeout=3)
+        elapsed = time.monotonic() - started
+    finally:
+        fetcher.stop()
+        fetcher.join(timeout=1)
+    assert (kind, game) == ('result', 'power_ladder'), (kind, game)
+    assert elapsed < 1, f"다른 게임의 재시도 대기 때문에 {elapsed:.1f}초 늦게 조회됨"
+    assert session.requests[:2] == ['powerball', 'power_ladder'], session.requests
+    assert not fetcher.is_alive(), "워커가 재시도 대기 중에 멈추지 않음"
+
+
+@check('client_errors')
+def check_client_errors():
+    """404/403/410 은 재시도하지 않지만 실패로 세어 상태가 정상으로 남지 않고, 304 와 200 은 정상인지"""
+    import requests
+    from resilience import ResilientClient, HEALTH_OK, HEALTH_DEGRADED, HEALTH_DOWN
+
+    class StatusSession:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.requests = 0
+
+        def get(self, url, **kwargs):
+            self.requests += 1
+            response = requests.Response()
+            response.status_code = self.status_code
+            return response
+
+    for status_code in (404, 403, 410):
+        session = StatusSession(status_code)
+        client = ResilientClient(session)
+        assert client.get('http://stub/').status_code == status_code
+        assert session.requests == 1, f"{status_code} 를 재시도함"
+        assert client.health()[0] == HEALTH_DEGRADED, f"{status_code} 뒤 상태 {client.health()}"
+        for _ in range(client.breaker.failure_threshold - 1):
+            client.get('http://stub/')
+        assert client.health()[0] == HEALTH_DOWN, f"{status_code} 가 계속되어도 상태 {client.health()}"
+
+    for status_code in (200, 304):
+        client = ResilientClient(StatusSession(status_code))
+        client.get('http://stub/')
+        assert client.health()[0] == HEALTH_OK, f"{status_code} 뒤 상태 {client.health()}"
+
+
+@check('older_log')
+def check_older_log():
+    """'이전 내역 더 보기' 가 Tk 스레드에서 파일을 읽지 않고, 아직 버퍼에 있던 줄까지 포함해
+    화면 맨 위 바로 앞의 기록을 이어 붙이는지"""
+    import time
+    import threading
+    import test
+    from log_sink import read_log_tail, format_log_header
+
+    main_thread = threading.current_thread()
+    reads = []
+
+    def checked_read_log_tail(*args, **kwargs):
+        reads.append(threading.current_thread())
+        return read_log_tail(*args, **kwargs)
+
+    app = open_app()
+    test.read_log_tail = checked_read_log_tail
+    try:
+        for i in range(1000):
+            app.add_log(f"확인 로그 {i}")
+        app.root.update_idletasks()  # 화면에는 max_log_lines 근처만 남고 앞부분은 잘림
+        hour, offset = app.log_cursor
+        assert offset > 0, "앞부분이 잘리지 않음"
+        top_before = app.log_text.lines[0]
+
+        app.load_older_log()
+        deadline = time.monotonic() + 5
+        while app.log_loading and time.monotonic() < deadline:
+            time.sleep(0.01)
+            app.root.after(0, lambda: None)
+            app.root.update()
+        assert not app.log_loading, "이전 로그가 돌아오지 않음"
+        assert reads and main_thread not in reads, "Tk 스레드에서 로그 파일을 읽음"
+
+        new_hour, new_offset = app.log_cursor
+        assert new_hour == hour and new_offset < offset
+        with open(app.current_log_file, 'rb') as f:
+            expected = f.read()[new_offset:].decode('utf-8')
+        if new_offset == 0:  # 파일 처음까지 읽었으면 시간대 구분선이 붙음
+            expected = format_log_header(new_hour) + expected
+        assert '\n'.join(app.log_text.lines) == expected, "불러온 내용이 파일과 이어지지 않음"
+        assert app.log_text.lines.index(top_before) > 0
+    finally:
+        test.read_log_tail = read_log_tail
+        app.on_closing()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="화면 없는 동작 확인")
+    parser.add_argument('names', nargs='*', help=f"확인 이름 ({', '.join(CHECKS)}), 생략하면 전체")
+    args = parser.parse_args(argv)
+    names = args.names or list(CHECKS)
+
+    workdir = tempfile.mkdtemp(prefix='ladder_checks_')
+    cwd = os.getcwd()
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    failed = 0
+    try:
+        for name in names:
+            os.chdir(workdir)
+            run_dir = tempfile.mkdtemp(prefix=f'{name}_', dir=workdir)
+            os.chdir(run_dir)
+            try:
+                CHECKS[name]()
+            except CheckSkipped as e:
+                print(f"건너뜀 {name}: {e}")
+            except AssertionError as e:
+                failed += 1
+                print(f"실패 {name}: {e}")
+            else:
+                print(f"통과 {name}")
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
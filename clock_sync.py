@@ -0,0 +1,82 @@
+import time
+import threading
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from timer import config
+
+
+class ClockSync:
+    """게임 서버 시계와 로컬 시계의 차이(offset = 서버 시각 - 로컬 시각) 추정기
+
+    - offset 은 HTTP 응답의 Date 헤더로만 보정한다: 요청/응답 시각의 중간을 서버가 응답한 시각으로 본다.
+      Date 는 초 단위로 잘려 있으므로 0.5초를 더해 쓴다.
+    - 새 회차가 처음 보인 시각은 게임별 발표 지연(마감 후 결과가 올라오기까지 걸리는 시간) 추정에만 쓴다.
+      직전 조회와 간격이 짧을 때만 사용한다. 발표 지연은 서버마다 길고 (수 초 ~ 수십 초) 게임마다 다르므로
+      이것으로 offset 을 옮기면 지연만큼 카운트다운이 앞당겨진다.
+    추정치는 지수 이동 평균으로 부드럽게 바꾼다 (첫 관측은 그대로 사용).
+    여러 스레드에서 쓰므로 갱신은 잠금 안에서 한다.
+    """
+
+    def __init__(self, smoothing=0.2, publish_delay=1.0, max_gap=3.0, clock=time.time):
+        self.smoothing = smoothing                  # 추정치 보정 비율
+        self.default_publish_delay = publish_delay  # 관측 전 발표 지연 (서버 기준, 초)
+        self.max_gap = max_gap                      # 회차 첫 관측으로 쓸 수 있는 직전 조회와의 최대 간격 (초)
+        self.clock = clock
+        self.offset = 0.0
+        self.date_samples = 0
+        self.publish_delays = {}  # 게임: 발표 지연 (초)
+        self.round_samples = {}   # 게임: 발표 지연 관측 수
+        self._lock = threading.Lock()
+
+    def now(self):
+        """서버 기준 현재 시각 (unix time)"""
+        return self.clock() + self.offset
+
+    def now_datetime(self):
+        """서버 기준 현재 시각 (datetime)"""
+        return datetime.fromtimestamp(self.now())
+
+    def get_publish_delay(self, game_type):
+        """게임의 발표 지연 추정치 (초)"""
+        return self.publish_delays.get(game_type, self.default_publish_delay)
+
+    def _smooth(self, current, sample, samples):
+        return sample if samples == 0 else current + self.smoothing * (sample - current)
+
+    def observe_response(self, date_header, sent, received):
+        """HTTP Date 헤더로 보정 (sent / received 는 요청 전후 로컬 시각)"""
+        if not date_header:
+            return
+        try:
+            server_time = parsedate_to_datetime(date_header).timestamp() + 0.5
+        except (TypeError, ValueError):
+            return
+        sample = server_time - (sent + received) / 2
+        with self._lock:
+            self.offset = self._smooth(self.offset, sample, self.date_samples)
+            self.date_samples += 1
+
+    def nearest_draw(self, game_type, server_time):
+        """server_time 에 가장 가까운 마감 시각 (timer.config 의 주기/오프셋 기준)"""
+        game_config = config[game_type]
+        shift = game_config['diffSec'] + game_config['countDownDiff'] / 1000
+        cycle_seconds = game_config['returnMinute'] * 60
+        return round((server_time + shift) / cycle_seconds) * cycle_seconds - shift
+
+    def observe_round(self, game_type, seen_at, previous_poll_at):
+        """새 회차가 seen_at(로컬 시각) 에 처음 보였을 때 게임의 발표 지연을 보정 (offset 은 그대로)
+
+        직전 조회(previous_poll_at) 에서는 아직 이전 회차였으므로 실제 발표는 두 조회 사이에
+        있었다고 보고 중간 시각을 사용한다. Date 헤더를 받기 전에는 offset 이 0 이므로
+        로컬 시계 오차도 발표 지연에 포함된다.
+        """
+        if previous_poll_at is None or seen_at - previous_poll_at > self.max_gap:
+            return
+        appeared = (seen_at + previous_poll_at) / 2
+        with self._lock:
+            publish_delay = self.get_publish_delay(game_type)
+            server_time = appeared + self.offset
+            draw = self.nearest_draw(game_type, server_time - publish_delay)
+            samples = self.round_samples.get(game_type, 0)
+            self.publish_delays[game_type] = self._smooth(publish_delay, max(0.0, server_time - draw), samples)
+            self.round_samples[game_type] = samples + 1
@@ -0,0 +1,517 @@
+import logging
+from dataclasses import dataclass, field, asdict
+
+# tkinter 를 import 하지 않는 베팅/정산 엔진 (GUI, 백테스트, 일괄 처리 도구가 공통으로 사용)
+
+# 배당률 (단식: 좌우/홀짝/3줄4줄, 조합: 좌우+3줄4줄)
+ODDS = {
+    'single': 1.93,
+    'combination': 3.6
+}
+
+# 베팅 패턴 (3단계 로테이션)
+BETTING_PATTERNS = [
+    ('pattern1', '좌', '3', '홀'),  # 1단계: 좌+3+홀
+    ('pattern2', '좌', '3', '짝'),  # 2단계: 좌+3+짝
+    ('pattern3', '좌', '4', '홀'),  # 3단계: 좌+4+홀
+]
+
+PATTERN_NAMES = {
+    'pattern1': '좌+3+홀',
+    'pattern2': '좌+3+짝',
+    'pattern3': '좌+4+홀',
+    'custom': '선택모드'
+}
+
+
+# 베팅 종류 (단식 / 조합)
+SINGLE_MARKETS = ('direction', 'line', 'parity')
+COMBO_MARKETS = ('direction_line', 'direction_parity')
+MARKET_NAMES = {
+    'direction': '방향',
+    'line': '줄수',
+    'parity': '홀짝',
+    'direction_line': '조합',
+    'direction_parity': '조합2'
+}
+
+
+@dataclass(slots=True)
+class Bet:
+    market: str   # SINGLE_MARKETS 또는 COMBO_MARKETS
+    pick: object  # 단식은 '좌' 같은 값, 조합은 ('우', '4') 같은 튜플
+    stake: int
+
+    @property
+    def label(self):
+        return '+'.join(self.pick) if self.market in COMBO_MARKETS else self.pick
+
+
+@dataclass(slots=True)
+class BetSlot:
+    """베팅 방법 구성의 한 칸"""
+    market: str
+    pick: object = None         # None 이면 해당 종목의 예측값, 아니면 고정 픽 (조합은 튜플)
+    stake: str = 'single_bet'   # method_config 의 금액 키 (MARTIN 이면 현재 마틴 단계 금액)
+    chance: bool = False        # 찬스픽 (chance_pick 이 False 이면 베팅하지 않음)
+
+
+@dataclass(slots=True)
+class RoundInfo:
+    round_num: str
+    bets: list = field(default_factory=list)  # [Bet, ...]
+    result: tuple = None  # (direction, line, parity)
+    profit: float = 0
+    win_amount: float = 0
+    total_bet: int = 0
+    correct_picks: int = 0
+    total_picks: int = 0
+    pattern_type: str = None
+    method: str = None
+
+    @property
+    def singles(self):
+        return [bet for bet in self.bets if bet.market in SINGLE_MARKETS]
+
+    def to_dict(self):
+        """디스크 저장용 딕셔너리로 변환"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict 결과로부터 복원 (JSON 에서 리스트가 된 튜플을 되돌림)"""
+        data = dict(data)
+        data['bets'] = [Bet(bet['market'], tuple(bet['pick']) if isinstance(bet['pick'], list) else bet['pick'],
+                            bet['stake']) for bet in data['bets']]
+        if data.get('result') is not None:
+            data['result'] = tuple(data['result'])
+        return cls(**data)
+
+
+@dataclass(slots=True)
+class Settlement:
+    """회차 정산 결과"""
+    round_info: RoundInfo
+    win_amount: float
+    correct_picks: int
+    pick_results: list  # [(Bet, 당첨금), ...]
+    won: bool
+
+    @property
+    def net_profit(self):
+        return self.win_amount - self.round_info.total_bet
+
+
+def default_betting_methods():
+    """베팅 방법별 금액 설정 (current_step 이 바뀌므로 호출할 때마다 새로 생성)"""
+    return {
+        'method1': {  # 전체 단식 금액 축소
+            'single_bet': 20000,  # 단식 각 2만원
+            'hedge_bet': 15000,   # 조합 1.5만원
+            'picks_count': 3      # 3픽 고정
+        },
+        'method2': {  # 픽별 가중치
+            'single_bet_a': 30000,  # 주력픽 3만원
+            'single_bet_bc': 20000, # 나머지 픽 2만원
+            'hedge_bet': 15000,     # 조합 1.5만원
+            'picks_count': 3        # 3픽 고정
+        },
+        'method3': {  # 2픽 + 찬스픽
+            'single_bet': 25000,    # 기본 2픽 각 2.5만원
+            'chance_bet': 25000,    # 찬스픽 2.5만원
+            'hedge_bet': 15000,     # 조합 1.5만원
+            'picks_count': 2        # 기본 2픽 (찬스픽 추가 가능)
+        },
+        'method4': {  # 다중 조합
+            'single_bet': 25000,    # 단식 각 2.5만원
+            'hedge_bet1': 10000,    # 주 조합 1만원
+            'hedge_bet2': 5000,     # 부 조합 5천원
+            'picks_count': 3        # 3픽 고정
+        },
+        'method5': {  # 시스템 마틴
+            'base_bet': 5000,       # 기본 배팅 금액
+            'martin_steps': [5000, 10000, 15000, 20000, 25000, 30000, 35000, 40000, 45000, 50000],  # 10단계 마틴
+            'current_step': 0,      # 현재 마틴 단계
+            'picks_count': 3,       # 3픽 고정
+            'use_hedge': False      # 조합 베팅 사용 안함
+        }
+    }
+
+
+# 금액 키 대신 쓰는 현재 마틴 단계 금액
+MARTIN = 'martin'
+
+# 베팅 방법별 베팅 구성과 '현재베팅' 표시 문구 (문구의 {키} 는 method_config 값, {martin} 은 현재
+# 마틴 금액, {martin_step} 은 1부터 센 마틴 단계). 새 방법은 여기와 default_betting_methods 에 추가한다.
+BET_PLANS = {
+    'method1': {  # 전체 단식 축소
+        'slots': (BetSlot('direction'), BetSlot('line'), BetSlot('parity'),
+                  BetSlot('direction_line', ('우', '4'), 'hedge_bet')),
+        'description': "단식 베팅: {single_bet:,}원 × 3, 조합 베팅: {hedge_bet:,}원"
+    },
+    'method2': {  # 픽별 가중치: 첫 번째 픽은 높은 금액, 나머지 픽은 낮은 금액
+        'slots': (BetSlot('direction', stake='single_bet_a'), BetSlot('line', stake='single_bet_bc'),
+                  BetSlot('parity', stake='single_bet_bc'), BetSlot('direction_line', ('우', '4'), 'hedge_bet')),
+        'description': "주력픽: {single_bet_a:,}원, 일반픽: {single_bet_bc:,}원 × 2, 조합: {hedge_bet:,}원"
+    },
+    'method3': {  # 2픽 + 찬스픽 (찬스픽은 있는 경우만)
+        'slots': (BetSlot('direction'), BetSlot('line'), BetSlot('parity', stake='chance_bet', chance=True),
+                  BetSlot('direction_line', ('우', '4'), 'hedge_bet')),
+        'description': "기본픽: {single_bet:,}원 × 2, 찬스픽: {chance_bet:,}원, 조합: {hedge_bet:,}원",
+        'description_no_chance': "기본픽: {single_bet:,}원 × 2, 조합: {hedge_bet:,}원"
+    },
+    'method4': {  # 다중 조합
+        'slots': (BetSlot('direction'), BetSlot('line'), BetSlot('parity'),
+                  BetSlot('direction_line', ('우', '4'), 'hedge_bet1'),
+                  BetSlot('direction_parity', ('우', '짝'), 'hedge_bet2')),
+        'description': "단식: {single_bet:,}원 × 3, 조합1: {hedge_bet1:,}원, 조합2: {hedge_bet2:,}원"
+    },
+    'method5': {  # 시스템 마틴 (조합 베팅 없음)
+        'slots': (BetSlot('direction', stake=MARTIN), BetSlot('line', stake=MARTIN),
+                  BetSlot('parity', stake=MARTIN)),
+        'description': "단식 베팅: {martin:,}원 × 3 (마틴 {martin_step}단계)"
+    }
+}
+
+# (방법, 찬스픽 여부) 별로 컴파일한 슬롯 [(종목, 예측 위치 또는 None, 고정 픽, 금액 키), ...]
+_compiled_plans = {}
+# 방법별 마틴 여부 (컴파일할 때 함께 계산)
+_martingale_methods = {}
+
+
+def compile_bet_plan(method, chance_pick=True):
+    """BET_PLANS 의 구성을 한 번만 풀어서 회차마다 그대로 도는 슬롯 목록으로 변환"""
+    key = (method, chance_pick)
+    compiled = _compiled_plans.get(key)
+    if compiled is None:
+        slots = BET_PLANS[method]['slots']
+        compiled = _compiled_plans[key] = tuple(
+            (slot.market, SINGLE_MARKETS.index(slot.market) if slot.pick is None else None, slot.pick, slot.stake)
+            for slot in slots if chance_pick or not slot.chance)
+        _martingale_methods[method] = any(slot.stake == MARTIN for slot in slots)
+    return compiled
+
+
+def is_martingale(method):
+    """마틴 단계 금액으로 베팅하는 방법인지"""
+    martingale = _martingale_methods.get(method)
+    if martingale is None:
+        compile_bet_plan(method)
+        martingale = _martingale_methods[method]
+    return martingale
+
+
+def martin_stake(method_config):
+    """현재 마틴 단계 금액"""
+    return method_config['martin_steps'][method_config['current_step']]
+
+
+def parse_result(data):
+    """result.json 응답을 (회차, 방향, 줄수, 홀짝) 튜플로 변환"""
+    round_num = str(data['r'])
+    direction = '좌' if data['s'] == 'LEFT' else '우'
+    line = str(data['l'])
+    parity = '홀' if data['o'] == 'ODD' else '짝'
+    return (round_num, direction, line, parity)
+
+
+def result_flags(result):
+    """결과를 1바이트 플래그로 변환 (bit0: 좌, bit1: 3줄, bit2: 홀)"""
+    return (result[1] == '좌') | ((result[2] == '3') << 1) | ((result[3] == '홀') << 2)
+
+
+def flags_result(round_num, flags):
+    """result_flags 의 역변환"""
+    return (str(round_num),
+            '좌' if flags & 1 else '우',
+            '3' if flags & 2 else '4',
+            '홀' if flags & 4 else '짝')
+
+
+def custom_picks(picks):
+    """선택 모드의 픽 목록을 (방향, 줄수, 홀짝) 예측으로 변환"""
+    predicted_direction = None
+    predicted_line = None
+    predicted_parity = None
+
+    # 각 픽의 유형 확인 및 할당
+    for pick in picks:
+        if pick == '없음':
+            continue
+        if pick in ['좌', '우'] and predicted_direction is None:
+            predicted_direction = pick
+        elif pick in ['3', '4'] and predicted_line is None:
+            predicted_line = pick
+        elif pick in ['홀', '짝'] and predicted_parity is None:
+            predicted_parity = pick
+    return predicted_direction, predicted_line, predicted_parity
+
+
+def build_round_bets(round_num, method, method_config, prediction, pattern_type, chance_pick=True):
+    """예측과 베팅 방법으로 회차 베팅 정보(RoundInfo)를 생성
+
+    chance_pick 은 방법3에서 찬스픽(홀짝) 베팅 여부이다.
+    베팅은 compile_bet_plan 의 슬롯 순서대로 만들고, 예측이 없는 종목은 건너뛴다.
+    """
+    round_info = RoundInfo(round_num, pattern_type=pattern_type, method=method)
+    bets = round_info.bets
+    total_bet = 0
+    total_picks = 0
+    for market, index, pick, stake_key in compile_bet_plan(method, chance_pick):
+        if index is not None:
+            pick = prediction[index]
+        stake = martin_stake(method_config) if stake_key == MARTIN else method_config[stake_key]
+        if pick and stake:
+            bets.append(Bet(market, pick, stake))
+            total_bet += stake
+            total_picks += market in SINGLE_MARKETS
+
+    round_info.total_bet = total_bet
+    round_info.total_picks = total_picks
+    return round_info
+
+
+def settle_round(round_info, result, odds=ODDS, pay_combination=False):
+    """회차 결과 (방향, 줄수, 홀짝) 로 베팅을 정산하고 RoundInfo 에 기록
+
+    (당첨금, 단식 적중 수, 픽별 결과 목록) 을 반환한다.
+    픽별 결과는 단식 베팅의 (Bet, 당첨금) 튜플이다. 조합 베팅은 기존 화면 정산과 같이
+    베팅금만 차감하고 당첨금은 계산하지 않는다.
+    pay_combination 이면 적중한 조합 베팅에 odds['combination'] 을 지급하고 픽별 결과에도 넣는다.
+    """
+    actual_direction, actual_line, actual_parity = result
+    round_info.result = (actual_direction, actual_line, actual_parity)
+    actual = {
+        'direction': actual_direction,
+        'line': actual_line,
+        'parity': actual_parity,
+        'direction_line': (actual_direction, actual_line),
+        'direction_parity': (actual_direction, actual_parity)
+    }
+
+    # 픽별로 독립적으로 계산
+    win_amount = 0
+    correct_picks = 0
+    pick_results = []
+    for bet in round_info.bets:
+        if bet.market in COMBO_MARKETS:
+            if not pay_combination:
+                continue
+            pick_win_amount = bet.stake * odds['combination'] if bet.pick == actual[bet.market] else 0
+            win_amount += pick_win_amount
+        elif bet.pick == actual[bet.market]:
+            correct_picks += 1
+            pick_win_amount = bet.stake * odds['single']
+            win_amount += pick_win_amount
+        else:
+            pick_win_amount = 0
+        pick_results.append((bet, pick_win_amount))
+
+    # 결과 정보 업데이트
+    round_info.correct_picks = correct_picks
+    round_info.win_amount = win_amount
+    round_info.profit = win_amount - round_info.total_bet
+
+    return win_amount, correct_picks, pick_results
+
+
+def is_winning_round(correct_picks):
+    """단식 2개 이상 적중하면 승리"""
+    return correct_picks >= 2
+
+
+def step_martingale(method_config, won):
+    """시스템 마틴 단계 조정 (승리시 한 단계 감소, 패배시 한 단계 증가)"""
+    last_step = len(method_config['martin_steps']) - 1
+    if won:
+        method_config['current_step'] = max(0, method_config['current_step'] - 1)
+    else:
+        method_config['current_step'] = min(last_step, method_config['current_step'] + 1)
+
+
+def describe_bets(method, method_config, chance_pick=True):
+    """'현재베팅' 표시용 베팅 금액 설명 (BET_PLANS 의 문구)"""
+    plan = BET_PLANS[method]
+    template = plan['description'] if chance_pick else plan.get('description_no_chance', plan['description'])
+    values = dict(method_config)
+    if is_martingale(method):
+        values.update(martin=martin_stake(method_config), martin_step=method_config['current_step'] + 1)
+    return template.format(**values)
+
+
+class BettingEngine:
+    """회차 진행, 베팅, 정산, 자산 계산을 담당하는 GUI 없는 엔진
+
+    화면 쪽은 베팅 방법/모드/픽 값을 인자로 넘기고, 돌려받은 결과로 표시만 갱신한다.
+    rounds 는 get_round / put_round / remove_round / has_round 를 가진 저장소이며
+    없으면 메모리 전용 RoundStore 를 사용한다.
+    journal(SessionJournal) 을 주면 베팅/정산/취소 때마다 바뀐 회차와 상태를 기록한다.
+    pay_combination 은 settle_round 참고 (기본은 기존 화면과 같이 조합 당첨금 없음).
+    """
+
+    def __init__(self, initial_asset=500000, betting_methods=None, betting_patterns=None,
+                 odds=None, rounds=None, journal=None, pay_combination=False):
+        if rounds is None:
+            from round_store import RoundStore
+            rounds = RoundStore(':memory:')
+        self.rounds = rounds
+        self.journal = journal
+        self.betting_methods = betting_methods if betting_methods is not None else default_betting_methods()
+        self.betting_patterns = list(betting_patterns) if betting_patterns is not None else list(BETTING_PATTERNS)
+        self.odds = dict(odds) if odds is not None else dict(ODDS)
+        self.pay_combination = pay_combination
+
+        # 자산 및 승패 정보
+        self.initial_asset = initial_asset
+        self.current_asset = initial_asset
+        self.total_profit = 0
+        self.total_net_profit = 0
+        self.win_count = 0
+        self.lose_count = 0
+
+        # 회차 및 예측 정보
+        self.current_pattern_index = 0
+        self.current_round = None
+        self.next_round = None
+        self.betting_start_round = None
+        self.next_prediction = None  # (방향, 줄수, 홀짝)
+        self.selection = None  # 마지막 베팅에 쓴 화면 선택 {'method', 'mode', 'picks', 'strategy'}
+
+    def export_state(self):
+        """저널/스냅샷에 저장할 상태 (회차별 베팅 정보는 rounds 저장소에 따로 있음)"""
+        return {
+            'current_asset': self.current_asset,
+            'total_profit': self.total_profit,
+            'total_net_profit': self.total_net_profit,
+            'win_count': self.win_count,
+            'lose_count': self.lose_count,
+            'current_pattern_index': self.current_pattern_index,
+            'current_round': self.current_round,
+            'next_round': self.next_round,
+            'betting_start_round': self.betting_start_round,
+            'next_prediction': list(self.next_prediction) if self.next_prediction else None,
+            'current_steps': {method: config['current_step'] for method, config in self.betting_methods.items()
+                              if 'current_step' in config},
+            'selection': self.selection
+        }
+
+    def restore_state(self, state):
+        """export_state 로 저장한 상태를 그대로 되돌림"""
+        for key in ('current_asset', 'total_profit', 'total_net_profit', 'win_count', 'lose_count',
+                    'current_pattern_index', 'current_round', 'next_round', 'betting_start_round'):
+            setattr(self, key, state[key])
+        self.next_prediction = tuple(state['next_prediction']) if state['next_prediction'] else None
+        self.selection = state.get('selection')  # 이전 버전 스냅샷에는 없음
+        for method, step in state['current_steps'].items():
+            if method in self.betting_methods:
+                self.betting_methods[method]['current_step'] = step
+
+    def record_state(self):
+        """저널에 현재 상태 기록 (쌓이면 스냅샷)"""
+        if self.journal is None:
+            return
+        self.journal.record_state(self.export_state())
+        if self.journal.needs_snapshot():
+            self.journal.snapshot(self.export_state(), self.rounds)
+
+    @property
+    def win_rate(self):
+        total_games = self.win_count + self.lose_count
+        return (self.win_count / total_games * 100) if total_games > 0 else 0
+
+    def process_result(self, new_result, method, mode, picks, strategy=None, features=None):
+        """새 결과 반영: 이전 회차를 정산하고 다음 회차 베팅을 생성
+
+        같은 회차가 다시 들어오면 None, 아니면 (정산 결과 또는 None, 다음 회차 RoundInfo) 를 반환한다.
+        strategy / features 는 전략 모드에서만 사용한다 (place_bets 참고).
+        """
+        round_num = new_result[0]
+        settlement = None
+
+        if self.current_round is None:  # 첫 실행시 처리
+            logging.info("첫 실행 감지, 다음 회차 베팅 준비")
+            self.betting_start_round = str(int(round_num) + 1)
+        elif self.current_round != round_num:  # 새로운 회차
+            logging.info(f"새로운 회차 발견: {round_num} (이전: {self.current_round})")
+            if self.rounds.has_round(round_num):
+                settlement = self.settle(new_result)
+        else:
+            return None
+
+        # 회차 정보 업데이트 후 다음 회차 베팅
+        self.current_round = round_num
+        self.next_round = str(int(round_num) + 1)
+        round_info = self.place_bets(method, mode, picks, strategy, features)
+        return settlement, round_info
+
+    def place_bets(self, method, mode, picks, strategy=None, features=None):
+        """다음 회차 예측 및 베팅 생성 (자산에서 베팅금 차감)
+
+        전략 모드("strategy")에서는 strategy.predict(features) 로 예측하며, features 는
+        최신 결과까지 반영된 ResultStats 이다.
+        """
+        if mode == "rotation":  # 로테이션 모드
+            pattern = self.betting_patterns[self.current_pattern_index]
+            self.current_pattern_index = (self.current_pattern_index + 1) % len(self.betting_patterns)
+            pattern_type, prediction = pattern[0], tuple(pattern[1:])
+        elif mode == "strategy" and strategy is not None:  # 전략 모드
+            pattern_type, prediction = strategy.name, tuple(strategy.predict(features))
+        else:  # 선택 모드
+            pattern_type, prediction = "custom", custom_picks(picks)
+        self.next_prediction = prediction
+        self.selection = {'method': method, 'mode': mode, 'picks': list(picks),
+                          'strategy': strategy.name if strategy is not None else None}
+
+        round_info = build_round_bets(self.next_round, method, self.betting_methods[method],
+                                      prediction, pattern_type, picks[2] != '없음')
+        self.rounds.put_round(round_info)
+        self.update_asset(round_info.total_bet)
+        if self.journal is not None:
+            self.journal.put_round(round_info)
+        self.record_state()
+        return round_info
+
+    def cancel_bets(self):
+        """다음 회차 베팅 취소 (취소된 RoundInfo 반환, 없으면 None)"""
+        round_info = self.rounds.get_round(self.next_round) if self.next_round else None
+        if round_info is not None:
+            self.rounds.remove_round(self.next_round)
+            self.update_asset(0)
+            if self.journal is not None:
+                self.journal.remove_round(round_info.round_num)
+            self.record_state()
+        return round_info
+
+    def settle(self, new_result):
+        """회차 결과로 해당 회차 베팅을 정산하고 승패/마틴 단계를 반영"""
+        round_num, direction, line, parity = new_result
+        round_info = self.rounds.get_round(round_num)
+        if round_info is None:
+            logging.error(f"{round_num}회차 정보를 찾을 수 없습니다.")
+            return None
+
+        win_amount, correct_picks, pick_results = settle_round(round_info, (direction, line, parity), self.odds,
+                                                                  self.pay_combination)
+        # 디스크에서 읽은 회차는 복사본이므로 정산 결과를 저장소에 다시 넣음
+        self.rounds.put_round(round_info)
+        self.total_net_profit += win_amount - round_info.total_bet
+
+        # 승패 기록 및 마틴 단계 조정 (2개 이상 맞추면 승리)
+        won = is_winning_round(correct_picks)
+        if won:
+            self.win_count += 1
+        else:
+            self.lose_count += 1
+        if is_martingale(round_info.method):
+            step_martingale(self.betting_methods[round_info.method], won)
+
+        self.update_asset(0)
+        if self.journal is not None:
+            self.journal.put_round(round_info)  # 정산 결과는 이어지는 place_bets 의 상태와 함께 기록
+        return Settlement(round_info, win_amount, correct_picks, pick_results, won)
+
+    def update_asset(self, pending_bet):
+        """현재 자산 = 초기자산 + 누적 순수익 - 현재 베팅금"""
+        self.current_asset = self.initial_asset + self.total_net_profit - pending_bet
+        # 총수익 = 현재자산 - 초기자산
+        self.total_profit = self.current_asset - self.initial_asset
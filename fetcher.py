@@ -0,0 +1,190 @@
+import time
+import hashlib
+import threading
+import logging
+import requests
+from scheduler import PollScheduler
+from clock_sync import ClockSync
+from resilience import ResilientClient, CircuitOpenError, RetryLater, HEALTH_OK
+from metrics import METRICS
+from engine import parse_result
+from timer import config
+
+BASE_URL = "https://ntry.com"
+GAMES = tuple(config)          # timer.config 에 있는 모든 게임
+MAIN_GAME = 'power_ladder'     # 베팅 엔진이 사용하는 게임
+GAME_NAMES = {
+    'powerball': '파워볼',
+    'power_ladder': '파워사다리',
+    'speedkeno': '스피드키노',
+    'keno_ladder': '키노사다리'
+}
+
+
+def result_url(game, base_url=BASE_URL):
+    return f"{base_url}/data/json/games/{game}/result.json"
+
+
+def parse_game_result(data):
+    """사다리가 아닌 게임의 응답을 (회차, 원본 응답) 으로 변환"""
+    return (str(data['r']), data)
+
+
+# 게임별 응답 파서 (사다리 게임은 방향/줄수/홀짝 형식이 같음)
+GAME_PARSERS = {
+    'power_ladder': parse_result,
+    'keno_ladder': parse_result
+}
+
+
+class GameFeed:
+    """한 게임의 조회 상태 (주소, 파서, 마감 스케줄러, 마지막 회차, 다음 조회 시각)"""
+
+    def __init__(self, game, base_url=BASE_URL, clock_sync=None):
+        self.game = game
+        self.url = result_url(game, base_url)
+        self.parser = GAME_PARSERS.get(game, parse_game_result)
+        if clock_sync is not None:
+            self.scheduler = PollScheduler(game_type=game, clock=clock_sync.now_datetime)
+        else:
+            self.scheduler = PollScheduler(game_type=game)
+        self.last_round = None
+        self.last_poll_at = None  # 마지막 조회 시각 (로컬 time.time())
+        self.etag = None          # 조건부 요청용 (서버가 보내준 경우에만)
+        self.last_modified = None
+        self.body_hash = None     # 마지막으로 처리한 응답 본문 해시
+        self.due = 0.0            # time.monotonic() 기준 다음 조회 시각
+        self.retry_attempt = 0    # 지금 조회의 재시도 횟수 (성공하거나 포기하면 0)
+
+
+class ResultFetcher(threading.Thread):
+    """백그라운드 스레드 하나에서 여러 게임의 결과를 가져와 큐로 전달하는 워커
+
+    큐에는 ('result', 게임, 결과튜플), ('error', 게임, 메시지), ('health', None, (상태, 설명)) 형태로 넣는다.
+    Tk 위젯은 건드리지 않으므로 GUI 쪽에서 root.after 로 큐를 비워야 한다.
+    게임마다 PollScheduler 가 회차 마감 시각에 맞춰 조회 시점을 정하고,
+    연결은 하나의 requests 세션(연결 풀)을 함께 사용한다.
+    응답의 Date 헤더와 새 회차가 처음 보인 시각은 ClockSync 로 넘겨 서버 시계 차이를 추정한다.
+    요청은 ResilientClient 를 거치므로 재시도/백오프/회로 차단이 적용되고, 회로가 열려 있는 동안은
+    모든 게임의 조회를 미룬다. 재시도 대기는 스레드를 재우지 않고 그 게임의 다음 조회 시각만 미루므로
+    한 게임이 실패해도 다른 게임은 제 시각에 조회된다. 상태가 바뀔 때마다 'health' 메시지를 보낸다.
+    """
+
+    def __init__(self, session, result_queue, games=(MAIN_GAME,), base_url=BASE_URL, timeout=5,
+                 clock_sync=None, client=None):
+        super().__init__(name="ResultFetcher", daemon=True)
+        self.session = session
+        self.result_queue = result_queue
+        self._stop_event = threading.Event()
+        self.client = client if client is not None else ResilientClient(session)
+        self.clock_sync = clock_sync if clock_sync is not None else ClockSync()
+        self.feeds = [GameFeed(game, base_url, self.clock_sync) for game in games]
+        self.timeout = timeout
+        self.health = (HEALTH_OK, '')
+
+    def run(self):
+        while not self._stop_event.is_set():
+            # 가장 먼저 조회할 게임의 시각까지 대기 (회로가 열려 있으면 풀릴 때까지)
+            wait = max(min(feed.due for feed in self.feeds) - time.monotonic(),
+                       self.client.breaker.retry_after())
+            if self._stop_event.wait(max(0.0, wait)):
+                break
+
+            now = time.monotonic()
+            for feed in self.feeds:
+                if feed.due > now:
+                    continue
+                previous_poll_at = feed.last_poll_at
+                try:
+                    new_result = self.fetch_once(feed)
+                except RetryLater as e:
+                    # 이 게임만 재시도 시각으로 미룸 (스케줄러에는 조회 한 번으로 세지 않음)
+                    feed.retry_attempt += 1
+                    feed.due = time.monotonic() + e.delay
+                    continue
+                feed.retry_attempt = 0
+                changed = new_result is not None and new_result[0] != feed.last_round
+                if changed:
+                    # 시작 후 첫 결과는 언제 올라왔는지 모르므로 시계 보정에 쓰지 않음
+                    if feed.last_round is not None:
+                        self.clock_sync.observe_round(feed.game, feed.last_poll_at, previous_poll_at)
+                    feed.last_round = new_result[0]
+                feed.scheduler.on_poll(changed)
+                feed.due = time.monotonic() + max(0.0, feed.scheduler.next_delay())
+            self.report_health()
+
+    def fetch_once(self, feed):
+        """한 게임의 결과를 한 번 가져와 큐에 넣고, 파싱된 결과를 반환 (실패하거나 바뀐 게 없으면 None)
+
+        서버가 ETag / Last-Modified 를 주면 조건부 요청을 보내고, 304 응답이나 이전과 같은 본문이면
+        JSON 파싱과 로그 기록 없이 바로 돌아간다.
+        """
+        game = feed.game
+        try:
+            logging.debug(f"[{game}] 데이터 업데이트 시작")
+            headers = {}
+            if feed.etag:
+                headers['If-None-Match'] = feed.etag
+            if feed.last_modified:
+                headers['If-Modified-Since'] = feed.last_modified
+            
+            sent = time.time()
+            with METRICS.span('fetch'):
+                response = self.client.get(feed.url, feed.retry_attempt, headers=headers, timeout=self.timeout)
+            feed.last_poll_at = time.time()
+            self.clock_sync.observe_response(response.headers.get('Date'), sent, feed.last_poll_at)
+            if response.status_code == 304:
+                return None
+            response.raise_for_status()
+
+            body_hash = hashlib.blake2b(response.content, digest_size=16).digest()
+            if body_hash == feed.body_hash:
+                return None
+            
+            parse_started = time.perf_counter()
+            data = response.json()
+            logging.info(f"[{game}] API 응답: {data}")
+
+            if not data:
+                logging.warning(f"[{game}] 결과 데이터가 없습니다")
+                return None
+
+            new_result = feed.parser(data)
+            METRICS.observe('parse', time.perf_counter() - parse_started)
+            logging.info(f"[{game}] 파싱된 결과: {new_result[0]}회차")
+            
+            # 정상 처리한 응답만 기준으로 기억 (파싱에 실패하면 다음에 다시 받음)
+            feed.body_hash = body_hash
+            feed.etag = response.headers.get('ETag')
+            feed.last_modified = response.headers.get('Last-Modified')
+            self.result_queue.put(('result', game, new_result))
+            return new_result
+        except RetryLater:
+            raise  # run 에서 이 게임의 다음 조회 시각을 미룸
+        except CircuitOpenError:
+            pass  # 상태는 report_health 로 알림
+        except KeyError as e:
+            self.report_error(game, f"필수 데이터 필드 누락: {e}")
+        except requests.RequestException as e:
+            self.report_error(game, f"네트워크 오류: {e}")
+        except ValueError as e:
+            self.report_error(game, f"JSON 파싱 오류: {e}")
+        except Exception as e:
+            self.report_error(game, f"데이터 업데이트 중 오류 발생: {e}")
+        return None
+
+    def report_error(self, game, message):
+        logging.error(f"[{game}] {message}")
+        self.result_queue.put(('error', game, message))
+
+    def report_health(self):
+        """조회 계층 상태가 바뀌었으면 큐로 알림"""
+        health = self.client.health()
+        if health[0] != self.health[0]:
+            logging.info(f"서버 상태 변경: {self.health[0]} -> {health[0]} {health[1]}")
+            self.health = health
+            self.result_queue.put(('health', None, health))
+
+    def stop(self):
+        """워커 종료 요청 (대기 중이면 즉시 깨어남)"""
+        self._stop_event.set()
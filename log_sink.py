@@ -0,0 +1,164 @@
+import os
+import re
+import threading
+import logging
+from datetime import datetime
+from metrics import METRICS
+
+# 텍스트 위젯에만 표시되는 시간대 구분선 (파일에는 기록하지 않음)
+LOG_HEADER_PATTERN = re.compile(r'^=== (\d{4}-\d{2}-\d{2} \d{2})시 기록 ===$', re.M)
+LOG_FILE_PATTERN = re.compile(r'^betting_log_(\d{8}_\d{2})\.txt$')
+
+
+def log_file_path(directory, hour):
+    """해당 시간대의 로그 파일 경로"""
+    return os.path.join(directory, f"betting_log_{hour.strftime('%Y%m%d_%H')}.txt")
+
+
+def format_log_header(hour):
+    return f"=== {hour.strftime('%Y-%m-%d %H')}시 기록 ===\n"
+
+
+def parse_log_header(match):
+    return datetime.strptime(match.group(1), '%Y-%m-%d %H')
+
+
+def read_log_tail(path, end=None, max_bytes=32 * 1024):
+    """파일의 end 위치 앞쪽 최대 max_bytes 만큼을 줄 단위로 읽음
+
+    파일 전체를 읽지 않고 끝에서부터 seek 해서 읽는다. 잘린 첫 줄은 버리며,
+    (텍스트, 실제 시작 바이트 위치) 를 반환한다.
+    """
+    with open(path, 'rb') as f:
+        if end is None:
+            end = f.seek(0, os.SEEK_END)
+        start = max(0, end - max_bytes)
+        f.seek(start)
+        data = f.read(end - start)
+    
+    # 중간에서 시작했으면 첫 줄바꿈 이후부터 사용 (한 줄이 max_bytes 보다 길면 그대로 사용)
+    if start > 0:
+        newline = data.find(b'\n')
+        if 0 <= newline < len(data) - 1:
+            data = data[newline + 1:]
+            start += newline + 1
+    return data.decode('utf-8', errors='ignore').replace('\r\n', '\n'), start
+
+
+def previous_log_hour(directory, hour):
+    """hour 보다 이전 시간대 중 로그 파일이 있는 가장 최근 시간대 (없으면 None)"""
+    hour = hour.replace(minute=0, second=0, microsecond=0)
+    previous = None
+    for name in os.listdir(directory):
+        match = LOG_FILE_PATTERN.match(name)
+        if not match:
+            continue
+        file_hour = datetime.strptime(match.group(1), '%Y%m%d_%H')
+        if file_hour < hour and (previous is None or file_hour > previous):
+            previous = file_hour
+    return previous
+
+
+class BufferedLogWriter:
+    """시간별 로그 파일 핸들을 열어 둔 채로 로그를 모아서 쓰는 기록기
+
+    write() 는 버퍼에 넣기만 하고, 실제 파일 쓰기는 백그라운드 스레드가
+    flush_interval 초마다 또는 버퍼가 max_buffer 개를 넘을 때 한 번에 처리한다.
+    rotate() 로 경로가 바뀌면 이전 파일 핸들은 남은 내용을 쓴 뒤 닫힌다.
+    call_soon() 으로 넘긴 작업(지난 로그 읽기 등)은 같은 스레드에서 버퍼를 쓴 직후에 실행한다.
+    """
+
+    def __init__(self, path=None, flush_interval=2.0, max_buffer=50):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.buffer = []  # [(경로, 로그 한 줄), ...]
+        self.tasks = []   # 다음 기록 직후 쓰기 스레드에서 실행할 함수
+        self.condition = threading.Condition()
+        self.io_lock = threading.Lock()
+        self.file = None
+        self.file_path = None
+        self.closed = False
+        self.thread = threading.Thread(target=self.run, name="BufferedLogWriter", daemon=True)
+        self.thread.start()
+
+    def write(self, entry):
+        """로그 한 줄을 버퍼에 추가"""
+        with self.condition:
+            self.buffer.append((self.path, entry))
+            if len(self.buffer) >= self.max_buffer:
+                self.condition.notify()
+
+    def rotate(self, path):
+        """이후 기록을 새 파일로 보냄 (이미 쌓인 내용은 이전 파일에 기록)"""
+        with self.condition:
+            self.path = path
+            self.condition.notify()
+
+    def call_soon(self, task):
+        """쓰기 스레드에서 버퍼를 파일에 쓴 뒤 task() 를 실행 (화면 스레드에서 디스크 작업을 하지 않도록)"""
+        with self.condition:
+            self.tasks.append(task)
+            self.condition.notify()
+
+    def run(self):
+        while True:
+            with self.condition:
+                if not self.closed and not self.tasks:
+                    self.condition.wait(self.flush_interval)
+                closed = self.closed
+                tasks, self.tasks = self.tasks, []
+            self.flush()
+            for task in tasks:
+                try:
+                    task()
+                except Exception as e:
+                    logging.error(f"로그 작업 중 오류 발생: {e}")
+            if closed:
+                break
+
+    def flush(self):
+        """버퍼에 쌓인 내용을 파일에 씀
+
+        워커 스레드와 화면 스레드가 동시에 불러도 먼저 꺼낸 묶음이 먼저 기록되도록
+        버퍼를 꺼내기 전에 io_lock 을 잡고 쓰기가 끝날 때까지 유지한다.
+        """
+        with self.io_lock, METRICS.span('log_flush'):
+            with self.condition:
+                pending, self.buffer = self.buffer, []
+                path = self.path
+            try:
+                for entry_path, entry in pending:
+                    self.open(entry_path)
+                    self.file.write(entry)
+                if self.file:
+                    self.file.flush()
+                    # 시간이 바뀌었으면 이전 파일 핸들은 닫음 (새 파일은 다음 기록 때 열림)
+                    if path != self.file_path:
+                        self.file.close()
+                        self.file = None
+                        self.file_path = None
+            except Exception as e:
+                logging.error(f"로그 파일 저장 중 오류 발생: {e}")
+
+    def open(self, path):
+        if path == self.file_path and self.file:
+            return
+        if self.file:
+            self.file.close()
+        # 화면 내용과 파일 바이트 위치가 어긋나지 않도록 줄바꿈 변환 없이 기록
+        self.file = open(path, 'a', encoding='utf-8', newline='')
+        self.file_path = path
+
+    def close(self):
+        """남은 내용을 모두 쓰고 파일을 닫음"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+        self.thread.join(timeout=5)
+        self.flush()
+        with self.io_lock:
+            if self.file:
+                self.file.close()
+                self.file = None
+                self.file_path = None
@@ -0,0 +1,141 @@
+import json
+import math
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# 버킷 경계: 1µs 부터 2^(1/4) 배씩 (약 19% 간격), 120 개면 약 1000초까지
+BUCKET_BASE = 1e-6
+BUCKETS_PER_DOUBLING = 4
+BUCKET_COUNT = 120
+
+
+class LatencyHistogram:
+    """로그 간격 버킷으로 지연 시간을 모으는 히스토그램
+
+    값 하나를 넣는 비용은 버킷 번호 계산과 카운터 증가뿐이고, 백분위수는 버킷 상한으로
+    근사한다 (오차는 버킷 폭인 약 19% 이내).
+    """
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        if seconds <= BUCKET_BASE:
+            index = 0
+        else:
+            index = min(BUCKET_COUNT - 1, int(math.log2(seconds / BUCKET_BASE) * BUCKETS_PER_DOUBLING))
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, p):
+        """p (0~100) 백분위수 (초)"""
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * p / 100)
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(self.max, BUCKET_BASE * 2 ** ((index + 1) / BUCKETS_PER_DOUBLING))
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'p50_ms': self.percentile(50) * 1000,
+            'p95_ms': self.percentile(95) * 1000,
+            'p99_ms': self.percentile(99) * 1000,
+            'max_ms': self.max * 1000
+        }
+
+
+class Metrics:
+    """구간별 지연 히스토그램 모음 (여러 스레드에서 기록 가능)"""
+
+    def __init__(self):
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, seconds):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = LatencyHistogram()
+            histogram.add(seconds)
+
+    @contextmanager
+    def span(self, name):
+        """with metrics.span('fetch'): ... 구간의 실행 시간을 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started)
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+
+    def snapshot(self):
+        """{구간 이름: 요약} (이름순)"""
+        with self._lock:
+            return {name: self.histograms[name].summary() for name in sorted(self.histograms)}
+
+    def format_table(self):
+        """디버그 패널용 고정폭 표"""
+        lines = [f"{'구간':<20}{'횟수':>8}{'p50':>10}{'p95':>10}{'p99':>10}{'최대':>10}  (ms)"]
+        for name, summary in self.snapshot().items():
+            lines.append(f"{name:<20}{summary['count']:>8}{summary['p50_ms']:>10.2f}{summary['p95_ms']:>10.2f}"
+                         f"{summary['p99_ms']:>10.2f}{summary['max_ms']:>10.2f}")
+        return '\n'.join(lines)
+
+    def dump(self, path):
+        """요약을 JSON 파일로 저장"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'time': time.time(), 'spans': self.snapshot()}, f, ensure_ascii=False, indent=2)
+
+
+# 프로그램 전체에서 함께 쓰는 기본 레지스트리
+METRICS = Metrics()
+
+
+class MetricsServer(threading.Thread):
+    """127.0.0.1 에서 GET /metrics 로 요약 JSON 을 돌려주는 로컬 엔드포인트"""
+
+    def __init__(self, metrics=METRICS, host='127.0.0.1', port=8790):
+        super().__init__(name="MetricsServer", daemon=True)
+        metrics_ref = metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip('/') != '/metrics':
+                    self.send_error(404)
+                    return
+                data = json.dumps(metrics_ref.snapshot(), ensure_ascii=False).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                logging.debug(f"metrics - {format % args}")
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+
+    def run(self):
+        self.server.serve_forever()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
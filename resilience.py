@@ -0,0 +1,195 @@
+import time
+import random
+import logging
+import threading
+import requests
+
+# 재시도할 HTTP 상태 코드 (서버 과부하/일시 장애)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def is_client_error(status_code):
+    """재시도해도 소용없는 실패 (주소 이동/차단 등 4xx, 429 제외)"""
+    return 400 <= status_code < 500 and status_code not in RETRY_STATUSES
+
+HEALTH_OK = 'ok'              # 정상
+HEALTH_DEGRADED = 'degraded'  # 실패가 있었지만 아직 요청은 보냄
+HEALTH_DOWN = 'down'          # 회로 차단 중 (요청을 보내지 않음)
+HEALTH_NAMES = {HEALTH_OK: '정상', HEALTH_DEGRADED: '불안정', HEALTH_DOWN: '중단'}
+
+
+class CircuitOpenError(requests.RequestException):
+    """회로가 열려 있어 요청을 보내지 않았을 때"""
+
+
+class RetryLater(requests.RequestException):
+    """재시도할 실패 - 호출한 쪽이 delay 초 뒤에 attempt + 1 로 다시 요청"""
+
+    def __init__(self, message, delay, response=None):
+        super().__init__(message, response=response)
+        self.delay = delay
+
+
+class RetryPolicy:
+    """지수 백오프 + 전체 지터 (0 ~ base * 2^시도 사이 무작위, 최대 max_delay)"""
+
+    def __init__(self, max_retries=2, base_delay=0.5, max_delay=30.0, rng=random.random):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rng = rng
+
+    def delay(self, attempt, retry_after=None):
+        """attempt 번째 재시도 전 대기 시간 (서버가 Retry-After 를 주면 그보다 짧지 않게)"""
+        delay = self.rng() * min(self.max_delay, self.base_delay * (2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+
+class RetryBudget:
+    """전체 요청 수에 비례해서만 재시도를 허용하는 토큰 버킷
+
+    요청 한 번마다 ratio 만큼 토큰이 쌓이고 재시도 한 번에 1 개를 쓴다.
+    장애가 길어져도 재시도가 원래 요청량의 ratio 배를 넘지 않는다.
+    """
+
+    def __init__(self, ratio=0.2, initial=3.0, max_tokens=10.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = initial
+
+    def on_request(self):
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_spend(self):
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class CircuitBreaker:
+    """연속 실패가 쌓이면 일정 시간 요청을 막는 회로 차단기
+
+    closed → (연속 실패 failure_threshold 회) → open → (reset_timeout 경과) → half_open
+    half_open 에서 시험 요청이 성공하면 closed, 실패하면 대기 시간을 두 배로 늘려 다시 open.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=15.0, max_reset_timeout=300.0,
+                 clock=time.monotonic, rng=random.random):
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.clock = clock
+        self.rng = rng
+        self.state = 'closed'
+        self.failures = 0
+        self.reset_timeout = reset_timeout
+        self.opened_at = None
+
+    def retry_after(self):
+        """요청을 다시 보낼 수 있을 때까지 남은 시간 (초, 닫혀 있으면 0)"""
+        if self.state != 'open':
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_timeout - self.clock())
+
+    def allow_request(self):
+        if self.state == 'open' and self.retry_after() <= 0:
+            self.state = 'half_open'
+        return self.state != 'open'
+
+    def record_success(self):
+        self.state = 'closed'
+        self.failures = 0
+        self.reset_timeout = self.base_reset_timeout
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == 'half_open':
+            self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+            self.open()
+        elif self.state == 'closed' and self.failures >= self.failure_threshold:
+            self.open()
+
+    def open(self):
+        # 여러 클라이언트가 같은 시각에 몰리지 않도록 대기 시간에 ±10% 지터
+        self.state = 'open'
+        self.opened_at = self.clock() + self.reset_timeout * 0.1 * (2 * self.rng() - 1)
+
+
+class ResilientClient:
+    """requests.Session 위에서 재시도/백오프/회로 차단을 처리하는 조회 계층
+
+    get 은 요청을 한 번만 보내고 재시도 대기는 하지 않는다. 재시도할 실패면 RetryLater 로
+    대기 시간을 알려 주므로, 호출한 쪽은 그 시각으로 다음 조회를 미루면 된다
+    (한 게임의 재시도 대기가 같은 스레드의 다른 게임 조회를 막지 않음).
+    """
+
+    def __init__(self, session, retry=None, budget=None, breaker=None):
+        self.session = session
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.budget = budget if budget is not None else RetryBudget()
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+        self._lock = threading.Lock()
+
+    def get(self, url, attempt=0, **kwargs):
+        """GET 요청 한 번 (attempt 는 지금까지의 재시도 횟수)
+
+        재시도할 실패면 RetryLater 를 올리고, 재시도 횟수/예산을 다 썼으면 마지막 예외를 올리거나
+        마지막 응답을 반환한다. 404/403/410 같은 4xx 는 재시도하지 않고 응답을 그대로 반환하지만
+        회로 차단기와 상태에는 실패로 센다 (옮겨졌거나 막힌 주소가 정상으로 보이지 않도록).
+        """
+        with self._lock:
+            if not self.breaker.allow_request():
+                raise CircuitOpenError(f"회로 차단 중 ({self.breaker.retry_after():.0f}초 후 재시도)")
+            self.budget.on_request()
+
+        error = None
+        response = None
+        retry_after = None
+        try:
+            response = self.session.get(url, **kwargs)
+        except requests.RequestException as e:
+            error = e
+        else:
+            if is_client_error(response.status_code):
+                with self._lock:
+                    self.breaker.record_failure()
+                return response
+            if response.status_code not in RETRY_STATUSES:
+                with self._lock:
+                    self.breaker.record_success()
+                return response
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+
+        with self._lock:
+            self.breaker.record_failure()
+            can_retry = (attempt < self.retry.max_retries and self.breaker.state == 'closed'
+                         and self.budget.try_spend())
+        if not can_retry:
+            if error is not None:
+                raise error
+            return response
+
+        delay = self.retry.delay(attempt, retry_after)
+        reason = error if error is not None else response.status_code
+        logging.warning(f"요청 실패, {delay:.1f}초 후 재시도 ({attempt + 1}/{self.retry.max_retries}): {reason}")
+        raise RetryLater(f"{delay:.1f}초 후 재시도: {reason}", delay, response)
+
+    def health(self):
+        """(상태, 설명) - 상태는 HEALTH_OK / HEALTH_DEGRADED / HEALTH_DOWN"""
+        with self._lock:
+            if self.breaker.state == 'open':
+                return HEALTH_DOWN, f"{self.breaker.retry_after():.0f}초 후 재시도"
+            if self.breaker.failures:
+                return HEALTH_DEGRADED, f"연속 실패 {self.breaker.failures}회"
+            return HEALTH_OK, ''
+
+
+def parse_retry_after(value):
+    """Retry-After 헤더의 초 값 (날짜 형식이거나 없으면 None)"""
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
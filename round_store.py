@@ -0,0 +1,108 @@
+import os
+import json
+import sqlite3
+from collections import deque, OrderedDict
+from itertools import islice
+from engine import RoundInfo
+
+
+class RoundStore:
+    """최근 회차만 메모리에 두고 밀려난 회차는 디스크에서 읽는 저장소
+
+    결과는 최신순 deque 에 appendleft 로 O(1) 추가되고, 메모리 보관 한도(horizon)를
+    넘으면 가장 오래된 결과는 메모리에서 버린다 (모든 결과는 archive(ResultArchive) 에 이미 있으므로
+    recent_results 는 밀려난 결과를 보관소에서 읽는다). 밀려난 베팅 정보는 SQLite 파일로 옮기며,
+    커밋은 spill_batch 개마다 또는 checkpoint / close 때 한 번에 한다.
+    디스크로 옮겨진 회차도 get_round / recent_results 로 그대로 조회할 수 있다.
+    """
+
+    def __init__(self, db_path=os.path.join('betting_logs', 'rounds.db'), horizon=1000, archive=None,
+                 spill_batch=100):
+        self.horizon = horizon
+        self.archive = archive
+        self.spill_batch = spill_batch
+        self.results = deque()       # [(회차, 방향, 줄수, 홀짝), ...] 최신순
+        self.rounds = OrderedDict()  # {회차: RoundInfo} 오래된 순
+        self.dirty = set()           # 마지막 checkpoint 이후 바뀐 메모리의 회차
+        self.pending_spills = 0      # 아직 커밋하지 않은 디스크 이동 수
+        
+        self.db = sqlite3.connect(db_path)
+        with self.db:
+            self.db.execute("CREATE TABLE IF NOT EXISTS rounds ("
+                            "round INTEGER PRIMARY KEY, data TEXT)")
+
+    def add_result(self, result):
+        """새 결과를 맨 앞에 추가하고, 한도를 넘으면 가장 오래된 결과를 메모리에서 뺌"""
+        self.results.appendleft(result)
+        if len(self.results) > self.horizon:
+            self.results.pop()
+
+    def recent_results(self, start, count):
+        """최신순으로 start 번째부터 count 개의 결과 (메모리에 없으면 보관소에서 읽음)"""
+        results = list(islice(self.results, start, start + count))
+        if len(results) < count and self.archive is not None:
+            offset = max(0, start - len(self.results))
+            oldest = self.results[-1][0] if self.results else None
+            results.extend(self.archive.before(oldest, count - len(results), offset))
+        return results
+
+    def total_results(self):
+        """메모리와 보관소를 합친 전체 결과 수"""
+        if self.archive is None:
+            return len(self.results)
+        return len(self.results) + self.archive.count_before(self.results[-1][0] if self.results else None)
+
+    def put_round(self, round_info):
+        """회차 베팅 정보 저장 (한도를 넘으면 가장 오래된 정보를 디스크로 이동)"""
+        self.rounds[round_info.round_num] = round_info
+        self.rounds.move_to_end(round_info.round_num)
+        self.dirty.add(round_info.round_num)
+        if len(self.rounds) > self.horizon:
+            _, old_info = self.rounds.popitem(last=False)
+            self.spill_round(old_info)
+
+    def spill_round(self, round_info):
+        """메모리에서 밀려난 회차를 디스크에 기록 (커밋은 spill_batch 개마다 모아서)"""
+        self.dirty.discard(round_info.round_num)
+        self.db.execute("INSERT OR REPLACE INTO rounds VALUES (?, ?)",
+                        (int(round_info.round_num), json.dumps(round_info.to_dict(), ensure_ascii=False)))
+        self.pending_spills += 1
+        if self.pending_spills >= self.spill_batch:
+            self.commit()
+
+    def commit(self):
+        """모아 둔 디스크 이동을 커밋"""
+        self.db.commit()
+        self.pending_spills = 0
+
+    def checkpoint(self):
+        """마지막 checkpoint 이후 바뀐 회차 베팅 정보만 디스크에 기록 (메모리에서는 지우지 않음)"""
+        changed = [self.rounds[round_num] for round_num in self.dirty if round_num in self.rounds]
+        self.db.executemany("INSERT OR REPLACE INTO rounds VALUES (?, ?)",
+                            [(int(round_info.round_num), json.dumps(round_info.to_dict(), ensure_ascii=False))
+                             for round_info in changed])
+        self.commit()
+        self.dirty.clear()
+
+    def get_round(self, round_num):
+        """회차 베팅 정보 조회 (없으면 None)"""
+        round_info = self.rounds.get(round_num)
+        if round_info is not None:
+            return round_info
+        row = self.db.execute("SELECT data FROM rounds WHERE round = ?", (int(round_num),)).fetchone()
+        return RoundInfo.from_dict(json.loads(row[0])) if row else None
+
+    def has_round(self, round_num):
+        return round_num in self.rounds or self.get_round(round_num) is not None
+
+    def remove_round(self, round_num):
+        """회차 베팅 정보 삭제 (베팅 취소시)"""
+        self.rounds.pop(round_num, None)
+        self.dirty.discard(round_num)
+        with self.db:
+            self.db.execute("DELETE FROM rounds WHERE round = ?", (int(round_num),))
+        self.pending_spills = 0  # with 블록이 모아 둔 이동도 함께 커밋함
+
+    def close(self):
+        self.commit()
+        self.db.close()
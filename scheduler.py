@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+from timer import config, get_remaining_seconds
+
+
+class PollScheduler:
+    """회차 마감 시각에 맞춰 다음 조회까지의 대기 시간을 정하는 스케줄러
+
+    timer.config 의 마감 주기를 기준으로 마감 직전까지는 잠들어 있다가,
+    새 회차가 잡힐 때까지 짧은 간격으로 연속 조회(burst)한다.
+    결과가 마감 후 몇 초 뒤에 올라오는지는 관측값으로 계속 보정한다.
+    clock 을 주면 (예: ClockSync.now_datetime) 로컬 시계 대신 서버 기준 시각으로 계산한다.
+    """
+
+    def __init__(self, game_type='power_ladder', burst_interval=1.0, lead_seconds=2.0,
+                 burst_timeout=120.0, max_backoff=60.0, smoothing=0.3, clock=datetime.now):
+        self.game_type = game_type
+        self.clock = clock
+        self.cycle_seconds = config[game_type]['returnMinute'] * 60
+        self.burst_interval = burst_interval  # 연속 조회 간격 (초)
+        self.lead_seconds = lead_seconds      # 예상 발표 시각보다 먼저 깨어나는 여유 (초)
+        self.burst_timeout = burst_timeout    # 연속 조회 최대 지속 시간 (초)
+        self.max_backoff = max_backoff        # 백오프 최대 간격 (초)
+        self.smoothing = smoothing            # 발표 지연 추정치 보정 비율
+        
+        self.expected_delay = 0.0  # 마감 후 결과가 올라오기까지 걸리는 시간 추정치 (초)
+        self.target_draw = None    # 결과를 기다리는 마감 시각
+        self.backoff = burst_interval
+        self.retry_delay = 0.0     # 기준 회차를 잡기 전 재시도 간격
+
+    def next_draw_after(self, now):
+        """now 이후 가장 가까운 마감 시각"""
+        return now + timedelta(seconds=get_remaining_seconds(self.game_type, now))
+
+    def next_delay(self, now=None):
+        """다음 조회까지 기다릴 시간 (초)"""
+        if now is None:
+            now = self.clock()
+        
+        # 아직 기준 회차가 없으면 바로 조회 (실패가 이어지면 간격을 늘림)
+        if self.target_draw is None:
+            return self.retry_delay
+        
+        window_start = self.target_draw + timedelta(seconds=self.expected_delay - self.lead_seconds)
+        wait = (window_start - now).total_seconds()
+        if wait > 0:
+            return wait
+        if -wait <= self.burst_timeout:
+            return self.burst_interval
+        
+        # 연속 조회 시간을 넘기면 간격을 두 배씩 늘림
+        self.backoff = min(self.backoff * 2, self.max_backoff)
+        return self.backoff
+
+    def on_poll(self, changed, now=None):
+        """조회 결과를 반영 (changed: 새 회차를 발견했는지 여부)"""
+        if now is None:
+            now = self.clock()
+        
+        if not changed:
+            if self.target_draw is None:
+                self.retry_delay = min(max(self.burst_interval, self.retry_delay * 2), self.max_backoff)
+            return
+        
+        # 마감 후 실제 발표까지 걸린 시간으로 추정치 보정
+        if self.target_draw is not None:
+            observed = (now - self.target_draw).total_seconds()
+            if 0 <= observed < self.cycle_seconds:
+                self.expected_delay += self.smoothing * (observed - self.expected_delay)
+        
+        self.target_draw = self.next_draw_after(now)
+        self.backoff = self.burst_interval
+        self.retry_delay = 0.0
@@ -0,0 +1,81 @@
+import os
+import json
+import sqlite3
+from engine import RoundInfo
+
+
+class SessionJournal:
+    """베팅 세션 상태를 SQLite(WAL) 에 기록하는 추가 전용 저널 + 주기적 스냅샷
+
+    엔진이 베팅/정산/취소를 할 때마다 바뀐 회차 정보와 엔진 상태를 journal 테이블에 한 트랜잭션으로
+    덧붙인다. snapshot_interval 개가 쌓이면 회차 정보는 RoundStore.checkpoint 로 rounds.db 에 내리고
+    엔진 상태만 snapshots 에 남긴 뒤 그 이전 저널을 지운다.
+    재시작시에는 마지막 스냅샷 + 그 뒤의 저널만 적용하므로 텍스트 로그를 다시 읽을 필요가 없다.
+    """
+
+    def __init__(self, path=os.path.join('betting_logs', 'session.db'), snapshot_interval=100):
+        self.snapshot_interval = snapshot_interval
+        self.pending = []          # 다음 record_state 때 함께 기록할 항목
+        self.since_snapshot = 0
+
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        with self.db:
+            self.db.execute("CREATE TABLE IF NOT EXISTS journal ("
+                            "seq INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT, round INTEGER, data TEXT)")
+            self.db.execute("CREATE TABLE IF NOT EXISTS snapshots (seq INTEGER PRIMARY KEY, data TEXT)")
+
+    def put_round(self, round_info):
+        self.pending.append(('round', int(round_info.round_num),
+                             json.dumps(round_info.to_dict(), ensure_ascii=False)))
+
+    def remove_round(self, round_num):
+        self.pending.append(('remove', int(round_num), None))
+
+    def record_state(self, state):
+        """쌓인 회차 변경과 엔진 상태를 한 트랜잭션으로 기록"""
+        self.pending.append(('state', None, json.dumps(state, ensure_ascii=False)))
+        with self.db:
+            self.db.executemany("INSERT INTO journal (kind, round, data) VALUES (?, ?, ?)", self.pending)
+        self.since_snapshot += len(self.pending)
+        self.pending = []
+
+    def needs_snapshot(self):
+        return self.since_snapshot >= self.snapshot_interval
+
+    def snapshot(self, state, rounds=None):
+        """엔진 상태 스냅샷 (rounds 가 있으면 먼저 checkpoint 해서 회차 정보를 디스크에 내림)"""
+        if rounds is not None and hasattr(rounds, 'checkpoint'):
+            rounds.checkpoint()
+        with self.db:
+            seq = self.db.execute("SELECT COALESCE(MAX(seq), 0) FROM journal").fetchone()[0]
+            self.db.execute("INSERT OR REPLACE INTO snapshots VALUES (?, ?)",
+                            (seq, json.dumps(state, ensure_ascii=False)))
+            self.db.execute("DELETE FROM journal WHERE seq <= ?", (seq,))
+            self.db.execute("DELETE FROM snapshots WHERE seq < ?", (seq,))
+        self.since_snapshot = 0
+
+    def restore(self, engine):
+        """마지막 스냅샷과 이후 저널을 엔진에 적용 (복원했으면 True)"""
+        row = self.db.execute("SELECT seq, data FROM snapshots ORDER BY seq DESC LIMIT 1").fetchone()
+        seq, state = (row[0], json.loads(row[1])) if row else (0, None)
+
+        entries = self.db.execute("SELECT kind, round, data FROM journal WHERE seq > ? ORDER BY seq",
+                                  (seq,)).fetchall()
+        for kind, round_num, data in entries:
+            if kind == 'round':
+                engine.rounds.put_round(RoundInfo.from_dict(json.loads(data)))
+            elif kind == 'remove':
+                engine.rounds.remove_round(str(round_num))
+            elif kind == 'state':
+                state = json.loads(data)
+        self.since_snapshot = len(entries)
+
+        if state is None:
+            return False
+        engine.restore_state(state)
+        return True
+
+    def close(self):
+        self.db.close()
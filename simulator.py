@@ -0,0 +1,240 @@
+import sys
+import time
+import argparse
+
+import numpy as np
+
+from engine import (ODDS, BETTING_PATTERNS, SINGLE_MARKETS, default_betting_methods, custom_picks,
+                    build_round_bets, is_martingale)
+
+# 결과 배열에서 각 단식 항목이 True 일 때의 값 (left / line3 / odd)
+TRUE_VALUES = {'direction': '좌', 'line': '3', 'parity': '홀'}
+MARKET_FIELDS = {'direction': 0, 'line': 1, 'parity': 2}
+
+
+def encode_results(results):
+    """(회차, 방향, 줄수, 홀짝) 결과들을 (left, line3, odd) 불리언 배열로 변환"""
+    left = np.fromiter((result[1] == '좌' for result in results), dtype=bool)
+    line3 = np.fromiter((result[2] == '3' for result in results), dtype=bool)
+    odd = np.fromiter((result[3] == '홀' for result in results), dtype=bool)
+    return left, line3, odd
+
+
+def synthetic_sessions(n_sessions, n_rounds, seed=None, ladder_parity=True):
+    """무작위 세션 생성 - 각 배열의 모양은 (세션 수, 회차 수)
+
+    ladder_parity 가 True 면 사다리 구조대로 홀짝을 방향과 줄수로 정한다
+    (좌3짝 / 좌4홀 / 우3홀 / 우4짝). False 면 세 항목을 서로 독립으로 뽑는다.
+    """
+    rng = np.random.default_rng(seed)
+    left = rng.random((n_sessions, n_rounds)) < 0.5
+    line3 = rng.random((n_sessions, n_rounds)) < 0.5
+    if ladder_parity:
+        odd = left ^ line3
+    else:
+        odd = rng.random((n_sessions, n_rounds)) < 0.5
+    return left, line3, odd
+
+
+def resample_sessions(history, n_sessions, n_rounds, seed=None, block_size=12):
+    """과거 결과 (left, line3, odd) 에서 연속 구간(block)을 뽑아 이어 붙인 세션 생성"""
+    rng = np.random.default_rng(seed)
+    length = len(history[0])
+    block_size = max(1, min(block_size, length))
+    n_blocks = -(-n_rounds // block_size)
+    starts = rng.integers(0, length - block_size + 1, size=(n_sessions, n_blocks))
+    index = (starts[:, :, None] + np.arange(block_size)).reshape(n_sessions, -1)[:, :n_rounds]
+    return tuple(np.asarray(values)[index] for values in history)
+
+
+class BetPlan:
+    """회차별 베팅을 배열로 펼친 것
+
+    single_want / single_stake : (3, 회차 수) - 방향/줄수/홀짝 픽 (True=좌/3/홀) 과 금액 (0 이면 미베팅)
+    combos : [(항목1, 항목2, 픽1 배열, 픽2 배열, 금액 배열), ...]
+    martin_steps : 시스템 마틴이면 단계별 단식 금액 배열, 아니면 None
+    """
+
+    def __init__(self, single_want, single_stake, combos, martin_steps=None):
+        self.single_want = single_want
+        self.single_stake = single_stake
+        self.combos = combos
+        self.martin_steps = martin_steps
+
+
+def expand_bet_plan(method, n_rounds, mode='rotation', selected_picks=('좌', '3', '홀'),
+                     betting_methods=None, betting_patterns=None):
+    """engine.build_round_bets 로 만든 베팅을 회차별 배열로 변환 (로테이션은 회차마다 다음 패턴)"""
+    betting_methods = betting_methods if betting_methods is not None else default_betting_methods()
+    patterns = betting_patterns if betting_patterns is not None else BETTING_PATTERNS
+    method_config = dict(betting_methods[method], current_step=0)
+    chance_pick = selected_picks[2] != '없음'
+
+    if mode == 'rotation':
+        plans = [(pattern[0], tuple(pattern[1:])) for pattern in patterns]
+    else:
+        plans = [('custom', custom_picks(selected_picks))]
+
+    # 패턴별 베팅을 한 번만 만들고 회차 순서대로 펼침
+    order = np.arange(n_rounds) % len(plans)
+    single_want = np.zeros((3, n_rounds), dtype=bool)
+    single_stake = np.zeros((3, n_rounds))
+    combo_columns = {}
+    for index, (pattern_type, prediction) in enumerate(plans):
+        columns = order == index
+        round_info = build_round_bets('0', method, method_config, prediction, pattern_type, chance_pick)
+        for bet in round_info.bets:
+            if bet.market in SINGLE_MARKETS:
+                field = MARKET_FIELDS[bet.market]
+                single_want[field, columns] = bet.pick == TRUE_VALUES[bet.market]
+                single_stake[field, columns] = bet.stake
+            else:
+                first, second = bet.market.split('_')
+                combo = combo_columns.setdefault(bet.market, (
+                    MARKET_FIELDS[first], MARKET_FIELDS[second],
+                    np.zeros(n_rounds, dtype=bool), np.zeros(n_rounds, dtype=bool), np.zeros(n_rounds)))
+                combo[2][columns] = bet.pick[0] == TRUE_VALUES[first]
+                combo[3][columns] = bet.pick[1] == TRUE_VALUES[second]
+                combo[4][columns] = bet.stake
+
+    martin_steps = None
+    if is_martingale(method):
+        martin_steps = np.asarray(betting_methods[method]['martin_steps'], dtype=float)
+    return BetPlan(single_want, single_stake, list(combo_columns.values()), martin_steps)
+
+
+class SimulationReport:
+    """세션별 시뮬레이션 결과"""
+
+    def __init__(self, method, initial_asset, equity, wins, rounds_played, ruined):
+        self.method = method
+        self.initial_asset = initial_asset
+        self.equity = equity                # (세션 수, 회차 수) 회차별 자산
+        self.wins = wins                    # 세션별 승리 수
+        self.rounds_played = rounds_played  # 세션별 실제 베팅한 회차 수
+        self.ruined = ruined                # 세션별 파산 여부 (다음 베팅금을 낼 수 없게 됨)
+
+    @property
+    def final_assets(self):
+        return self.equity[:, -1]
+
+    @property
+    def ruin_probability(self):
+        return float(self.ruined.mean())
+
+    @property
+    def max_drawdown(self):
+        """세션별 최고 자산 대비 최대 하락폭"""
+        peak = np.maximum.accumulate(np.maximum(self.equity, self.initial_asset), axis=1)
+        return (peak - self.equity).max(axis=1)
+
+    @property
+    def win_rate(self):
+        played = self.rounds_played.sum()
+        return float(self.wins.sum() / played * 100) if played else 0.0
+
+    def summary(self):
+        p5, p50, p95 = np.percentile(self.final_assets, [5, 50, 95])
+        return (f"{self.method}: {len(self.ruined)}세션, 파산확률 {self.ruin_probability * 100:.2f}%, "
+                f"승률 {self.win_rate:.1f}%, 최종자산 평균 {self.final_assets.mean():,.0f}원 "
+                f"(5% {p5:,.0f} / 50% {p50:,.0f} / 95% {p95:,.0f}), "
+                f"평균 최대낙폭 {self.max_drawdown.mean():,.0f}원")
+
+
+def simulate(method, sessions, mode='rotation', selected_picks=('좌', '3', '홀'), initial_asset=500000,
+             betting_methods=None, betting_patterns=None, odds=None, pay_combination=False):
+    """여러 세션을 한꺼번에 계산
+
+    sessions 는 (left, line3, odd) 불리언 배열이며 모양은 (세션 수, 회차 수) 이다.
+    다음 회차 베팅금을 낼 수 없게 되면 그 세션은 파산으로 보고 이후 베팅을 멈춘다.
+    pay_combination 은 engine.settle_round 와 같다.
+    """
+    odds = odds if odds is not None else ODDS
+    outcome = np.stack([np.asarray(values, dtype=bool) for values in sessions])  # (3, S, R)
+    _, n_sessions, n_rounds = outcome.shape
+    plan = expand_bet_plan(method, n_rounds, mode, selected_picks, betting_methods, betting_patterns)
+
+    # 단식 적중 수 (회차별 승패는 경로와 무관)
+    single_mask = plan.single_stake > 0
+    single_hits = (outcome == plan.single_want[:, None, :]) & single_mask[:, None, :]
+    correct = single_hits.sum(axis=0)
+    won = correct >= 2
+
+    # 조합 베팅 금액 (engine.settle_round 와 같이 pay_combination 일 때만 당첨금 지급)
+    combo_win = np.zeros((n_sessions, n_rounds))
+    combo_stake = np.zeros(n_rounds)
+    for first, second, want_first, want_second, stake in plan.combos:
+        if pay_combination:
+            hit = (outcome[first] == want_first) & (outcome[second] == want_second)
+            combo_win += hit * (stake * odds['combination'])
+        combo_stake += stake
+
+    if plan.martin_steps is None:
+        # 금액이 고정이므로 회차별 손익을 한 번에 계산하고 누적합으로 자산 경로를 구함
+        single_win = (single_hits * plan.single_stake[:, None, :]).sum(axis=0) * odds['single']
+        total_bet = plan.single_stake.sum(axis=0) + combo_stake
+        profit = single_win + combo_win - total_bet
+        equity_before = initial_asset + np.cumsum(profit, axis=1) - profit
+        ruined_mask = np.logical_or.accumulate(equity_before < total_bet, axis=1)
+        profit = np.where(ruined_mask, 0.0, profit)
+        equity = initial_asset + np.cumsum(profit, axis=1)
+        active = ~ruined_mask
+    else:
+        # 마틴 단계는 직전 승패에 따라 달라지므로 회차 순서대로 세션 전체를 한 번에 진행
+        martin_steps = plan.martin_steps
+        last_step = len(martin_steps) - 1
+        picks = single_mask.sum(axis=0)
+        step = np.zeros(n_sessions, dtype=np.intp)
+        asset = np.full(n_sessions, float(initial_asset))
+        alive = np.ones(n_sessions, dtype=bool)
+        equity = np.empty((n_sessions, n_rounds))
+        active = np.empty((n_sessions, n_rounds), dtype=bool)
+        for t in range(n_rounds):
+            stake = martin_steps[step]
+            bet = stake * picks[t] + combo_stake[t]
+            alive &= asset >= bet
+            profit = stake * correct[:, t] * odds['single'] + combo_win[:, t] - bet
+            asset += np.where(alive, profit, 0.0)
+            step = np.where(alive, np.clip(step + np.where(won[:, t], -1, 1), 0, last_step), step)
+            equity[:, t] = asset
+            active[:, t] = alive
+        ruined_mask = ~active
+
+    wins = (won & active).sum(axis=1)
+    rounds_played = active.sum(axis=1)
+    return SimulationReport(method, initial_asset, equity, wins, rounds_played, ruined_mask[:, -1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="베팅 방법 몬테카를로 시뮬레이션")
+    parser.add_argument('--method', default='all', help="method1 ~ method5 또는 all")
+    parser.add_argument('--sessions', type=int, default=10000)
+    parser.add_argument('--rounds', type=int, default=1000)
+    parser.add_argument('--initial-asset', type=int, default=500000)
+    parser.add_argument('--mode', default='rotation', choices=['rotation', 'custom'])
+    parser.add_argument('--picks', nargs=3, default=['좌', '3', '홀'], help="선택 모드 픽 3개")
+    parser.add_argument('--history', help="재표본 추출에 쓸 result.json JSON Lines 파일 (없으면 무작위 생성)")
+    parser.add_argument('--block-size', type=int, default=12)
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--pay-combination', action='store_true', help="적중한 조합 베팅에도 당첨금 지급")
+    args = parser.parse_args(argv)
+
+    if args.history:
+        from backtest import load_results
+        history = encode_results(load_results(args.history))
+        sessions = resample_sessions(history, args.sessions, args.rounds, args.seed, args.block_size)
+    else:
+        sessions = synthetic_sessions(args.sessions, args.rounds, args.seed)
+
+    methods = sorted(default_betting_methods()) if args.method == 'all' else [args.method]
+    for method in methods:
+        started = time.perf_counter()
+        report = simulate(method, sessions, args.mode, args.picks, args.initial_asset,
+                          pay_combination=args.pay_combination)
+        elapsed = time.perf_counter() - started
+        print(f"{report.summary()} [{elapsed:.2f}s]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+from collections import deque
+
+# (항목, 결과 튜플 인덱스, 첫번째 값, 두번째 값)
+MARKETS = (
+    ('direction', 1, '좌', '우'),
+    ('line', 2, '3', '4'),
+    ('parity', 3, '홀', '짝'),
+)
+
+
+class ResultStats:
+    """결과가 추가될 때마다 갱신되는 좌우/줄수/홀짝 누적 통계
+
+    전체 누적 횟수, 최근 N회 구간 횟수, 현재 연속 횟수를 모두
+    추가 시점에 갱신하므로 조회는 항상 상수 시간이다.
+    """
+
+    def __init__(self, windows=(20, 50, 100)):
+        self.windows = tuple(sorted(windows))
+        self.total = 0
+        self.counts = {market: 0 for market, _, _, _ in MARKETS}  # 첫번째 값(좌/3/홀) 횟수
+        self.window_counts = {window: {market: 0 for market, _, _, _ in MARKETS} for window in self.windows}
+        self.streaks = {market: (None, 0) for market, _, _, _ in MARKETS}  # (값, 연속 횟수)
+        self.recent = deque(maxlen=self.windows[-1] if self.windows else 0)  # 최근 결과 플래그 (오래된 순)
+
+    def add(self, result):
+        """새 결과 (회차, 방향, 줄수, 홀짝) 반영"""
+        flags = tuple(result[index] == first for _, index, first, _ in MARKETS)
+        
+        # 구간 밖으로 밀려나는 결과를 먼저 빼고 새 결과를 더함
+        for window in self.windows:
+            counts = self.window_counts[window]
+            if len(self.recent) >= window:
+                leaving = self.recent[-window]
+                for (market, _, _, _), flag in zip(MARKETS, leaving):
+                    counts[market] -= flag
+            for (market, _, _, _), flag in zip(MARKETS, flags):
+                counts[market] += flag
+        self.recent.append(flags)
+        
+        self.total += 1
+        for (market, index, _, _), flag in zip(MARKETS, flags):
+            self.counts[market] += flag
+            value, length = self.streaks[market]
+            self.streaks[market] = (result[index], length + 1 if value == result[index] else 1)
+
+    def extend(self, results):
+        """여러 결과를 오래된 순서로 한 번에 반영 (저장된 과거 기록 적재용)
+
+        add 를 반복하는 것과 결과는 같지만, 구간 횟수와 연속 횟수는 끝부분만 보고 계산한다.
+        """
+        results = list(results)
+        if not results:
+            return
+        
+        self.total += len(results)
+        for market, index, first, _ in MARKETS:
+            column = [result[index] for result in results]
+            self.counts[market] += column.count(first)
+            
+            # 마지막 값이 몇 번 연속인지 (전부 같은 값이면 이전 연속에 이어 붙임)
+            last = column[-1]
+            length = 0
+            for value in reversed(column):
+                if value != last:
+                    break
+                length += 1
+            previous_value, previous_length = self.streaks[market]
+            if length == len(column) and previous_value == last:
+                length += previous_length
+            self.streaks[market] = (last, length)
+        
+        # 최근 구간은 새로 채운 recent 기준으로 다시 셈
+        if self.recent.maxlen:
+            self.recent.extend(tuple(result[index] == first for _, index, first, _ in MARKETS)
+                               for result in results[-self.recent.maxlen:])
+        recent = list(self.recent)
+        for window in self.windows:
+            counts = self.window_counts[window]
+            for position, (market, _, _, _) in enumerate(MARKETS):
+                counts[market] = sum(flags[position] for flags in recent[-window:])
+
+    def ratio(self, market, window=None):
+        """(첫번째 값 횟수, 두번째 값 횟수) 반환 - window 가 없으면 전체 기준"""
+        if window is None:
+            first = self.counts[market]
+            return first, self.total - first
+        first = self.window_counts[window][market]
+        return first, min(self.total, window) - first
+
+    def streak(self, market):
+        """현재 연속 중인 (값, 횟수)"""
+        return self.streaks[market]
+
+    def __len__(self):
+        return self.total
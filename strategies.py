@@ -0,0 +1,171 @@
+import copy
+import logging
+
+from engine import (ODDS, BETTING_PATTERNS, default_betting_methods, build_round_bets, settle_round,
+                    is_winning_round, step_martingale, is_martingale)
+from stats import MARKETS
+
+# 항목별 반대 값 (좌↔우, 3↔4, 홀↔짝)
+OPPOSITE = {}
+for _, _, first, second in MARKETS:
+    OPPOSITE[first] = second
+    OPPOSITE[second] = first
+
+# 등록된 전략 {이름: 전략 클래스}
+STRATEGIES = {}
+
+
+def register_strategy(cls):
+    """전략 클래스 등록 (클래스 데코레이터)"""
+    STRATEGIES[cls.name] = cls
+    return cls
+
+
+def create_strategy(name, **kwargs):
+    return STRATEGIES[name](**kwargs)
+
+
+class Strategy:
+    """예측 전략 기본 클래스
+
+    predict 는 최신 결과까지 반영된 ResultStats 를 받아 (방향, 줄수, 홀짝) 예측을 돌려준다.
+    전체 비율, 최근 N회 구간 비율, 현재 연속 횟수는 ResultStats 가 결과를 추가할 때 이미 계산해 두므로
+    전략이 지난 결과를 다시 훑을 필요가 없다.
+    """
+
+    name = None   # 등록 이름
+    label = None  # 화면 표시 이름
+
+    def predict(self, features):
+        raise NotImplementedError
+
+
+@register_strategy
+class RotationStrategy(Strategy):
+    """기본 패턴을 순서대로 돌아가며 사용"""
+
+    name = 'rotation'
+    label = '패턴 로테이션'
+
+    def __init__(self, patterns=BETTING_PATTERNS):
+        self.patterns = patterns
+        self.index = 0
+
+    def predict(self, features):
+        pattern = self.patterns[self.index]
+        self.index = (self.index + 1) % len(self.patterns)
+        return tuple(pattern[1:])
+
+
+@register_strategy
+class FollowStreakStrategy(Strategy):
+    """항목마다 직전 값이 계속 나온다고 봄"""
+
+    name = 'follow_streak'
+    label = '연속 따라가기'
+
+    def predict(self, features):
+        return tuple(features.streak(market)[0] or first for market, _, first, _ in MARKETS)
+
+
+@register_strategy
+class BreakStreakStrategy(Strategy):
+    """min_length 회 이상 연속된 항목은 끊긴다고 보고, 아니면 직전 값을 따라감"""
+
+    name = 'break_streak'
+    label = '연속 끊기'
+
+    def __init__(self, min_length=3):
+        self.min_length = min_length
+
+    def predict(self, features):
+        prediction = []
+        for market, _, first, _ in MARKETS:
+            value, length = features.streak(market)
+            value = value or first
+            prediction.append(OPPOSITE[value] if length >= self.min_length else value)
+        return tuple(prediction)
+
+
+@register_strategy
+class WindowMajorityStrategy(Strategy):
+    """최근 window 회에서 더 많이 나온 값을 고름 (같으면 직전 값)"""
+
+    name = 'window_majority'
+    label = '최근 다수'
+
+    def __init__(self, window=20):
+        self.window = window
+
+    def pick(self, features, market, first, second):
+        first_count, second_count = features.ratio(market, self.window)
+        if first_count == second_count:
+            return features.streak(market)[0] or first
+        return first if first_count > second_count else second
+
+    def predict(self, features):
+        return tuple(self.pick(features, market, first, second) for market, _, first, second in MARKETS)
+
+
+@register_strategy
+class WindowMinorityStrategy(WindowMajorityStrategy):
+    """최근 window 회에서 덜 나온 값을 고름 (평균 회귀)"""
+
+    name = 'window_minority'
+    label = '최근 소수'
+
+    def pick(self, features, market, first, second):
+        return OPPOSITE[super().pick(features, market, first, second)]
+
+
+class ShadowRunner:
+    """여러 전략을 실제 베팅 없이 같은 실시간 결과로 동시에 돌려보는 실행기
+
+    GUI 가 새 결과를 통계에 반영한 뒤 on_result 를 부르면, 전략마다 직전 회차 예측을 정산하고
+    다음 회차 예측을 만든다. 결과는 이미 받은 것을 재사용하므로 추가 네트워크 요청이 없다.
+    전략마다 베팅 설정(마틴 단계 포함)을 따로 복사해서 쓴다.
+    """
+
+    def __init__(self, names=None, method='method1', betting_methods=None, odds=None):
+        names = names if names is not None else list(STRATEGIES)
+        betting_methods = betting_methods if betting_methods is not None else default_betting_methods()
+        self.method = method
+        self.odds = odds if odds is not None else ODDS
+        self.entries = [{
+            'strategy': create_strategy(name),
+            'method_config': copy.deepcopy(betting_methods[method]),
+            'pending': None,
+            'wins': 0,
+            'losses': 0,
+            'profit': 0
+        } for name in names]
+
+    def on_result(self, result, features):
+        """새 결과로 직전 예측을 정산하고 다음 회차 예측을 만듦 (features 는 result 까지 반영된 ResultStats)"""
+        round_num = result[0]
+        next_round = str(int(round_num) + 1)
+        for entry in self.entries:
+            pending = entry['pending']
+            if pending is not None and pending.round_num == round_num:
+                win_amount, correct_picks, _ = settle_round(pending, result[1:], self.odds)
+                won = is_winning_round(correct_picks)
+                entry['wins' if won else 'losses'] += 1
+                entry['profit'] += win_amount - pending.total_bet
+                if is_martingale(self.method):
+                    step_martingale(entry['method_config'], won)
+
+            strategy = entry['strategy']
+            try:
+                prediction = strategy.predict(features)
+            except Exception as e:
+                logging.error(f"전략 {strategy.name} 예측 중 오류 발생: {e}")
+                entry['pending'] = None
+                continue
+            entry['pending'] = build_round_bets(next_round, self.method, entry['method_config'],
+                                                prediction, strategy.name)
+
+    def summary(self):
+        """[(전략 표시 이름, 승, 패, 순수익), ...] 순수익 높은 순"""
+        rows = [(entry['strategy'].label, entry['wins'], entry['losses'], entry['profit'])
+                for entry in self.entries]
+        return sorted(rows, key=lambda row: row[3], reverse=True)
@@ -0,0 +1,160 @@
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+from timer import config
+
+# 개발/테스트용 로컬 대체 서버
+#   /data/json/games/<게임>/result.json                  최신 회차 결과 (ETag / If-None-Match 지원)
+#   /data/json/games/<게임>/history.json?start=N&end=M   회차 범위 결과 (백필용)
+# --fail-rate / --drop-rate / --latency / --outage 로 장애를 흉내낼 수 있다.
+# 회차 결과는 (게임, 회차) 로 시드를 정한 난수라서 언제 요청해도 같은 값이 나온다.
+
+
+def round_at(game, now=None):
+    """주어진 시각에 마지막으로 마감된 회차 번호 (timer.config 의 주기/오프셋 사용)"""
+    game_config = config[game]
+    now = time.time() if now is None else now
+    adjusted = now + game_config['diffSec'] + game_config['countDownDiff'] / 1000
+    return int(adjusted // (game_config['returnMinute'] * 60))
+
+
+def make_result(game, round_num):
+    """회차 결과 payload (사다리 구조대로 좌3짝 / 좌4홀 / 우3홀 / 우4짝)"""
+    rng = random.Random(f"{game}:{round_num}")
+    left = rng.random() < 0.5
+    line3 = rng.random() < 0.5
+    return {'r': round_num,
+            's': 'LEFT' if left else 'RIGHT',
+            'l': 3 if line3 else 4,
+            'o': 'ODD' if left != line3 else 'EVEN'}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    publish_delay = 0.0  # 마감 후 결과가 공개되기까지의 지연 (초)
+    skew = 0.0           # 서버 시계가 실제 시각보다 빠른 정도 (초, 음수면 느림)
+    
+    # 장애 주입
+    fail_rate = 0.0      # 503 으로 응답할 확률
+    drop_rate = 0.0      # 응답 없이 연결을 끊을 확률
+    latency = 0.0        # 모든 응답에 더할 지연 (초)
+    outage = None        # (주기, 길이) - 서버 시작 후 주기마다 처음 길이 초 동안 모든 요청에 503
+    started = time.time()
+
+    def inject_fault(self):
+        """장애 주입 설정에 따라 요청을 망가뜨림 (처리했으면 True)"""
+        if self.latency:
+            time.sleep(self.latency)
+        if self.outage and (time.time() - self.started) % self.outage[0] < self.outage[1]:
+            self.send_error(503, explain="outage")
+            return True
+        if random.random() < self.drop_rate:
+            self.close_connection = True
+            self.connection.close()
+            return True
+        if random.random() < self.fail_rate:
+            self.send_response(503)
+            self.send_header('Retry-After', '1')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return True
+        return False
+
+    def server_time(self):
+        return time.time() + self.skew
+
+    def date_time_string(self, timestamp=None):
+        """Date 헤더도 어긋난 서버 시계 기준으로 보냄"""
+        return super().date_time_string(self.server_time() if timestamp is None else timestamp)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = url.path.strip('/').split('/')
+        if len(parts) != 5 or parts[:3] != ['data', 'json', 'games'] or parts[3] not in config:
+            self.send_error(404)
+            return
+
+        if self.inject_fault():
+            return
+
+        game, name = parts[3], parts[4]
+        latest = round_at(game, self.server_time() - self.publish_delay)
+        if name == 'result.json':
+            body = make_result(game, latest)
+            etag = f'"{game}-{latest}"'
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            self.send_json(body, etag)
+            return
+        elif name == 'history.json':
+            query = parse_qs(url.query)
+            try:
+                start = int(query.get('start', [latest - 287])[0])
+                end = min(int(query.get('end', [latest])[0]), latest)
+            except ValueError:
+                self.send_error(400)
+                return
+            body = [make_result(game, round_num) for round_num in range(start, end + 1)]
+        else:
+            self.send_error(404)
+            return
+
+        self.send_json(body)
+
+    def send_json(self, body, etag=None):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        if etag:
+            self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logging.info(f"{self.address_string()} - {format % args}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="결과 API 로컬 대체 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--delay', type=float, default=0.0, help="마감 후 결과 공개 지연 (초)")
+    parser.add_argument('--skew', type=float, default=0.0, help="서버 시계를 실제 시각보다 앞당길 시간 (초)")
+    parser.add_argument('--fail-rate', type=float, default=0.0, help="503 응답 확률")
+    parser.add_argument('--drop-rate', type=float, default=0.0, help="연결을 끊을 확률")
+    parser.add_argument('--latency', type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument('--outage', help="주기:길이 (초) - 예: 120:60 이면 2분마다 1분간 503")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    StubHandler.publish_delay = args.delay
+    StubHandler.skew = args.skew
+    StubHandler.fail_rate = args.fail_rate
+    StubHandler.drop_rate = args.drop_rate
+    StubHandler.latency = args.latency
+    if args.outage:
+        period, length = args.outage.split(':')
+        StubHandler.outage = (float(period), float(length))
+    StubHandler.started = time.time()
+    server = ThreadingHTTPServer((args.host, args.port), StubHandler)
+    logging.info(f"대체 서버 시작: http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+import os
+import sys
+import mmap
+import time
+import copy
+import tempfile
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+from engine import BETTING_PATTERNS, default_betting_methods, result_flags, flags_result
+from backtest import Backtester, load_results
+
+# 로테이션 패턴 후보
+PATTERN_SETS = {
+    'default': BETTING_PATTERNS,
+    'ladder': [  # 사다리 구조상 나올 수 있는 조합만 사용
+        ('pattern1', '좌', '3', '짝'),
+        ('pattern2', '좌', '4', '홀'),
+        ('pattern3', '우', '3', '홀'),
+    ],
+    'mirror': [  # 기본 패턴의 반대 픽
+        ('pattern1', '우', '4', '짝'),
+        ('pattern2', '우', '4', '홀'),
+        ('pattern3', '우', '3', '짝'),
+    ],
+    'fixed': BETTING_PATTERNS[:1],  # 1단계 패턴만 반복
+}
+
+# 워커 프로세스마다 한 번만 여는 과거 결과 (mmap, 작업마다 피클로 보내지 않음)
+_history_file = None
+_history_map = None
+_history_view = None
+_flag_results = [flags_result('', flags) for flags in range(8)]
+
+
+def write_history(results, path):
+    """결과를 회차당 1바이트 플래그 파일로 저장"""
+    with open(path, 'wb') as f:
+        f.write(bytes(result_flags(result) for result in results))
+
+
+def attach_history(path):
+    """워커 초기화: 과거 결과 파일을 읽기 전용 mmap 으로 연결"""
+    global _history_file, _history_map, _history_view
+    _history_file = open(path, 'rb')
+    _history_map = mmap.mmap(_history_file.fileno(), 0, access=mmap.ACCESS_READ)
+    _history_view = memoryview(_history_map)
+
+
+def iter_history():
+    """mmap 위의 플래그를 복사 없이 결과 튜플로 풀어서 순회"""
+    flag_results = _flag_results
+    return (flag_results[flags] for flags in _history_view)
+
+
+def parse_param(text):
+    """'single_bet=15000,20000' 형식의 파라미터 범위 파싱
+
+    martin_steps 는 '5000x10' (5000원씩 10단계) 형식으로 지정한다.
+    """
+    key, values = text.split('=', 1)
+    parsed = []
+    for value in values.split(','):
+        if key == 'martin_steps':
+            base, steps = value.split('x')
+            parsed.append(tuple(int(base) * (step + 1) for step in range(int(steps))))
+        else:
+            parsed.append(int(value))
+    return key, parsed
+
+
+def build_tasks(methods, params, pattern_names):
+    """메소드별로 해당 설정 키가 있는 파라미터만 조합해서 작업 목록 생성"""
+    defaults = default_betting_methods()
+    tasks = []
+    for method in methods:
+        keys = [key for key in params if key in defaults[method]]
+        for values in itertools.product(*(params[key] for key in keys)):
+            overrides = dict(zip(keys, values))
+            for pattern_name in pattern_names:
+                tasks.append((method, overrides, pattern_name))
+    return tasks
+
+
+def run_task(task):
+    """워커에서 한 조합을 백테스트"""
+    method, overrides, pattern_name = task
+    betting_methods = copy.deepcopy(default_betting_methods())
+    for key, value in overrides.items():
+        betting_methods[method][key] = list(value) if isinstance(value, tuple) else value
+
+    report = Backtester(method, betting_methods=betting_methods,
+                        betting_patterns=PATTERN_SETS[pattern_name]).run(iter_history())
+    return {
+        'method': method,
+        'params': overrides,
+        'patterns': pattern_name,
+        'total_profit': report.total_profit,
+        'max_drawdown': report.max_drawdown,
+        'win_rate': report.win_rate,
+        'rounds': report.rounds
+    }
+
+
+def run_sweep(results, tasks, workers=None):
+    """모든 코어에 작업을 나눠 실행 (과거 결과는 임시 파일 mmap 으로 공유)"""
+    fd, path = tempfile.mkstemp(prefix='sweep_history_', suffix='.bin')
+    os.close(fd)
+    try:
+        write_history(results, path)
+        with ProcessPoolExecutor(max_workers=workers, initializer=attach_history, initargs=(path,)) as executor:
+            chunksize = max(1, len(tasks) // ((workers or os.cpu_count() or 1) * 4))
+            return list(executor.map(run_task, tasks, chunksize=chunksize))
+    finally:
+        os.remove(path)
+
+
+def format_params(row):
+    params = ', '.join(f"{key}={value[0]}x{len(value)}" if isinstance(value, tuple) else f"{key}={value:,}"
+                       for key, value in row['params'].items())
+    return f"{row['method']} [{row['patterns']}] {params}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="베팅 금액/로테이션 패턴 파라미터 탐색")
+    parser.add_argument('results', help="result.json 응답 JSON Lines 파일 또는 .arc 보관소")
+    parser.add_argument('--method', nargs='+', default=['method1', 'method2', 'method3', 'method4', 'method5'])
+    parser.add_argument('--param', action='append', default=[],
+                        help="예: single_bet=15000,20000  hedge_bet=0,15000  martin_steps=5000x10,3000x12")
+    parser.add_argument('--patterns', default='default', help=f"쉼표로 구분 ({', '.join(PATTERN_SETS)})")
+    parser.add_argument('--sort', default='total_profit', choices=['total_profit', 'max_drawdown', 'win_rate'])
+    parser.add_argument('--top', type=int, default=20)
+    parser.add_argument('--workers', type=int)
+    args = parser.parse_args(argv)
+
+    results = load_results(args.results)
+    params = dict(parse_param(text) for text in args.param)
+    tasks = build_tasks(args.method, params, args.patterns.split(','))
+
+    started = time.perf_counter()
+    rows = run_sweep(results, tasks, args.workers)
+    elapsed = time.perf_counter() - started
+
+    # 낙폭은 작을수록, 나머지는 클수록 좋은 순서
+    rows.sort(key=lambda row: row[args.sort], reverse=args.sort != 'max_drawdown')
+    print(f"{len(tasks)}개 조합 x {len(results)}회차 ({elapsed:.1f}s)")
+    for rank, row in enumerate(rows[:args.top], 1):
+        print(f"{rank:3d}. {format_params(row)} | 순수익 {row['total_profit']:,.0f}원, "
+              f"최대낙폭 {row['max_drawdown']:,.0f}원, 승률 {row['win_rate']:.1f}%")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,4 @@
 import tkinter as tk
-from tkinter import ttk
 import requests
 from bs4 import BeautifulSoup
 import threading
@@ -7,8 +6,24 @@ import time
 import logging
 from datetime import datetime, timedelta
 import random  # 랜덤 모듈 추가
-from timer import get_timer_remaining_time  # 타이머 임포트
+from timer import get_timer_remaining_time, SecondTicker  # 타이머 임포트
 import os
+import argparse
+import queue
+from collections import deque
+from fetcher import ResultFetcher, GAMES, MAIN_GAME, GAME_NAMES
+from stats import ResultStats
+from round_store import RoundStore
+from archive import ResultArchive
+from clock_sync import ClockSync
+from resilience import HEALTH_OK, HEALTH_NAMES
+from strategies import STRATEGIES, create_strategy, ShadowRunner
+from session_state import SessionJournal
+from metrics import METRICS, MetricsServer
+from views import TkView, create_view
+from engine import BettingEngine, PATTERN_NAMES, MARKET_NAMES, describe_bets, is_martingale, martin_stake
+from log_sink import (BufferedLogWriter, LOG_HEADER_PATTERN, log_file_path, format_log_header,
+                      parse_log_header, previous_log_hour, read_log_tail)
 
 # 로깅 설정
 logging.basicConfig(
@@ -20,45 +35,23 @@ logging.basicConfig(
     ]
 )
 
-class RoundInfo:
-    def __init__(self, round_num):
-        self.round_num = round_num
-        self.bets = {
-            'singles': [],  # [(type, value, amount), ...]
-            'combo': None   # (direction, line, amount)
-        }
-        self.result = None  # (direction, line, parity)
-        self.profit = 0
-        self.win_amount = 0
-        self.total_bet = 0
-        self.correct_picks = 0
-        self.total_picks = 0
-        self.pattern_type = None
-
 class LadderGameGUI:
-    def __init__(self, root):
+    def __init__(self, root, start_fetcher=True, view=None, metrics_port=None):
         self.root = root
+        # 위젯을 만드는 화면 계층 (화면 없이 실행할 때는 views.NullView)
+        self.view = view if view is not None else TkView(root)
         self.root.title("MINSU")
         self.root.geometry("700x740")
         
-        # 자산 및 베팅 정보 초기화
-        self.initial_asset = 500000  # 초기 자산 50만원
-        self.current_asset = self.initial_asset
-        self.base_bet = 30000  # 기본 베팅 금액 (단식 각각 3만원)
-        self.current_bet = self.base_bet
-        self.hedge_bet = 20000  # 부분 헤징: 1픽 적중시 손실 -22,100원, 0픽+조합 성공시 -8,000원
-        self.total_profit = 0
-        self.win_count = 0
-        self.lose_count = 0
-        self.total_net_profit = 0  # 순수익 합계 추가
-        
         # 베팅 모드 설정
-        self.betting_mode = tk.StringVar(value="rotation")  # 기본값: 로테이션
-        self.betting_method = tk.StringVar(value="method1")  # 기본값: 방법1
+        self.betting_mode = self.view.StringVar(value="rotation")  # 기본값: 로테이션
+        self.betting_method = self.view.StringVar(value="method1")  # 기본값: 방법1
+        self.strategy_name = self.view.StringVar(value=next(iter(STRATEGIES.values())).label)  # 전략 모드에서 사용할 전략
+        self.strategies = {name: create_strategy(name) for name in STRATEGIES}
         self.selected_picks = {
-            'pick1': tk.StringVar(value='좌'),
-            'pick2': tk.StringVar(value='3'),
-            'pick3': tk.StringVar(value='홀')
+            'pick1': self.view.StringVar(value='좌'),
+            'pick2': self.view.StringVar(value='3'),
+            'pick3': self.view.StringVar(value='홀')
         }
         
         # 로그 파일 경로 설정
@@ -66,10 +59,44 @@ class LadderGameGUI:
         if not os.path.exists(self.log_directory):
             os.makedirs(self.log_directory)
         self.current_log_file = None
+        self.log_writer = BufferedLogWriter(flush_interval=2.0, max_buffer=50)
+        # 워커 스레드(결과 수집, 로그 읽기) 가 Tk 메인 스레드로 보내는 메시지 (poll_results 가 비움)
+        self.result_queue = queue.Queue()
         self.update_log_file()
         
+        # 관측한 모든 회차 결과 보관소 (시작할 때 통계/결과 목록을 여기서 채움)
+        self.archive = ResultArchive(os.path.join(self.log_directory, f'{MAIN_GAME}.arc'))
+        
+        # 회차 결과/베팅 정보 저장소 (최근 회차만 메모리에, 지난 결과는 보관소에서 읽음)
+        self.round_store = RoundStore(os.path.join(self.log_directory, 'rounds.db'), horizon=1000,
+                                      archive=self.archive)
+        self.game_results = self.round_store.results  # 최신순 결과 (읽기 전용으로 사용)
+        
+        # 베팅하지 않는 나머지 게임은 최근 결과만 게임별로 보관 (최신순)
+        self.game_stores = {game: deque(maxlen=100) for game in GAMES if game != MAIN_GAME}
+        
+        # 베팅/정산 엔진 (초기 자산 50만원, 배당률/베팅 패턴/베팅 방법별 금액은 engine 기본값)
+        # 세션 상태는 저널에 기록하고, 재시작하면 마지막 상태(자산/승패/마틴 단계/패턴 순서)를 복원
+        self.session_journal = SessionJournal(os.path.join(self.log_directory, 'session.db'))
+        self.engine = BettingEngine(initial_asset=500000, rounds=self.round_store, journal=self.session_journal)
+        self.session_restored = self.session_journal.restore(self.engine)
+        if self.session_restored:
+            self.restore_selection(self.engine.selection)
+        
+        # 서버 시계 차이 추정 (타이머와 조회 스케줄러가 함께 사용)
+        self.clock_sync = ClockSync()
+        
+        # 화면 갱신: 상태가 바뀌면 구역만 표시해 두고 다음 유휴 시점에 한 번만 그림
+        # (같은 회차에서 여러 번 바뀌어도 위젯에는 마지막 값만, 그마저 이전과 같으면 넣지 않음)
+        self.dirty_views = set()
+        self.render_scheduled = False
+        self.label_options = {}  # 레이블별 마지막으로 넣은 설정
+        self.status_text = "마지막 업데이트: -"
+        self.pending_log = []  # 아직 화면에 추가하지 않은 베팅 내역
+        self.current_bet_text = "현재베팅: -"
+        
         # 메인 프레임
-        self.main_frame = ttk.Frame(root, padding="10")
+        self.main_frame = self.view.Frame(root, padding="10")
         self.main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # GUI 컴포넌트 초기화
@@ -77,41 +104,22 @@ class LadderGameGUI:
         self.create_result_display()
         self.create_stats_display()
         self.create_prediction_display()
+        self.load_archived_results()
         
         # 상태 표시 레이블
-        self.status_label = ttk.Label(self.main_frame, text="마지막 업데이트: -")
+        self.status_label = self.view.Label(self.main_frame, text="마지막 업데이트: -")
         self.status_label.grid(row=3, column=0, columnspan=2, sticky=tk.W, padx=5, pady=5)
         
         # 프로그램 시작 로그 기록
         self.add_log("=== 프로그램 시작 ===")
+        if self.session_restored:
+            self.add_log(f"- 이전 세션 복원: 현재자산 {self.engine.current_asset:,}원, "
+                         f"{self.engine.win_count}승 {self.engine.lose_count}패 (마지막 회차: {self.engine.current_round})")
+            self.update_asset_labels()
         
         # 프로그램 종료 시 이벤트 바인딩
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
-        # 배당률 설정
-        self.odds = {
-            'single': 1.93,  # 단식 배당 (좌우/홀짝/3줄4줄)
-            'combination': 3.6  # 조합 배당 (좌우+3줄4줄)
-        }
-        
-        # 베팅 패턴 (3단계 로테이션)
-        self.betting_patterns = [
-            ('pattern1', '좌', '3', '홀'),  # 1단계: 좌+3+홀
-            ('pattern2', '좌', '3', '짝'),  # 2단계: 좌+3+짝
-            ('pattern3', '좌', '4', '홀'),  # 3단계: 좌+4+홀
-        ]
-        self.current_pattern_index = 0
-        
-        # 예측 및 베팅 정보
-        self.current_round = None
-        self.next_round = None
-        self.current_prediction = None
-        self.next_prediction = None
-        self.betting_start_round = None
-        
-        # 라운드 정보 추적을 위한 딕셔너리
-        self.rounds = {}  # {round_num: RoundInfo}
-        
         # HTTP 세션 초기화
         self.session = requests.Session()
         self.session.headers.update({
@@ -128,105 +136,97 @@ class LadderGameGUI:
             'Upgrade-Insecure-Requests': '1'
         })
         
-        # 데이터 초기화
-        self.game_results = []
-        self.last_round = None
-        self.previous_prediction = None
-        
-        # 베팅 방법별 금액 설정
-        self.betting_methods = {
-            'method1': {  # 전체 단식 금액 축소
-                'single_bet': 20000,  # 단식 각 2만원
-                'hedge_bet': 15000,   # 조합 1.5만원
-                'picks_count': 3      # 3픽 고정
-            },
-            'method2': {  # 픽별 가중치
-                'single_bet_a': 30000,  # 주력픽 3만원
-                'single_bet_bc': 20000, # 나머지 픽 2만원
-                'hedge_bet': 15000,     # 조합 1.5만원
-                'picks_count': 3        # 3픽 고정
-            },
-            'method3': {  # 2픽 + 찬스픽
-                'single_bet': 25000,    # 기본 2픽 각 2.5만원
-                'chance_bet': 25000,    # 찬스픽 2.5만원
-                'hedge_bet': 15000,     # 조합 1.5만원
-                'picks_count': 2        # 기본 2픽 (찬스픽 추가 가능)
-            },
-            'method4': {  # 다중 조합
-                'single_bet': 25000,    # 단식 각 2.5만원
-                'hedge_bet1': 10000,    # 주 조합 1만원
-                'hedge_bet2': 5000,     # 부 조합 5천원
-                'picks_count': 3        # 3픽 고정
-            },
-            'method5': {  # 시스템 마틴
-                'base_bet': 5000,       # 기본 배팅 금액
-                'martin_steps': [5000, 10000, 15000, 20000, 25000, 30000, 35000, 40000, 45000, 50000],  # 10단계 마틴
-                'current_step': 0,      # 현재 마틴 단계
-                'picks_count': 3,       # 3픽 고정
-                'use_hedge': False      # 조합 베팅 사용 안함
-            }
-        }
-        
-        # 데이터 업데이트 시작
-        self.update_data()
+        # 백그라운드 데이터 수집 시작 (네트워크 대기는 워커 스레드에서 처리)
+        self.queue_poll_interval = 100  # 큐 확인 주기 (ms)
+        self.health_text = ''  # 서버 상태가 정상이 아닐 때 상태 표시줄에 덧붙이는 문구
+        self.fetcher = ResultFetcher(self.session, self.result_queue, games=GAMES,
+                                     clock_sync=self.clock_sync)
+        if start_fetcher:  # 벤치마크 등에서는 결과를 직접 넣으므로 네트워크 조회를 하지 않음
+            self.fetcher.start()
+        self.poll_results()
 
+        # 성능 지표: F12 디버그 패널, 1분마다 파일 저장
+        # metrics_port 를 주면 로컬 엔드포인트도 엶 (예: http://127.0.0.1:8790/metrics)
+        self.debug_panel = None
+        self.root.bind('<F12>', self.toggle_debug_panel)
+        self.metrics_path = os.path.join(self.log_directory, 'metrics.json')
+        self.metrics_dump_interval = 60 * 1000
+        self.root.after(self.metrics_dump_interval, self.dump_metrics)
+        self.metrics_server = None
+        if metrics_port is not None:
+            try:
+                self.metrics_server = MetricsServer(METRICS, port=metrics_port)
+                self.metrics_server.start()
+            except OSError as e:
+                self.metrics_server = None
+                logging.warning(f"성능 지표 엔드포인트를 열 수 없습니다: {e}")
+        
         # 베팅 모드와 방법 변경 이벤트 바인딩
         self.betting_mode.trace_add("write", self.on_betting_change)
         self.betting_method.trace_add("write", self.on_betting_change)
         self.selected_picks['pick3'].trace_add("write", self.on_betting_change)
+        self.strategy_name.trace_add("write", self.on_betting_change)
 
     def create_asset_display(self):
         # 자산 정보 표시 프레임
-        asset_frame = ttk.LabelFrame(self.main_frame, text="내 정보", padding="5")
+        asset_frame = self.view.LabelFrame(self.main_frame, text="내 정보", padding="5")
         asset_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
         
         # 왼쪽 프레임 (자산 정보용)
-        left_frame = ttk.Frame(asset_frame)
+        left_frame = self.view.Frame(asset_frame)
         left_frame.grid(row=0, column=0, sticky=(tk.W, tk.N, tk.S))
         
         # 오른쪽 프레임 (타이머용)
-        right_frame = ttk.Frame(asset_frame)
+        right_frame = self.view.Frame(asset_frame)
         right_frame.grid(row=0, column=1, sticky=(tk.E, tk.N, tk.S))
         
         # 자산 정보 레이블 (왼쪽)
         self.asset_labels = {
-            '초기자산': ttk.Label(left_frame, text=f"초기자산: {self.initial_asset:,}원"),
-            '현재자산': ttk.Label(left_frame, text=f"현재자산: {self.current_asset:,}원"),
-            '총수익': ttk.Label(left_frame, text=f"총수익: {self.total_profit:,}원"),
-            '순수익합계': ttk.Label(left_frame, text=f"순수익 합계: {self.total_net_profit:,}원"),
-            '승률': ttk.Label(left_frame, text="승률: 0%"),
-            '현재베팅': ttk.Label(left_frame, text="현재베팅: -")
+            '초기자산': self.view.Label(left_frame, text=f"초기자산: {self.engine.initial_asset:,}원"),
+            '현재자산': self.view.Label(left_frame, text=f"현재자산: {self.engine.current_asset:,}원"),
+            '총수익': self.view.Label(left_frame, text=f"총수익: {self.engine.total_profit:,}원"),
+            '순수익합계': self.view.Label(left_frame, text=f"순수익 합계: {self.engine.total_net_profit:,}원"),
+            '승률': self.view.Label(left_frame, text="승률: 0%"),
+            '현재베팅': self.view.Label(left_frame, text="현재베팅: -")
         }
         
         # 타이머 레이블 (오른쪽)
-        self.timer_label = ttk.Label(right_frame, text="남은 시간: --분 --초", font=('Arial', 12, 'bold'))
+        self.timer_label = self.view.Label(right_frame, text="남은 시간: --분 --초", font=('Arial', 12, 'bold'))
         self.timer_label.grid(row=0, column=0, padx=10, pady=5)
         
+        # 다른 게임의 최근 회차와 남은 시간 (오른쪽, 타이머 아래)
+        self.game_labels = {}
+        for row, game in enumerate(self.game_stores, 1):
+            self.game_labels[game] = self.view.Label(right_frame, text=f"{GAME_NAMES[game]}: -")
+            self.game_labels[game].grid(row=row, column=0, sticky=tk.W, padx=10)
+        
         # 배치 (왼쪽 프레임)
         row = 0
         for label in self.asset_labels.values():
             label.grid(row=row, column=0, sticky=tk.W, padx=5, pady=2)
             row += 1
         
-        # 타이머 업데이트 시작
-        self.update_timer()
+        # 타이머 업데이트 시작 (정각 초마다 호출)
+        self.timer_ticker = SecondTicker(self.root.after, self.update_timer,
+                                         clock=self.clock_sync.now, cancel=self.root.after_cancel)
+        self.timer_ticker.start()
 
     def create_result_display(self):
         # 결과 표시 프레임
-        result_frame = ttk.LabelFrame(self.main_frame, text="게임 결과", padding="5")
+        result_frame = self.view.LabelFrame(self.main_frame, text="게임 결과", padding="5")
         result_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
         
         # 왼쪽 프레임 (트리뷰와 베팅내역용)
-        left_frame = ttk.Frame(result_frame)
+        left_frame = self.view.Frame(result_frame)
         left_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # 오른쪽 프레임 (베팅 모드와 설정용)
-        right_frame = ttk.Frame(result_frame)
+        right_frame = self.view.Frame(result_frame)
         right_frame.grid(row=0, column=1, sticky=(tk.N, tk.S), padx=10)
         
         # 결과 표시 트리뷰
         columns = ('회차', '방향', '줄수', '홀짝', '베팅금', '순이익')
-        self.result_tree = ttk.Treeview(left_frame, columns=columns, show='headings', height=15)
+        self.result_tree = self.view.Treeview(left_frame, columns=columns, show='headings', height=15)
         
         # 컬럼 설정
         total_width = 0
@@ -241,30 +241,56 @@ class LadderGameGUI:
             total_width += width
         
         # 트리뷰 스타일 설정
-        style = ttk.Style()
+        style = self.view.Style()
         style.configure("Winner.Treeview.Row", background="lightgreen")
         
+        # 트리뷰 태그 설정
+        self.result_tree.tag_configure('winner', foreground='blue')
+        self.result_tree.tag_configure('loser', foreground='red')
+        
+        # 트리뷰 표시 범위 (오래된 행은 스크롤을 끝까지 내릴 때 페이지 단위로 표시)
+        self.tree_base_limit = 100
+        self.tree_visible_limit = self.tree_base_limit
+        self.tree_page_size = 100
+        self.tree_at_top = True  # 맨 위(최신 회차)를 보고 있는지
+        self.tree_rows = deque()  # 화면에 있는 회차 (최신순)
+        
         # 트리뷰 스크롤바
-        tree_scrollbar = ttk.Scrollbar(left_frame, orient=tk.VERTICAL, command=self.result_tree.yview)
-        self.result_tree.configure(yscrollcommand=tree_scrollbar.set)
+        self.tree_scrollbar = self.view.Scrollbar(left_frame, orient=tk.VERTICAL, command=self.result_tree.yview)
+        self.result_tree.configure(yscrollcommand=self.on_tree_scroll)
         
         # 트리뷰 배치
         self.result_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        tree_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.tree_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
         
         # 베팅 내역 프레임
-        log_frame = ttk.LabelFrame(left_frame, text="베팅 내역", padding="5")
+        log_frame = self.view.LabelFrame(left_frame, text="베팅 내역", padding="5")
         log_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
         
         # 베팅 내역 텍스트 위젯 설정
         char_width = total_width // 7
-        self.log_text = tk.Text(log_frame, height=12, width=char_width, wrap=tk.WORD)
+        self.log_text = self.view.Text(log_frame, height=12, width=char_width, wrap=tk.WORD)
         self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # 스크롤바 설정
-        log_scrollbar = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, command=self.log_text.yview)
+        log_scrollbar = self.view.Scrollbar(log_frame, orient=tk.VERTICAL, command=self.log_text.yview)
         log_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        self.log_text.configure(yscrollcommand=log_scrollbar.set)
+        self.log_scrollbar = log_scrollbar
+        self.log_text.configure(yscrollcommand=self.on_log_scroll)
+        
+        # 이전 내역 불러오기 버튼
+        self.view.Button(log_frame, text="이전 내역 더 보기", command=self.load_older_log).grid(
+            row=1, column=0, sticky=tk.W, pady=(5, 0))
+        
+        # 화면에 유지할 최대 줄 수 (넘으면 오래된 줄을 묶어서 삭제)
+        self.max_log_lines = 500
+        self.log_trim_batch = 100
+        # 시작시/추가 로딩시 파일 끝에서부터 읽어 올 최대 크기
+        self.log_load_bytes = 32 * 1024
+        self.log_page_bytes = 32 * 1024
+        self.log_loading = False
+        # 화면 맨 위 내용이 시작되는 파일 위치 (시간대, 바이트 오프셋)
+        self.log_cursor = (datetime.now().replace(minute=0, second=0, microsecond=0), 0)
         
         # 저장된 베팅 내역 불러오기
         self.load_betting_log()
@@ -273,78 +299,101 @@ class LadderGameGUI:
         self.log_text.bind('<KeyRelease>', lambda e: self.log_text.see(tk.END))
         
         # 베팅 모드 선택 프레임 (오른쪽에 배치)
-        mode_frame = ttk.LabelFrame(right_frame, text="베팅 모드", padding="5")
+        mode_frame = self.view.LabelFrame(right_frame, text="베팅 모드", padding="5")
         mode_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=5, pady=5)
         
         # 로테이션/선택 모드
-        ttk.Radiobutton(mode_frame, text="로테이션", variable=self.betting_mode, 
-                       value="rotation").grid(row=0, column=0, sticky=tk.W, padx=5, pady=2)
-        ttk.Radiobutton(mode_frame, text="선택", variable=self.betting_mode, 
-                       value="custom").grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
+        self.view.Radiobutton(mode_frame, text="로테이션", variable=self.betting_mode, 
+                             value="rotation").grid(row=0, column=0, sticky=tk.W, padx=5, pady=2)
+        self.view.Radiobutton(mode_frame, text="선택", variable=self.betting_mode, 
+                             value="custom").grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
+        self.view.Radiobutton(mode_frame, text="전략", variable=self.betting_mode, 
+                             value="strategy").grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
+        self.view.Combobox(mode_frame, textvariable=self.strategy_name,
+                          values=[cls.label for cls in STRATEGIES.values()],
+                          state='readonly', width=12).grid(row=3, column=0, sticky=tk.W, padx=5, pady=2)
         
         # 베팅 방법 선택
-        method_frame = ttk.LabelFrame(right_frame, text="베팅 방법", padding="5")
+        method_frame = self.view.LabelFrame(right_frame, text="베팅 방법", padding="5")
         method_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), padx=5, pady=5)
         
-        ttk.Radiobutton(method_frame, text="방법1: 전체 단식 축소", variable=self.betting_method, 
-                       value="method1").grid(row=0, column=0, sticky=tk.W, padx=5, pady=2)
-        ttk.Radiobutton(method_frame, text="방법2: 픽별 가중치", variable=self.betting_method, 
-                       value="method2").grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
-        ttk.Radiobutton(method_frame, text="방법3: 2픽+찬스픽", variable=self.betting_method, 
-                       value="method3").grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
-        ttk.Radiobutton(method_frame, text="방법4: 다중 조합", variable=self.betting_method, 
-                       value="method4").grid(row=3, column=0, sticky=tk.W, padx=5, pady=2)
-        ttk.Radiobutton(method_frame, text="방법5: 시스템 마틴", variable=self.betting_method, 
-                       value="method5").grid(row=4, column=0, sticky=tk.W, padx=5, pady=2)
+        self.view.Radiobutton(method_frame, text="방법1: 전체 단식 축소", variable=self.betting_method, 
+                             value="method1").grid(row=0, column=0, sticky=tk.W, padx=5, pady=2)
+        self.view.Radiobutton(method_frame, text="방법2: 픽별 가중치", variable=self.betting_method, 
+                             value="method2").grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
+        self.view.Radiobutton(method_frame, text="방법3: 2픽+찬스픽", variable=self.betting_method, 
+                             value="method3").grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
+        self.view.Radiobutton(method_frame, text="방법4: 다중 조합", variable=self.betting_method, 
+                             value="method4").grid(row=3, column=0, sticky=tk.W, padx=5, pady=2)
+        self.view.Radiobutton(method_frame, text="방법5: 시스템 마틴", variable=self.betting_method, 
+                             value="method5").grid(row=4, column=0, sticky=tk.W, padx=5, pady=2)
         
         # 선택 모드 콤보박스 프레임
-        combo_frame = ttk.LabelFrame(right_frame, text="선택 설정", padding="5")
+        combo_frame = self.view.LabelFrame(right_frame, text="선택 설정", padding="5")
         combo_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), padx=5, pady=5)
         
         # 세 개의 픽 선택
-        ttk.Label(combo_frame, text="첫번째 픽:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=2)
-        ttk.Combobox(combo_frame, textvariable=self.selected_picks['pick1'], 
-                    values=['좌', '우', '3', '4', '홀', '짝'], 
-                    state='readonly', width=5).grid(row=0, column=1, padx=5)
-        
-        ttk.Label(combo_frame, text="두번째 픽:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
-        ttk.Combobox(combo_frame, textvariable=self.selected_picks['pick2'], 
-                    values=['좌', '우', '3', '4', '홀', '짝'], 
-                    state='readonly', width=5).grid(row=1, column=1, padx=5)
-        
-        ttk.Label(combo_frame, text="세번째 픽:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
-        ttk.Combobox(combo_frame, textvariable=self.selected_picks['pick3'], 
-                    values=['좌', '우', '3', '4', '홀', '짝', '없음'], 
-                    state='readonly', width=5).grid(row=2, column=1, padx=5)
+        self.view.Label(combo_frame, text="첫번째 픽:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=2)
+        self.view.Combobox(combo_frame, textvariable=self.selected_picks['pick1'], 
+                          values=['좌', '우', '3', '4', '홀', '짝'], 
+                          state='readonly', width=5).grid(row=0, column=1, padx=5)
+        
+        self.view.Label(combo_frame, text="두번째 픽:").grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
+        self.view.Combobox(combo_frame, textvariable=self.selected_picks['pick2'], 
+                          values=['좌', '우', '3', '4', '홀', '짝'], 
+                          state='readonly', width=5).grid(row=1, column=1, padx=5)
+        
+        self.view.Label(combo_frame, text="세번째 픽:").grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
+        self.view.Combobox(combo_frame, textvariable=self.selected_picks['pick3'], 
+                          values=['좌', '우', '3', '4', '홀', '짝', '없음'], 
+                          state='readonly', width=5).grid(row=2, column=1, padx=5)
 
     def create_stats_display(self):
         # 통계 표시 프레임
-        stats_frame = ttk.LabelFrame(self.main_frame, text="통계", padding="5")
+        stats_frame = self.view.LabelFrame(self.main_frame, text="통계", padding="5")
         stats_frame.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
         
+        # 결과가 들어올 때마다 갱신되는 누적 통계
+        self.stats = ResultStats(windows=(20, 50, 100))
+        
+        # 통계 구간 선택 (전체 / 최근 N회)
+        self.stats_window = self.view.StringVar(value='전체')
+        window_frame = self.view.Frame(stats_frame)
+        window_frame.grid(row=0, column=0, sticky=tk.W, padx=5, pady=2)
+        self.view.Label(window_frame, text="구간:").grid(row=0, column=0, sticky=tk.W)
+        self.view.Combobox(window_frame, textvariable=self.stats_window,
+                          values=['전체'] + [str(window) for window in self.stats.windows],
+                          state='readonly', width=5).grid(row=0, column=1, padx=5)
+        self.stats_window.trace_add("write", lambda *args: self.update_stats())
+        
         # 통계 레이블
         self.stats_labels = {
-            '좌우비율': ttk.Label(stats_frame, text="좌우 비율: "),
-            '줄수비율': ttk.Label(stats_frame, text="3줄/4줄 비율: "),
-            '홀짝비율': ttk.Label(stats_frame, text="홀짝 비율: ")
+            '좌우비율': self.view.Label(stats_frame, text="좌우 비율: "),
+            '줄수비율': self.view.Label(stats_frame, text="3줄/4줄 비율: "),
+            '홀짝비율': self.view.Label(stats_frame, text="홀짝 비율: "),
+            '연속': self.view.Label(stats_frame, text="연속: "),
+            '섀도우': self.view.Label(stats_frame, text="전략 비교: -")
         }
         
+        # 모든 전략을 실제 베팅 없이 같은 결과로 돌려보는 비교 (방법1 기준)
+        self.shadow_runner = ShadowRunner(method='method1')
+        
         # 배치
-        row = 0
+        row = 1
         for label in self.stats_labels.values():
             label.grid(row=row, column=0, sticky=tk.W, padx=5, pady=2)
             row += 1
 
     def create_prediction_display(self):
         # 예측 표시 프레임
-        prediction_frame = ttk.LabelFrame(self.main_frame, text="다음 회차 예측", padding="5")
+        prediction_frame = self.view.LabelFrame(self.main_frame, text="다음 회차 예측", padding="5")
         prediction_frame.grid(row=2, column=1, sticky=(tk.W, tk.E, tk.N, tk.S), padx=5, pady=5)
         
         # 예측 레이블
         self.prediction_labels = {
-            '방향': ttk.Label(prediction_frame, text="예상 방향: "),
-            '줄수': ttk.Label(prediction_frame, text="예상 줄수: "),
-            '홀짝': ttk.Label(prediction_frame, text="예상 홀짝: ")
+            '방향': self.view.Label(prediction_frame, text="예상 방향: "),
+            '줄수': self.view.Label(prediction_frame, text="예상 줄수: "),
+            '홀짝': self.view.Label(prediction_frame, text="예상 홀짝: ")
         }
         
         # 배치
@@ -358,6 +407,12 @@ class LadderGameGUI:
         current_time = datetime.now()
         log_filename = f"betting_log_{current_time.strftime('%Y%m%d_%H')}.txt"
         self.current_log_file = os.path.join(self.log_directory, log_filename)
+        self.log_writer.rotate(self.current_log_file)
+        
+        # 프로그램 실행 중 시간대가 바뀌면 화면에 구분선 표시
+        if hasattr(self, 'log_text'):
+            self.pending_log.append(format_log_header(current_time))
+            self.mark_dirty('log')
         
         # 1시간마다 이 함수를 다시 호출
         next_hour = (current_time + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
@@ -369,413 +424,357 @@ class LadderGameGUI:
         current_time = datetime.now().strftime("%H:%M:%S")
         log_entry = f"[{current_time}] {message}\n"
         
-        # 텍스트 위젯에 추가 (끝에 추가)
-        self.log_text.insert(tk.END, log_entry)
+        # 텍스트 위젯에는 render 에서 모아서 한 번에 추가
+        self.pending_log.append(log_entry)
+        self.mark_dirty('log')
         
-        # 파일에 저장
-        try:
-            with open(self.current_log_file, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
-        except Exception as e:
-            logging.error(f"로그 파일 저장 중 오류 발생: {e}")
-        
-        # 스크롤을 최하단으로
+        # 파일에 저장 (버퍼에 모았다가 백그라운드에서 기록)
+        self.log_writer.write(log_entry)
+
+    def render_log(self):
+        """쌓인 로그를 텍스트 위젯 끝에 한 번에 추가하고 최하단으로 스크롤"""
+        if not self.pending_log:
+            return
+        self.log_text.insert(tk.END, ''.join(self.pending_log))
+        self.pending_log = []
+        self.trim_log_text()
         self.log_text.see(tk.END)
 
     def load_betting_log(self):
-        """현재 시간대의 베팅 내역 로그를 불러옴"""
+        """현재 시간대부터 거꾸로 최근 기록의 끝부분만 읽어 한 번에 표시"""
         try:
             # 텍스트 위젯 초기화
             self.log_text.delete('1.0', tk.END)
             
-            # 현재 시간대의 로그 파일 불러오기
-            if os.path.exists(self.current_log_file):
-                with open(self.current_log_file, 'r', encoding='utf-8') as f:
-                    log_content = f.read()
-                    self.log_text.insert(tk.END, log_content)
+            current_hour = datetime.now().replace(minute=0, second=0, microsecond=0)
+            self.log_cursor = (current_hour, 0)
             
-            # 이전 시간대의 로그 파일도 불러오기 (최근 3시간)
-            current_time = datetime.now()
-            for i in range(1, 4):  # 이전 3시간의 로그
-                past_time = current_time - timedelta(hours=i)
-                past_log_file = os.path.join(
-                    self.log_directory,
-                    f"betting_log_{past_time.strftime('%Y%m%d_%H')}.txt"
-                )
-                if os.path.exists(past_log_file):
-                    with open(past_log_file, 'r', encoding='utf-8') as f:
-                        log_content = f.read()
-                        if log_content.strip():  # 내용이 있는 경우에만 추가
-                            self.log_text.insert('1.0', f"\n=== {past_time.strftime('%Y-%m-%d %H시')} 기록 ===\n")
-                            self.log_text.insert('1.0', log_content)
+            # 현재 시간대부터 최근 3시간까지 거꾸로 읽되 전체 log_load_bytes 를 넘지 않도록
+            # 각 파일의 끝부분만 읽음 (화면 내용이 항상 연속된 구간이 되도록 유지)
+            parts = []
+            budget = self.log_load_bytes
+            for i in range(4):
+                hour = current_hour - timedelta(hours=i)
+                log_file = log_file_path(self.log_directory, hour)
+                if not os.path.exists(log_file):
+                    if i == 0:
+                        parts.append(format_log_header(hour))
+                    continue
+                log_content, start = read_log_tail(log_file, max_bytes=budget)
+                if i > 0 and not log_content.strip():  # 이전 시간대는 내용이 있는 경우에만 추가
+                    continue
+                parts.append((format_log_header(hour) if start == 0 else '') + log_content)
+                self.log_cursor = (hour, start)
+                budget -= len(log_content.encode('utf-8'))
+                if start > 0 or budget <= 0:
+                    break
+            
+            # 오래된 순서로 조립해서 한 번에 추가
+            self.log_text.insert(tk.END, ''.join(reversed(parts)))
             
             # 스크롤을 최하단으로
             self.log_text.see(tk.END)
         except Exception as e:
             logging.error(f"로그 파일 불러오기 중 오류 발생: {e}")
 
-    def update_result_tree(self):
-        # 기존 항목 삭제
-        for item in self.result_tree.get_children():
-            self.result_tree.delete(item)
-        
-        # 트리뷰 태그 설정
-        self.result_tree.tag_configure('winner', foreground='blue')
-        self.result_tree.tag_configure('loser', foreground='red')
+    def trim_log_text(self):
+        """최대 줄 수를 넘으면 가장 오래된 줄들을 한 번에 삭제"""
+        line_count = int(self.log_text.index('end-1c').split('.')[0])
+        if line_count <= self.max_log_lines + self.log_trim_batch:
+            return
         
-        # 새 데이터 추가
-        for result in self.game_results:
-            round_num, direction, line, parity = result
-            
-            # 베팅 시작 회차 이후의 결과에 대해서만 승리 여부 확인
-            if self.betting_start_round and int(round_num) >= int(self.betting_start_round):
-                round_info = self.rounds.get(round_num)
-                if round_info:
-                    # 총 베팅금과 당첨금을 비교하여 실제 이익이 있는지 확인
-                    total_win = round_info.win_amount
-                    total_bet = round_info.total_bet
-                    net_profit = total_win - total_bet
-                    
-                    if net_profit > 0:  # 실제 이익이 있을 때만 별표시
-                        result = (f"★{round_num}", direction, line, parity, 
-                                f"{total_bet:,}", f"+{net_profit:,}")
-                    else:
-                        result = (round_num, direction, line, parity, 
-                                f"{total_bet:,}", f"{net_profit:,}")
-                else:
-                    result = (round_num, direction, line, parity, "-", "-")
-            else:
-                result = (round_num, direction, line, parity, "-", "-")
+        cut_index = f"{line_count - self.max_log_lines + 1}.0"
+        removed = self.log_text.get('1.0', cut_index)
+        self.log_text.delete('1.0', cut_index)
+        
+        # 삭제한 만큼 파일 위치를 앞으로 옮김 (구분선이 지나갔으면 해당 시간대로 이동)
+        hour, offset = self.log_cursor
+        last_header = None
+        for last_header in LOG_HEADER_PATTERN.finditer(removed):
+            pass
+        if last_header:
+            hour = parse_log_header(last_header)
+            offset = len(removed[last_header.end() + 1:].encode('utf-8'))
+        else:
+            offset += len(removed.encode('utf-8'))
+        self.log_cursor = (hour, offset)
+
+    def on_log_scroll(self, first, last):
+        """베팅 내역을 맨 위까지 올리면 이전 기록을 이어서 불러옴"""
+        self.log_scrollbar.set(first, last)
+        if float(first) <= 0.0 and float(last) < 1.0:
+            self.load_older_log()
+
+    def load_older_log(self):
+        """화면 맨 위보다 이전의 기록 한 페이지를 요청
+
+        파일 읽기는 로그 기록 스레드가 남은 버퍼를 쓴 뒤에 하고 (read_older_log),
+        결과는 결과 큐로 돌아와 show_older_log 가 Tk 메인 스레드에서 표시한다.
+        """
+        if self.log_loading:
+            return
+        self.log_loading = True
+        cursor = self.log_cursor
+        self.log_writer.call_soon(lambda: self.read_older_log(cursor))
+
+    def read_older_log(self, cursor):
+        """cursor(시간대, 바이트 위치) 앞의 기록을 시간별 파일에서 한 페이지 읽어 큐로 보냄 (로그 기록 스레드)"""
+        try:
+            hour, offset = cursor
+            log_content = ''
             
-            item = self.result_tree.insert('', 'end', values=result)
+            # 현재 시간대의 앞부분이 잘려 있으면 그 부분부터, 아니면 이전 시간대 파일의 끝부분을 읽음
+            while not log_content:
+                end = offset
+                if offset == 0:
+                    hour = previous_log_hour(self.log_directory, hour)
+                    if hour is None:
+                        self.result_queue.put(('older_log', None, (cursor, None)))
+                        return
+                    end = None
+                log_content, offset = read_log_tail(log_file_path(self.log_directory, hour),
+                                                    end=end, max_bytes=self.log_page_bytes)
+                if not log_content.strip():
+                    log_content = ''
+                    offset = 0
             
-            # 적중 결과에 따라 태그 설정 (베팅 시작 회차 이후만)
-            if self.betting_start_round and int(round_num) >= int(self.betting_start_round):
-                round_info = self.rounds.get(round_num)
-                if round_info:
-                    # 총 베팅금과 당첨금을 비교하여 실제 이익이 있는지 확인
-                    total_win = round_info.win_amount
-                    total_bet = round_info.total_bet
-                    net_profit = total_win - total_bet
-                    
-                    if net_profit > 0:  # 이익이 있을 때는 파란색
-                        self.result_tree.item(item, tags=('winner',))
-                    elif net_profit < 0:  # 손실일 때는 빨간색
-                        self.result_tree.item(item, tags=('loser',))
+            if offset == 0:
+                log_content = format_log_header(hour) + log_content
+            self.result_queue.put(('older_log', None, (cursor, (hour, offset, log_content))))
+        except Exception as e:
+            logging.error(f"이전 로그 불러오기 중 오류 발생: {e}")
+            self.result_queue.put(('older_log', None, (cursor, None)))
 
-    def update_stats(self):
-        if not self.game_results:
+    def show_older_log(self, cursor, page):
+        """read_older_log 가 읽은 페이지를 텍스트 위젯 맨 위에 추가"""
+        self.log_loading = False
+        if page is None:
+            self.set_status("더 불러올 베팅 내역이 없습니다")
             return
+        if cursor != self.log_cursor:
+            # 읽는 동안 오래된 줄이 정리되어 화면 맨 위 위치가 바뀌었으면 새 위치로 다시 요청
+            self.load_older_log()
+            return
+        hour, offset, log_content = page
+        self.log_text.insert('1.0', log_content)
+        self.log_cursor = (hour, offset)
         
-        # 전체 결과 사용
-        recent_results = self.game_results
-        
-        # 좌우 비율
-        left_count = sum(1 for _, dir, _, _ in recent_results if dir == '좌')
-        right_count = len(recent_results) - left_count
-        self.stats_labels['좌우비율'].config(
-            text=f"좌우 비율: 좌 {left_count}회 ({left_count/len(recent_results)*100:.1f}%) / "
-                 f"우 {right_count}회 ({right_count/len(recent_results)*100:.1f}%)")
-        
-        # 줄수 비율
-        line3_count = sum(1 for _, _, line, _ in recent_results if line == '3')
-        line4_count = len(recent_results) - line3_count
-        self.stats_labels['줄수비율'].config(
-            text=f"3줄/4줄 비율: 3줄 {line3_count}회 ({line3_count/len(recent_results)*100:.1f}%) / "
-                 f"4줄 {line4_count}회 ({line4_count/len(recent_results)*100:.1f}%)")
-        
-        # 홀짝 비율
-        odd_count = sum(1 for _, _, _, par in recent_results if par == '홀')
-        even_count = len(recent_results) - odd_count
-        self.stats_labels['홀짝비율'].config(
-            text=f"홀짝 비율: 홀 {odd_count}회 ({odd_count/len(recent_results)*100:.1f}%) / "
-                 f"짝 {even_count}회 ({even_count/len(recent_results)*100:.1f}%)")
+        # 보고 있던 줄이 그대로 보이도록 추가된 줄 수만큼 아래를 표시
+        self.log_text.yview(f"{log_content.count(chr(10)) + 1}.0")
+
+    def format_result_row(self, result):
+        """결과 한 줄의 트리뷰 표시값과 태그를 계산"""
+        round_num, direction, line, parity = result
+        
+        # 베팅 시작 회차 이후의 결과에 대해서만 승리 여부 확인
+        betting_start_round = self.engine.betting_start_round
+        if betting_start_round and int(round_num) >= int(betting_start_round):
+            round_info = self.round_store.get_round(round_num)
+            if round_info:
+                # 총 베팅금과 당첨금을 비교하여 실제 이익이 있는지 확인
+                total_bet = round_info.total_bet
+                net_profit = round_info.win_amount - total_bet
+                
+                if net_profit > 0:  # 실제 이익이 있을 때만 별표시, 파란색
+                    return ((f"★{round_num}", direction, line, parity,
+                             f"{total_bet:,}", f"+{net_profit:,}"), ('winner',))
+                # 손실일 때는 빨간색
+                tags = ('loser',) if net_profit < 0 else ()
+                return ((round_num, direction, line, parity,
+                         f"{total_bet:,}", f"{net_profit:,}"), tags)
+        
+        return ((round_num, direction, line, parity, "-", "-"), ())
+
+    def load_archived_results(self):
+        """보관된 과거 결과로 통계, 최근 결과 저장소, 결과 목록을 채움"""
+        try:
+            self.stats.extend(self.archive.range())
+            for result in self.archive.latest(self.round_store.horizon):
+                self.round_store.add_result(result)
+            for result in reversed(self.round_store.recent_results(0, self.tree_visible_limit)):
+                self.update_result_tree(result)
+            self.update_stats()
+            logging.info(f"보관된 결과 {len(self.archive)}회차 불러옴")
+        except Exception as e:
+            logging.error(f"보관된 결과 불러오기 중 오류 발생: {e}")
 
-    def update_prediction(self):
-        mode = self.betting_mode.get()
-        method = self.betting_method.get()
-        method_config = self.betting_methods[method]
+    def update_result_tree(self, new_result):
+        """새 결과 한 줄만 맨 위에 추가하고, 표시 범위를 넘는 가장 오래된 줄을 제거"""
+        round_num = new_result[0]
+        values, tags = self.format_result_row(new_result)
         
-        # 현재 베팅 정보 업데이트
-        if method == 'method5':  # 시스템 마틴
-            current_bet = method_config['martin_steps'][method_config['current_step']]
-            total_bet = current_bet * 3  # 총 베팅액 계산
-            self.current_asset -= total_bet  # 베팅액 차감
-            self.total_profit = self.current_asset - self.initial_asset
-            self.asset_labels['현재자산'].config(text=f"현재자산: {self.current_asset:,}원")
-            self.asset_labels['총수익'].config(text=f"총수익: {self.total_profit:,}원")
-            self.asset_labels['현재베팅'].config(text=f"단식 베팅: {current_bet:,}원 × 3 (마틴 {method_config['current_step'] + 1}단계)")
-        elif method == 'method1':
-            self.asset_labels['현재베팅'].config(text=f"단식 베팅: {method_config['single_bet']:,}원 × 3, 조합 베팅: {method_config['hedge_bet']:,}원")
-        elif method == 'method2':
-            self.asset_labels['현재베팅'].config(text=f"주력픽: {method_config['single_bet_a']:,}원, 일반픽: {method_config['single_bet_bc']:,}원 × 2, 조합: {method_config['hedge_bet']:,}원")
-        elif method == 'method3':
-            if self.selected_picks['pick3'].get() != '없음':
-                self.asset_labels['현재베팅'].config(text=f"기본픽: {method_config['single_bet']:,}원 × 2, 찬스픽: {method_config['chance_bet']:,}원, 조합: {method_config['hedge_bet']:,}원")
-            else:
-                self.asset_labels['현재베팅'].config(text=f"기본픽: {method_config['single_bet']:,}원 × 2, 조합: {method_config['hedge_bet']:,}원")
-        elif method == 'method4':
-            self.asset_labels['현재베팅'].config(text=f"단식: {method_config['single_bet']:,}원 × 3, 조합1: {method_config['hedge_bet1']:,}원, 조합2: {method_config['hedge_bet2']:,}원")
-        elif method == 'method5':
-            self.asset_labels['현재베팅'].config(text=f"단식 베팅: {method_config['base_bet']:,}원 × 3 (마틴 {method_config['current_step'] + 1}단계)")
-        
-        if mode == "rotation":  # 로테이션 모드
-            pattern_type, predicted_direction, predicted_line, predicted_parity = self.betting_patterns[self.current_pattern_index]
-            self.current_pattern_index = (self.current_pattern_index + 1) % len(self.betting_patterns)
-            
-        else:  # 선택 모드
-            pick1 = self.selected_picks['pick1'].get()
-            pick2 = self.selected_picks['pick2'].get()
-            pick3 = self.selected_picks['pick3'].get()
-            
-            predicted_direction = None
-            predicted_line = None
-            predicted_parity = None
-            
-            # 각 픽의 유형 확인 및 할당
-            for pick in [pick1, pick2, pick3]:
-                if pick == '없음':
-                    continue
-                if pick in ['좌', '우'] and predicted_direction is None:
-                    predicted_direction = pick
-                elif pick in ['3', '4'] and predicted_line is None:
-                    predicted_line = pick
-                elif pick in ['홀', '짝'] and predicted_parity is None:
-                    predicted_parity = pick
-        
-        # 헤지 베팅 예측
-        if method == 'method4':  # 다중 조합인 경우
-            hedge_direction = '우'
-            hedge_line = '4'
-            hedge_direction2 = '우'
-            hedge_parity = '짝'
-        else:
-            hedge_direction = '우'
-            hedge_line = '4'
-            hedge_direction2 = None
-            hedge_parity = None
-        
-        # 예측 정보 저장
-        self.next_prediction = (predicted_direction, predicted_line, predicted_parity, 
-                              hedge_direction, hedge_line, hedge_direction2, hedge_parity)
-        
-        # 다음 회차 정보 생성 및 베팅 기록
-        if self.next_round:
-            round_info = RoundInfo(self.next_round)
-            round_info.pattern_type = pattern_type if mode == "rotation" else "custom"
-            
-            # 베팅 방법에 따른 금액 설정
-            if method == 'method5':  # 시스템 마틴
-                current_bet = method_config['martin_steps'][method_config['current_step']]
-                if predicted_direction:
-                    round_info.bets['singles'].append(('direction', predicted_direction, current_bet))
-                if predicted_line:
-                    round_info.bets['singles'].append(('line', predicted_line, current_bet))
-                if predicted_parity:
-                    round_info.bets['singles'].append(('parity', predicted_parity, current_bet))
-                # 시스템 마틴은 조합 베팅 없음
-                round_info.bets['combo'] = None
+        if self.result_tree.exists(round_num):
+            self.result_tree.item(round_num, values=values, tags=tags)
+            return
+        
+        self.result_tree.insert('', 0, iid=round_num, values=values, tags=tags)
+        self.tree_rows.appendleft(round_num)
+        
+        # 맨 위를 보고 있으면 스크롤로 늘린 범위를 기본 크기로 되돌림
+        if self.tree_at_top:
+            self.tree_visible_limit = self.tree_base_limit
+        
+        # 표시 범위를 넘는 행은 트리뷰에서만 제거 (데이터는 round_store 에 유지)
+        while len(self.tree_rows) > self.tree_visible_limit:
+            self.result_tree.delete(self.tree_rows.pop())
 
-                # 베팅 내역 로그
-                single_bets = []
-                if predicted_direction:
-                    single_bets.append(f"방향({predicted_direction})")
-                if predicted_line:
-                    single_bets.append(f"줄수({predicted_line})")
-                if predicted_parity:
-                    single_bets.append(f"홀짝({predicted_parity})")
-                
-                self.add_log(f"=== {self.next_round}회차 베팅 시작 ===")
-                self.add_log(f"{self.next_round}회차 단식베팅: {' + '.join(single_bets)} - 각 {current_bet:,}원 (마틴 {method_config['current_step'] + 1}단계)")
-                if method != 'method5':  # 시스템 마틴이 아닐 때만 조합 베팅 출력
-                    self.add_log(f"{self.next_round}회차 조합베팅: 우+4줄 - {method_config['hedge_bet']:,}원")
+    def refresh_round_row(self, round_num):
+        """RoundInfo 가 바뀐 회차의 행만 다시 그림 (화면에 없으면 무시)"""
+        if not self.result_tree.exists(round_num):
+            return
+        result = (round_num,) + tuple(self.result_tree.set(round_num, col) for col in ('방향', '줄수', '홀짝'))
+        values, tags = self.format_result_row(result)
+        self.result_tree.item(round_num, values=values, tags=tags)
 
-            elif method == 'method1':
-                single_bet = method_config['single_bet']
-                if predicted_direction:
-                    round_info.bets['singles'].append(('direction', predicted_direction, single_bet))
-                if predicted_line:
-                    round_info.bets['singles'].append(('line', predicted_line, single_bet))
-                if predicted_parity:
-                    round_info.bets['singles'].append(('parity', predicted_parity, single_bet))
-                
-                round_info.bets['combo'] = (hedge_direction, hedge_line, method_config['hedge_bet'])
-                
-            elif method == 'method2':  # 픽별 가중치
-                # 첫 번째 픽은 높은 금액
-                if predicted_direction:
-                    round_info.bets['singles'].append(('direction', predicted_direction, method_config['single_bet_a']))
-                # 나머지 픽은 낮은 금액
-                if predicted_line:
-                    round_info.bets['singles'].append(('line', predicted_line, method_config['single_bet_bc']))
-                if predicted_parity:
-                    round_info.bets['singles'].append(('parity', predicted_parity, method_config['single_bet_bc']))
-                
-                round_info.bets['combo'] = (hedge_direction, hedge_line, method_config['hedge_bet'])
-                
-            elif method == 'method3':  # 2픽 + 찬스픽
-                # 기본 2픽
-                if predicted_direction:
-                    round_info.bets['singles'].append(('direction', predicted_direction, method_config['single_bet']))
-                if predicted_line:
-                    round_info.bets['singles'].append(('line', predicted_line, method_config['single_bet']))
-                # 찬스픽 (있는 경우만)
-                if predicted_parity and pick3 != '없음':
-                    round_info.bets['singles'].append(('parity', predicted_parity, method_config['chance_bet']))
-                
-                round_info.bets['combo'] = (hedge_direction, hedge_line, method_config['hedge_bet'])
-                
-            else:  # method4: 다중 조합
-                if predicted_direction:
-                    round_info.bets['singles'].append(('direction', predicted_direction, method_config['single_bet']))
-                if predicted_line:
-                    round_info.bets['singles'].append(('line', predicted_line, method_config['single_bet']))
-                if predicted_parity:
-                    round_info.bets['singles'].append(('parity', predicted_parity, method_config['single_bet']))
-                
-                # 두 개의 조합 베팅
-                round_info.bets['combo'] = (hedge_direction, hedge_line, method_config['hedge_bet1'])
-                round_info.bets['combo2'] = (hedge_direction2, None, hedge_parity, method_config['hedge_bet2'])
-            
-            # 총 베팅액 계산
-            round_info.total_bet = sum(amount for _, _, amount in round_info.bets['singles'])
-            if round_info.bets['combo']:
-                round_info.total_bet += round_info.bets['combo'][2]
-            if method == 'method4' and round_info.bets.get('combo2'):
-                round_info.total_bet += round_info.bets['combo2'][3]
-            
-            self.rounds[self.next_round] = round_info
+    def on_tree_scroll(self, first, last):
+        """트리뷰 스크롤 시 맨 아래에 닿으면 이전 결과를 한 페이지 더 표시 (맨 위로 돌아오면 다시 줄임)"""
+        self.tree_scrollbar.set(first, last)
+        self.tree_at_top = float(first) <= 0.0
+        if self.tree_at_top and len(self.tree_rows) > self.tree_base_limit:
+            self.tree_visible_limit = self.tree_base_limit
+            while len(self.tree_rows) > self.tree_visible_limit:
+                self.result_tree.delete(self.tree_rows.pop())
+            return
+        if float(last) < 1.0 or len(self.tree_rows) < self.tree_visible_limit:
+            return
+        older_results = self.round_store.recent_results(len(self.tree_rows), self.tree_page_size)
+        if not older_results:
+            return
         
-        # 예측 표시 업데이트
-        self.prediction_labels['방향'].config(text=f"예상 방향: {predicted_direction if predicted_direction else '-'}")
-        self.prediction_labels['줄수'].config(text=f"예상 줄수: {predicted_line if predicted_line else '-'}")
-        self.prediction_labels['홀짝'].config(text=f"예상 홀짝: {predicted_parity if predicted_parity else '-'}")
+        self.tree_visible_limit += self.tree_page_size
+        for result in older_results:
+            values, tags = self.format_result_row(result)
+            self.result_tree.insert('', 'end', iid=result[0], values=values, tags=tags)
+            self.tree_rows.append(result[0])
 
-    def check_prediction_result(self, actual_result):
-        if not self.current_prediction or not self.current_round:
+    def update_stats(self):
+        self.mark_dirty('stats')
+
+    def render_stats(self):
+        if not len(self.stats):
             return
-            
-        round_num, actual_direction, actual_line, actual_parity = actual_result
-        round_info = self.rounds.get(round_num)
         
-        if not round_info:
-            logging.error(f"{round_num}회차 정보를 찾을 수 없습니다.")
+        # 선택한 구간 기준 (전체 또는 최근 N회)
+        window = None if self.stats_window.get() == '전체' else int(self.stats_window.get())
+        
+        # 좌우 / 줄수 / 홀짝 비율
+        for key, market, title, first_name, second_name in (
+                ('좌우비율', 'direction', '좌우 비율', '좌', '우'),
+                ('줄수비율', 'line', '3줄/4줄 비율', '3줄', '4줄'),
+                ('홀짝비율', 'parity', '홀짝 비율', '홀', '짝')):
+            first_count, second_count = self.stats.ratio(market, window)
+            total = first_count + second_count
+            self.set_label(self.stats_labels[key],
+                           text=f"{title}: {first_name} {first_count}회 ({first_count/total*100:.1f}%) / "
+                                f"{second_name} {second_count}회 ({second_count/total*100:.1f}%)")
+        
+        # 현재 연속 횟수
+        streaks = []
+        for market, suffix in (('direction', ''), ('line', '줄'), ('parity', '')):
+            value, length = self.stats.streak(market)
+            streaks.append(f"{value}{suffix} {length}회")
+        self.set_label(self.stats_labels['연속'], text=f"연속: {' / '.join(streaks)}")
+
+    def current_picks(self):
+        """선택 모드 콤보박스의 픽 3개"""
+        return [self.selected_picks[key].get() for key in ('pick1', 'pick2', 'pick3')]
+
+    def current_strategy(self):
+        """전략 콤보박스에서 고른 전략 객체"""
+        label = self.strategy_name.get()
+        for strategy in self.strategies.values():
+            if strategy.label == label:
+                return strategy
+        return None
+
+    def restore_selection(self, selection):
+        """복원한 세션의 베팅 방법/모드/픽/전략 선택을 화면 변수에 되돌림 (변경 이벤트 연결 전에 호출)"""
+        if not selection:
             return
-            
-        # 결과 저장
-        round_info.result = (actual_direction, actual_line, actual_parity)
+        self.betting_method.set(selection['method'])
+        self.betting_mode.set(selection['mode'])
+        for key, pick in zip(('pick1', 'pick2', 'pick3'), selection['picks']):
+            self.selected_picks[key].set(pick)
+        if selection['strategy'] in STRATEGIES:
+            self.strategy_name.set(STRATEGIES[selection['strategy']].label)
+
+    def update_shadow_stats(self):
+        self.mark_dirty('shadow')
+
+    def render_shadow_stats(self):
+        """전략 비교 결과 상위 3개 표시"""
+        rows = [f"{label} {wins}승{losses}패 {profit:+,.0f}원"
+                for label, wins, losses, profit in self.shadow_runner.summary()[:3] if wins + losses]
+        self.set_label(self.stats_labels['섀도우'], text=f"전략 비교: {' / '.join(rows) if rows else '-'}")
+
+    def update_asset_labels(self):
+        self.mark_dirty('asset')
+
+    def render_asset_labels(self):
+        self.set_label(self.asset_labels['현재자산'], text=f"현재자산: {self.engine.current_asset:,}원")
+        self.set_label(self.asset_labels['총수익'], text=f"총수익: {self.engine.total_profit:,}원")
+        self.set_label(self.asset_labels['순수익합계'], text=f"순수익 합계: {self.engine.total_net_profit:,}원")
+        if self.engine.win_count + self.engine.lose_count:
+            self.set_label(self.asset_labels['승률'],
+                           text=f"승률: {self.engine.win_rate:.1f}% ({self.engine.win_count}승 {self.engine.lose_count}패)")
+        self.set_label(self.asset_labels['현재베팅'], text=self.current_bet_text)
+
+    def update_prediction(self, round_info):
+        """엔진이 만든 다음 회차 베팅을 화면과 로그에 표시"""
+        method = round_info.method
+        method_config = self.engine.betting_methods[method]
         
-        # 단식 베팅 결과 확인 (각 픽별로 독립적 계산)
-        win_amount = 0
-        correct_picks = 0
-        total_picks = len(round_info.bets['singles'])
-        pick_results = []  # 각 픽별 결과 저장
-        
-        for bet_type, bet_value, bet_amount in round_info.bets['singles']:
-            actual_value = {
-                'direction': actual_direction,
-                'line': actual_line,
-                'parity': actual_parity
-            }[bet_type]
-            
-            is_win = bet_value == actual_value
-            if is_win:
-                correct_picks += 1
-                pick_win_amount = bet_amount * self.odds['single']
-                win_amount += pick_win_amount
-                pick_results.append({
-                    'type': bet_type,
-                    'value': bet_value,
-                    'result': '적중',
-                    'bet_amount': bet_amount,
-                    'win_amount': pick_win_amount,
-                    'profit': pick_win_amount - bet_amount
-                })
-            else:
-                pick_results.append({
-                    'type': bet_type,
-                    'value': bet_value,
-                    'result': '미적중',
-                    'bet_amount': bet_amount,
-                    'win_amount': 0,
-                    'profit': -bet_amount
-                })
-        
-        # 결과 정보 업데이트
-        round_info.correct_picks = correct_picks
-        round_info.total_picks = total_picks
-        round_info.win_amount = win_amount
-        round_info.profit = win_amount - round_info.total_bet
-        
-        # 순수익 계산 및 업데이트
-        net_profit = win_amount - round_info.total_bet
-        self.total_net_profit += net_profit
-        
-        # 자산 업데이트
-        next_round_info = self.rounds.get(self.next_round)
-        current_bet = next_round_info.total_bet if next_round_info else 0
-        
-        # 현재 자산 = 초기자산 + 누적 순수익 - 현재 베팅금
-        self.current_asset = self.initial_asset + self.total_net_profit - current_bet
-        # 총수익 = 현재자산 - 초기자산
-        self.total_profit = self.current_asset - self.initial_asset
-        
-        # 현재 베팅 방법 가져오기
-        method = self.betting_method.get()
-        
-        # 승패 기록 및 마틴 단계 조정
-        if method == 'method5':  # 시스템 마틴
-            if correct_picks >= 2:  # 2개 이상 맞추면 승리
-                self.win_count += 1
-                # 승리시 마틴 단계 감소 (최소 0단계)
-                self.betting_methods[method]['current_step'] = max(0, self.betting_methods[method]['current_step'] - 1)
-            else:
-                self.lose_count += 1
-                # 패배시 마틴 단계 증가 (최대 9단계, 0-based index)
-                self.betting_methods[method]['current_step'] = min(9, self.betting_methods[method]['current_step'] + 1)
-        else:
-            if correct_picks >= 2:  # 2개 이상 맞추면 승리
-                self.win_count += 1
-            else:
-                self.lose_count += 1
+        # 현재 베팅 정보 업데이트
+        self.current_bet_text = describe_bets(method, method_config, self.selected_picks['pick3'].get() != '없음')
+        
+        if is_martingale(method):  # 시스템 마틴 베팅 내역 로그
+            current_bet = martin_stake(method_config)
+            single_bets = [f"{MARKET_NAMES[bet.market]}({bet.pick})" for bet in round_info.singles]
+            self.add_log(f"=== {round_info.round_num}회차 베팅 시작 ===")
+            self.add_log(f"{round_info.round_num}회차 단식베팅: {' + '.join(single_bets)} - 각 {current_bet:,}원 (마틴 {method_config['current_step'] + 1}단계)")
+        
+        # 예측 표시 업데이트
+        self.mark_dirty('asset', 'prediction')
+
+    def render_prediction(self):
+        predicted_direction, predicted_line, predicted_parity = self.engine.next_prediction or (None, None, None)
+        self.set_label(self.prediction_labels['방향'], text=f"예상 방향: {predicted_direction if predicted_direction else '-'}")
+        self.set_label(self.prediction_labels['줄수'], text=f"예상 줄수: {predicted_line if predicted_line else '-'}")
+        self.set_label(self.prediction_labels['홀짝'], text=f"예상 홀짝: {predicted_parity if predicted_parity else '-'}")
+
+    def check_prediction_result(self, settlement):
+        """엔진의 정산 결과를 로그와 자산 정보에 표시"""
+        round_info = settlement.round_info
+        round_num = round_info.round_num
+        self.refresh_round_row(round_num)
         
         # 결과 로깅
-        pattern_desc = {
-            'pattern1': '좌+3+홀',
-            'pattern2': '좌+3+짝',
-            'pattern3': '좌+4+홀',
-            'custom': '선택모드'
-        }.get(round_info.pattern_type, '알 수 없음')
+        pattern_desc = PATTERN_NAMES.get(round_info.pattern_type)
+        if pattern_desc is None:
+            pattern_desc = STRATEGIES[round_info.pattern_type].label if round_info.pattern_type in STRATEGIES else '알 수 없음'
         
         # 상세 결과 로그 생성
         self.add_log(f"\n{round_num}회차 결과 [{pattern_desc}]")
         
-        # 단식 베팅 결과
-        for pick in pick_results:
-            type_names = {'direction': '방향', 'line': '줄수', 'parity': '홀짝'}
-            self.add_log(f"- {type_names[pick['type']]}({pick['value']}): {pick['result']} "
-                        f"(베팅: {pick['bet_amount']:,}원, "
-                        f"당첨: {pick['win_amount']:,}원)")
+        # 픽별 베팅 결과 (단식, 엔진이 pay_combination 이면 조합 포함)
+        for bet, pick_win_amount in settlement.pick_results:
+            self.add_log(f"- {MARKET_NAMES[bet.market]}({bet.label}): {'적중' if pick_win_amount else '미적중'} "
+                        f"(베팅: {bet.stake:,}원, "
+                        f"당첨: {pick_win_amount:,}원)")
         
         # 최종 결과
         self.add_log(f"=== 최종 결과: 당첨금 {round_info.win_amount:,}원 "
-                    f"(단식 {correct_picks}/{total_picks}개 적중) ===\n")
+                    f"(단식 {settlement.correct_picks}/{round_info.total_picks}개 적중) ===\n")
         
         # 자산 정보 업데이트
-        total_games = self.win_count + self.lose_count
-        win_rate = (self.win_count / total_games * 100) if total_games > 0 else 0
-        
-        self.asset_labels['현재자산'].config(text=f"현재자산: {self.current_asset:,}원")
-        self.asset_labels['총수익'].config(text=f"총수익: {self.total_profit:,}원")
-        self.asset_labels['순수익합계'].config(text=f"순수익 합계: {self.total_net_profit:,}원")
-        self.asset_labels['승률'].config(text=f"승률: {win_rate:.1f}% ({self.win_count}승 {self.lose_count}패)")
-        self.asset_labels['현재베팅'].config(text=f"현재베팅: -")
+        self.current_bet_text = "현재베팅: -"
+        self.update_asset_labels()
 
     def get_consecutive_losses(self):
         consecutive_losses = 0
         for result in self.game_results:
             round_num = result[0]
-            if int(round_num) >= int(self.betting_start_round):
+            if int(round_num) >= int(self.engine.betting_start_round):
                 # 승패 여부 확인 로직
                 if self.is_loss(result):
                     consecutive_losses += 1
@@ -789,7 +788,7 @@ class LadderGameGUI:
         correct_picks = 0
         total_picks = 2  # 항상 2픽 베팅
         
-        pattern_type = self.betting_patterns[(self.current_pattern_index - 2) % 3][0]
+        pattern_type = self.engine.betting_patterns[(self.engine.current_pattern_index - 2) % 3][0]
         if pattern_type == 'direction_parity':
             if direction == '좌':
                 correct_picks += 1
@@ -809,202 +808,200 @@ class LadderGameGUI:
         hedge_win = (direction == '우' and line == '4')
         return correct_picks < 2 and not hedge_win
 
-    def update_data(self):
+    def poll_results(self):
+        """워커 스레드가 넣은 결과를 Tk 메인 스레드에서 꺼내 처리"""
         try:
-            logging.info("데이터 업데이트 시작")
-            
-            # API 호출
-            url = "https://ntry.com/data/json/games/power_ladder/result.json"
-            response = self.session.get(url, timeout=5)
-            response.raise_for_status()
-            
-            data = response.json()
-            logging.info(f"API 응답: {data}")
+            while True:
+                kind, game, payload = self.result_queue.get_nowait()
+                if kind == 'result':
+                    self.update_data(payload, game)
+                elif kind == 'error':
+                    current_time = datetime.now().strftime("%H:%M:%S")
+                    self.set_status(f"업데이트 실패: {current_time} [{GAME_NAMES[game]}] ({payload})"
+                                    f"{self.health_text}")
+                elif kind == 'health':
+                    self.update_health(*payload)
+                elif kind == 'older_log':
+                    self.show_older_log(*payload)
+        except queue.Empty:
+            pass
+        except Exception as e:
+            logging.error(f"결과 처리 중 오류 발생: {e}")
+        finally:
+            self.root.after(self.queue_poll_interval, self.poll_results)
+
+    def update_data(self, new_result, game=MAIN_GAME):
+        """워커가 가져온 새 결과를 반영 (Tk 메인 스레드에서만 호출)
+
+        모든 게임의 결과가 여기로 들어오며, 엔진/통계/회차 저장소는 베팅하는 MAIN_GAME 만 사용한다.
+        """
+        if game != MAIN_GAME:
+            self.update_game_data(game, new_result)
+            return
+        try:
+            round_num = new_result[0]
+            self.archive.append(new_result)
             
-            if not data:
-                logging.warning("결과 데이터가 없습니다")
-                return
+            # 게임 결과 업데이트 (보관소에서 이미 불러온 회차는 건너뜀)
+            # 전략이 최신 결과까지 반영된 통계로 예측하도록 엔진보다 먼저 반영
+            if not (self.game_results and self.game_results[0][0] == round_num):
+                self.round_store.add_result(new_result)
+                self.stats.add(new_result)
+                self.shadow_runner.on_result(new_result, self.stats)
+                self.update_shadow_stats()
             
-            try:
-                round_num = str(data['r'])
-                direction = '좌' if data['s'] == 'LEFT' else '우'
-                line = str(data['l'])
-                parity = '홀' if data['o'] == 'ODD' else '짝'
-                
-                new_result = (round_num, direction, line, parity)
-                logging.info(f"파싱된 결과: {round_num}회차 - {direction}/{line}/{parity}")
-                
-                is_first_update = self.current_round is None
+            # 이전 회차 정산과 다음 회차 베팅은 엔진이 처리 (같은 회차면 None)
+            with METRICS.span('settle'):
+                outcome = self.engine.process_result(new_result, self.betting_method.get(),
+                                                     self.betting_mode.get(), self.current_picks(),
+                                                     self.current_strategy(), self.stats)
+            if outcome is not None:
+                settlement, round_info = outcome
                 
-                # 첫 실행시 처리
-                if is_first_update:
-                    logging.info("첫 실행 감지, 다음 회차 베팅 준비")
-                    self.current_round = round_num
-                    self.next_round = str(int(round_num) + 1)
-                    self.betting_start_round = self.next_round
-                    
-                    # 게임 결과 업데이트
-                    self.game_results.insert(0, new_result)
-                    
-                    self.update_result_tree()
-                    self.update_stats()
-                    
-                    # 다음 회차 예측 및 베팅
-                    self.update_prediction()
-                    self.current_prediction = self.next_prediction
-                    
-                    # 베팅 금액 차감 및 로그 기록
-                    method = self.betting_method.get()
-                    method_config = self.betting_methods[method]
-                    
-                    if method == 'method5':  # 시스템 마틴
-                        current_bet = method_config['martin_steps'][method_config['current_step']]
-                        total_bet = current_bet * 3  # 총 베팅액 계산
-                    elif method == 'method1':
-                        total_bet = (method_config['single_bet'] * 3) + method_config['hedge_bet']
-                    elif method == 'method2':
-                        total_bet = method_config['single_bet_a'] + (method_config['single_bet_bc'] * 2) + method_config['hedge_bet']
-                    elif method == 'method3':
-                        total_bet = (method_config['single_bet'] * 2) + method_config['hedge_bet']
-                        if self.selected_picks['pick3'].get() != '없음':
-                            total_bet += method_config['chance_bet']
-                    else:  # method4
-                        total_bet = (method_config['single_bet'] * 3) + method_config['hedge_bet1'] + method_config['hedge_bet2']
-                    
-                    # 현재 자산 = 초기자산 + 누적 순수익 - 현재 베팅금
-                    self.current_asset = self.initial_asset + self.total_net_profit - total_bet
-                    # 총수익 = 현재자산 - 초기자산
-                    self.total_profit = self.current_asset - self.initial_asset
-                    
-                    # 자산 정보 업데이트
-                    self.asset_labels['현재자산'].config(text=f"현재자산: {self.current_asset:,}원")
-                    self.asset_labels['총수익'].config(text=f"총수익: {self.total_profit:,}원")
-                    self.asset_labels['순수익합계'].config(text=f"순수익 합계: {self.total_net_profit:,}원")
+                # 이전 예측 결과 확인
+                if settlement:
+                    with METRICS.span('check_prediction'):
+                        self.check_prediction_result(settlement)
                 
-                # 새로운 회차 데이터 처리
-                elif self.current_round != round_num:
-                    logging.info(f"새로운 회차 발견: {round_num} (이전: {self.current_round})")
-                    
-                    # 이전 예측 결과 확인
-                    if self.current_prediction:
-                        self.check_prediction_result(new_result)
-                    
-                    # 회차 정보 업데이트
-                    self.current_round = round_num
-                    self.next_round = str(int(round_num) + 1)
-                    
-                    # 게임 결과 업데이트
-                    self.game_results.insert(0, new_result)
-                    
-                    self.update_result_tree()
-                    self.update_stats()
-                    
-                    # 다음 회차 예측 및 베팅
-                    self.current_prediction = self.next_prediction
-                    self.next_prediction = None
-                    self.update_prediction()
-                    
-                    # 베팅 금액 차감 및 로그 기록
-                    method = self.betting_method.get()
-                    method_config = self.betting_methods[method]
-                    
-                    if method == 'method5':  # 시스템 마틴
-                        current_bet = method_config['martin_steps'][method_config['current_step']]
-                        total_bet = current_bet * 3  # 총 베팅액 계산
-                    elif method == 'method1':
-                        total_bet = (method_config['single_bet'] * 3) + method_config['hedge_bet']
-                    elif method == 'method2':
-                        total_bet = method_config['single_bet_a'] + (method_config['single_bet_bc'] * 2) + method_config['hedge_bet']
-                    elif method == 'method3':
-                        total_bet = (method_config['single_bet'] * 2) + method_config['hedge_bet']
-                        if self.selected_picks['pick3'].get() != '없음':
-                            total_bet += method_config['chance_bet']
-                    else:  # method4
-                        total_bet = (method_config['single_bet'] * 3) + method_config['hedge_bet1'] + method_config['hedge_bet2']
-                    
-                    # 현재 자산 = 초기자산 + 누적 순수익 - 현재 베팅금
-                    self.current_asset = self.initial_asset + self.total_net_profit - total_bet
-                    # 총수익 = 현재자산 - 초기자산
-                    self.total_profit = self.current_asset - self.initial_asset
-                    
-                    # 자산 정보 업데이트
-                    self.asset_labels['현재자산'].config(text=f"현재자산: {self.current_asset:,}원")
-                    self.asset_labels['총수익'].config(text=f"총수익: {self.total_profit:,}원")
-                    self.asset_labels['순수익합계'].config(text=f"순수익 합계: {self.total_net_profit:,}원")
+                with METRICS.span('render_tree'):
+                    self.update_result_tree(new_result)
+                self.update_stats()
                 
-                current_time = datetime.now().strftime("%H:%M:%S")
-                self.status_label.config(text=f"마지막 업데이트: {current_time} (회차: {round_num})")
+                # 다음 회차 예측 및 베팅 표시 (레이블은 render 에서 한 번에 그림)
+                self.update_prediction(round_info)
                 
-            except KeyError as e:
-                logging.error(f"필수 데이터 필드 누락: {e}")
-            except Exception as e:
-                logging.error(f"결과 파싱 오류: {e}")
+                # 마감부터 화면에 그려지기까지 (render 다음 유휴 시점)
+                self.root.after_idle(self.observe_draw_latency)
+            
+            current_time = datetime.now().strftime("%H:%M:%S")
+            self.set_status(f"마지막 업데이트: {current_time} (회차: {round_num}){self.health_text}")
             
-        except requests.RequestException as e:
-            logging.error(f"네트워크 오류: {e}")
-        except ValueError as e:
-            logging.error(f"JSON 파싱 오류: {e}")
         except Exception as e:
-            logging.error(f"데이터 업데이트 중 오류 발생: {e}")
+            logging.error(f"결과 처리 오류: {e}")
+
+    def observe_draw_latency(self):
+        """가장 가까운 마감 시각부터 지금까지의 시간을 기록 (늦게 받은 회차는 제외)"""
+        now = self.clock_sync.now()
+        latency = now - self.clock_sync.nearest_draw(MAIN_GAME, now)
+        if 0 <= latency < 120:
+            METRICS.observe('draw_to_display', latency)
+
+    def toggle_debug_panel(self, event=None):
+        """구간별 지연 시간 표 (F12 로 열고 닫음)"""
+        if self.debug_panel is not None:
+            self.debug_panel.destroy()
+            self.debug_panel = None
+            return
+        self.debug_panel = self.view.Toplevel(self.root)
+        self.debug_panel.title("성능 지표")
+        self.debug_panel.protocol("WM_DELETE_WINDOW", self.toggle_debug_panel)
+        self.debug_label = self.view.Label(self.debug_panel, font=('Courier', 10), justify=tk.LEFT)
+        self.debug_label.grid(row=0, column=0, padx=10, pady=10)
+        self.refresh_debug_panel()
+
+    def refresh_debug_panel(self):
+        if self.debug_panel is None:
+            return
+        self.debug_label.config(text=METRICS.format_table())
+        self.debug_panel.after(1000, self.refresh_debug_panel)
+
+    def dump_metrics(self):
+        """지표 요약을 주기적으로 파일에 저장"""
+        try:
+            METRICS.dump(self.metrics_path)
+        except Exception as e:
+            logging.error(f"성능 지표 저장 중 오류 발생: {e}")
         finally:
-            self.root.after(5000, self.update_data)
+            self.root.after(self.metrics_dump_interval, self.dump_metrics)
+
+    def mark_dirty(self, *views):
+        """다시 그려야 할 구역 표시 (첫 표시 때만 유휴 시점 render 예약)"""
+        self.dirty_views.update(views)
+        if not self.render_scheduled:
+            self.render_scheduled = True
+            self.root.after_idle(self.render)
+
+    def render(self):
+        """표시된 구역의 레이블을 현재 상태로 한 번에 갱신"""
+        self.render_scheduled = False
+        dirty, self.dirty_views = self.dirty_views, set()
+        with METRICS.span('render'):
+            for view, renderer in (('log', self.render_log),
+                                   ('asset', self.render_asset_labels),
+                                   ('prediction', self.render_prediction),
+                                   ('stats', self.render_stats),
+                                   ('shadow', self.render_shadow_stats),
+                                   ('status', self.render_status)):
+                if view in dirty:
+                    try:
+                        renderer()
+                    except Exception as e:
+                        logging.error(f"화면 갱신 중 오류 발생 ({view}): {e}")
+
+    def set_label(self, label, **options):
+        """레이블 설정이 마지막으로 넣은 값과 다를 때만 위젯에 반영"""
+        if self.label_options.get(label) != options:
+            self.label_options[label] = options
+            label.config(**options)
+
+    def set_status(self, text):
+        self.status_text = text
+        self.mark_dirty('status')
+
+    def render_status(self):
+        self.set_label(self.status_label, text=self.status_text)
+
+    def update_health(self, health, detail):
+        """조회 계층 상태를 상태 표시줄에 반영 (정상이면 표시하지 않음)"""
+        if health == HEALTH_OK:
+            self.health_text = ''
+            self.set_status("서버 연결 복구됨")
+        else:
+            self.health_text = f" | 서버 상태: {HEALTH_NAMES[health]} ({detail})"
+            self.set_status(self.health_text.lstrip(' |'))
+
+    def update_game_data(self, game, new_result):
+        """베팅하지 않는 게임의 새 결과를 해당 게임 저장소에 반영"""
+        store = self.game_stores[game]
+        if store and store[0][0] == new_result[0]:
+            return
+        store.appendleft(new_result)
+        logging.info(f"{GAME_NAMES[game]} 새로운 회차: {new_result[0]}")
 
     def on_betting_change(self, *args):
         """베팅 모드나 방법이 변경될 때 호출되는 함수"""
-        method = self.betting_method.get()
-        method_config = self.betting_methods[method]
-        
         # 다음 회차 베팅이 이미 있고, 결과가 아직 안 나왔다면 베팅 업데이트
-        if self.next_round and self.next_prediction:
-            # 이전 베팅 금액 환불
-            if self.next_round in self.rounds:
-                old_round_info = self.rounds[self.next_round]
-                # 베팅 내역 로그에 이전 베팅 취소 기록
-                self.add_log(f"\n{self.next_round}회차 이전 베팅 취소")
-                self.add_log(f"- 환불 금액: {old_round_info.total_bet:,}원")
-                
-                # 이전 베팅 정보 삭제
-                del self.rounds[self.next_round]
-            
-            # 새로운 예측 및 베팅 정보 업데이트
-            self.update_prediction()
-            
-            # 새 베팅 정보 기록
-            if self.next_round in self.rounds:
-                new_round_info = self.rounds[self.next_round]
-                
-                # 베팅 내역 로그에 새 베팅 기록
-                self.add_log(f"\n{self.next_round}회차 베팅 방식 변경")
-                if method == 'method5':
-                    current_bet = method_config['martin_steps'][method_config['current_step']]
-                    single_bets = []
-                    if self.next_prediction[0]:  # direction
-                        single_bets.append(f"방향({self.next_prediction[0]})")
-                    if self.next_prediction[1]:  # line
-                        single_bets.append(f"줄수({self.next_prediction[1]})")
-                    if self.next_prediction[2]:  # parity
-                        single_bets.append(f"홀짝({self.next_prediction[2]})")
-                    self.add_log(f"- 단식베팅: {' + '.join(single_bets)} - 각 {current_bet:,}원 (마틴 {method_config['current_step'] + 1}단계)")
-                
-                # 자산 정보 업데이트 (초기자산 + 누적 순수익 - 현재 베팅금)
-                self.current_asset = self.initial_asset + self.total_net_profit - new_round_info.total_bet
-                self.total_profit = self.current_asset - self.initial_asset
-                self.asset_labels['현재자산'].config(text=f"현재자산: {self.current_asset:,}원")
-                self.asset_labels['총수익'].config(text=f"총수익: {self.total_profit:,}원")
-                self.asset_labels['순수익합계'].config(text=f"순수익 합계: {self.total_net_profit:,}원")
+        if not (self.engine.next_round and self.engine.next_prediction):
+            return
+        
+        # 이전 베팅 취소 (환불)
+        old_round_info = self.engine.cancel_bets()
+        if old_round_info:
+            # 베팅 내역 로그에 이전 베팅 취소 기록
+            self.add_log(f"\n{old_round_info.round_num}회차 이전 베팅 취소")
+            self.add_log(f"- 환불 금액: {old_round_info.total_bet:,}원")
+        
+        # 새로운 예측 및 베팅 정보 업데이트
+        round_info = self.engine.place_bets(self.betting_method.get(), self.betting_mode.get(), self.current_picks(),
+                                            self.current_strategy(), self.stats)
+        self.update_prediction(round_info)
+        
+        # 베팅 내역 로그에 새 베팅 기록
+        self.add_log(f"\n{round_info.round_num}회차 베팅 방식 변경")
+        if is_martingale(round_info.method):
+            method_config = self.engine.betting_methods[round_info.method]
+            current_bet = martin_stake(method_config)
+            single_bets = [f"{MARKET_NAMES[bet.market]}({bet.pick})" for bet in round_info.singles]
+            self.add_log(f"- 단식베팅: {' + '.join(single_bets)} - 각 {current_bet:,}원 (마틴 {method_config['current_step'] + 1}단계)")
+        
+        # 자산 정보 업데이트 (초기자산 + 누적 순수익 - 현재 베팅금)
+        self.update_asset_labels()
 
-    def update_timer(self):
-        """타이머 업데이트 함수"""
+    def update_timer(self, now):
+        """타이머 업데이트 함수 (SecondTicker 가 정각 초마다 호출)"""
         try:
-            # 타이머 계산
-            current_time = datetime.now()
-            cycle_seconds = 5 * 60  # 5분
-            elapsed_seconds = (current_time.minute * 60 + current_time.second + 29) % cycle_seconds  # 29초 오프셋 적용
-            remaining_time = cycle_seconds - elapsed_seconds
-            
-            # 남은 시간을 분과 초로 변환
-            remaining_minutes = remaining_time // 60
-            remaining_seconds = remaining_time % 60
+            # 타이머 계산 (게임별 주기/오프셋은 timer.config 기준)
+            remaining_minutes, remaining_seconds = get_timer_remaining_time(MAIN_GAME, now)
             
             # 시간에 따른 색상 설정
             if remaining_minutes >= 4:
@@ -1019,26 +1016,50 @@ class LadderGameGUI:
                 color = '#FF0000'  # 빨간색 (Red)
             
             # 타이머 레이블 업데이트 (색상 포함)
-            self.timer_label.config(
-                text=f"남은 시간: {remaining_minutes:02d}분 {remaining_seconds:02d}초",
-                foreground=color
-            )
+            self.set_label(self.timer_label,
+                           text=f"남은 시간: {remaining_minutes:02d}분 {remaining_seconds:02d}초",
+                           foreground=color)
+            
+            # 다른 게임의 최근 회차와 남은 시간
+            for game, label in self.game_labels.items():
+                store = self.game_stores[game]
+                game_minutes, game_seconds = get_timer_remaining_time(game, now)
+                round_text = f"{store[0][0]}회차" if store else "-"
+                self.set_label(label, text=f"{GAME_NAMES[game]}: {round_text} "
+                                           f"(남은 시간 {game_minutes:02d}:{game_seconds:02d})")
         except Exception as e:
             logging.error(f"타이머 업데이트 중 오류 발생: {e}")
-        finally:
-            # 1초마다 업데이트
-            self.root.after(1000, self.update_timer)
 
     def on_closing(self):
         """프로그램 종료 시 호출되는 함수"""
         try:
+            # 백그라운드 수집/타이머 중지
+            self.fetcher.stop()
+            self.timer_ticker.stop()
+            if self.metrics_server:
+                self.metrics_server.stop()
+            METRICS.dump(self.metrics_path)
+            self.session_journal.snapshot(self.engine.export_state(), self.round_store)
+            self.session_journal.close()
+            self.round_store.close()
+            self.archive.close()
             # 프로그램 종료 로그 기록
             self.add_log("=== 프로그램 종료 ===\n")
+            self.log_writer.close()
         finally:
             # 프로그램 종료
             self.root.destroy()
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = LadderGameGUI(root)
-    root.mainloop()
+    parser = argparse.ArgumentParser(description="파워사다리 베팅 도우미")
+    parser.add_argument('--headless', action='store_true',
+                        help="화면 없이 실행 (결과 수집/베팅/로그/지표는 그대로, 종료는 Ctrl+C)")
+    parser.add_argument('--metrics-port', type=int, nargs='?', const=8790,
+                        help="성능 지표 엔드포인트 포트 (http://127.0.0.1:포트/metrics, 값 생략시 8790)")
+    args = parser.parse_args()
+    view = create_view('null' if args.headless else 'tk')
+    app = LadderGameGUI(view.root, view=view, metrics_port=args.metrics_port)
+    try:
+        view.root.mainloop()
+    except KeyboardInterrupt:
+        app.on_closing()
@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta
 import time
+import math
+import asyncio
 
 # JavaScript config를 Python dictionary로 변환
 config = {
@@ -9,38 +11,84 @@ config = {
     'keno_ladder': {'diffSec': 0, 'returnMinute': 5, 'countDownDiff': 1000 * 175}
 }
 
-def get_timer_remaining_time(game_type='power_ladder'):
-    # config에서 게임 설정 가져오기
+def get_remaining_seconds(game_type='power_ladder', now=None):
+    """주어진 시각 기준으로 다음 마감까지 남은 초를 반환 (소수점 포함)"""
     game_config = config[game_type]
-    offset_seconds = game_config['diffSec']
-    return_minute = game_config['returnMinute']
-    countdown_diff = game_config['countDownDiff'] / 1000  # milliseconds to seconds
+    if now is None:
+        now = datetime.now()
     
+    # 게임별 오프셋(diffSec, countDownDiff) 적용
+    adjusted_time = now + timedelta(seconds=game_config['diffSec'] + game_config['countDownDiff'] / 1000)
+    cycle_seconds = game_config['returnMinute'] * 60
+    elapsed_seconds = (adjusted_time.minute * 60 + adjusted_time.second
+                       + adjusted_time.microsecond / 1000000) % cycle_seconds
+    return cycle_seconds - elapsed_seconds
+
+def get_timer_remaining_time(game_type='power_ladder', now=None):
+    """주어진 시각 기준 남은 시간을 (분, 초) 정수로 반환 (대기/출력 없음)"""
+    remaining_time = math.ceil(get_remaining_seconds(game_type, now))
+    return remaining_time // 60, remaining_time % 60
+
+def next_tick_delay(timestamp, last_second=None):
+    """timestamp(unix time) 이후 다음 정각 초까지 남은 시간 (초)
+
+    last_second 를 주면 그 다음 초를 기준으로 하므로, 정각보다 조금 일찍 깨어나도
+    같은 초를 두 번 처리하지 않는다.
+    """
+    target = math.floor(timestamp) + 1
+    if last_second is not None:
+        target = max(target, last_second + 1)
+    return target - timestamp
+
+async def countdown(game_type='power_ladder', clock=time.time):
+    """매 정각 초마다 (분, 초) 를 내보내는 async generator
+
+    매번 clock() 으로 다음 정각 초까지의 간격을 다시 계산하므로 처리 시간이 쌓여 밀리지 않는다.
+    """
+    second = None
     while True:
-        # 현재 시간 가져오기
-        current_time = datetime.now()
-        
-        # 현재 시간에서 오프셋과 카운트다운 차이를 적용하여 타이머 계산
-        adjusted_time = current_time + timedelta(seconds=offset_seconds + countdown_diff)
-        
-        # returnMinute 값을 기준으로 주기 계산 (분 단위를 초로 변환)
-        cycle_seconds = return_minute * 60
-        elapsed_seconds = (adjusted_time.minute * 60 + adjusted_time.second) % cycle_seconds
-        remaining_time = cycle_seconds - elapsed_seconds
-
-        # 남은 시간을 분과 초로 변환
-        remaining_minutes = remaining_time // 60
-        remaining_seconds = remaining_time % 60
+        await asyncio.sleep(next_tick_delay(clock(), second))
+        second = round(clock())
+        yield get_timer_remaining_time(game_type, datetime.fromtimestamp(second))
+
+class SecondTicker:
+    """정각 초마다 callback(now) 를 호출하는 스케줄러
 
+    schedule(ms, func) 는 tkinter 의 root.after 처럼 지연 실행을 등록하는 함수이며,
+    now 는 가장 가까운 정각 초로 맞춘 datetime 이다. 예약 시각은 매번 clock() 으로
+    다시 계산하므로 콜백 처리 시간이나 after 지연이 누적되지 않는다.
+    """
+
+    def __init__(self, schedule, callback, clock=time.time, cancel=None):
+        self.schedule = schedule
+        self.callback = callback
+        self.clock = clock
+        self.cancel = cancel
+        self.pending = None
+
+    def start(self):
+        self.tick()
+
+    def tick(self):
+        second = round(self.clock())
+        try:
+            self.callback(datetime.fromtimestamp(second))
+        finally:
+            delay = next_tick_delay(self.clock(), second)
+            self.pending = self.schedule(max(1, round(delay * 1000)), self.tick)
+
+    def stop(self):
+        if self.cancel and self.pending is not None:
+            self.cancel(self.pending)
+        self.pending = None
+
+async def print_countdown(game_type):
+    async for remaining_minutes, remaining_seconds in countdown(game_type):
         print(f"남은 시간: {remaining_minutes}분 {remaining_seconds}초")
-        
-        # 1초 대기 후 다음 계산
-        time.sleep(1)
-        
-        # 필요한 경우 반환값 사용
-        # return remaining_minutes, remaining_seconds
 
 # 타이머 실행
 if __name__ == "__main__":
-    get_timer_remaining_time('power_ladder')
-
+    try:
+        asyncio.run(print_countdown('power_ladder'))
+    except KeyboardInterrupt:
+        pass
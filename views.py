@@ -0,0 +1,337 @@
+import time
+import heapq
+import itertools
+import tkinter as tk
+from tkinter import ttk
+
+# 화면 계층
+#   TkView        - 실제 tkinter/ttk 위젯
+#   NullView      - 화면 없이 값만 보관하는 위젯 (서버/일괄 재생용, 디스플레이 불필요)
+#   RecordingView - NullView + 위젯 호출 기록 (화면 갱신 횟수 확인용)
+# LadderGameGUI 는 view.Label(...), view.Treeview(...) 처럼 view 에서 위젯을 만들고
+# 위젯/루트의 tkinter 메서드 중 실제로 쓰는 것만 Null 쪽에 같은 이름으로 구현한다.
+
+
+class TkView:
+    """tkinter 위젯으로 그리는 기본 화면"""
+
+    Frame = ttk.Frame
+    LabelFrame = ttk.LabelFrame
+    Label = ttk.Label
+    Button = ttk.Button
+    Radiobutton = ttk.Radiobutton
+    Combobox = ttk.Combobox
+    Scrollbar = ttk.Scrollbar
+    Treeview = ttk.Treeview
+    Style = ttk.Style
+    Text = tk.Text
+    Toplevel = tk.Toplevel
+    StringVar = tk.StringVar
+
+    def __init__(self, root=None):
+        self.root = root if root is not None else tk.Tk()
+
+
+class NullRoot:
+    """화면 없는 루트 창: after/after_idle 예약을 직접 관리
+
+    update_idletasks 는 유휴 콜백만, update 는 시간이 된 타이머까지 실행한다.
+    mainloop 는 destroy 가 불릴 때까지 다음 타이머 시각에 맞춰 잠들었다 깨어난다.
+    """
+
+    def __init__(self, clock=time.monotonic, sleep=time.sleep):
+        self.clock = clock
+        self.sleep = sleep
+        self.timers = []      # (실행 시각, 순번, id)
+        self.callbacks = {}   # id: (콜백, 인자)
+        self.idle = []
+        self.ids = itertools.count(1)
+        self.destroyed = False
+
+    def record(self, widget, method, args, kwargs):
+        pass
+
+    def after(self, ms, func=None, *args):
+        after_id = f"after#{next(self.ids)}"
+        self.callbacks[after_id] = (func, args)
+        heapq.heappush(self.timers, (self.clock() + ms / 1000, after_id))
+        return after_id
+
+    def after_idle(self, func, *args):
+        self.idle.append((func, args))
+
+    def after_cancel(self, after_id):
+        self.callbacks.pop(after_id, None)
+
+    def update_idletasks(self):
+        while self.idle:
+            idle, self.idle = self.idle, []
+            for func, args in idle:
+                func(*args)
+
+    def update(self):
+        now = self.clock()
+        while self.timers and self.timers[0][0] <= now:
+            _, after_id = heapq.heappop(self.timers)
+            callback = self.callbacks.pop(after_id, None)
+            if callback is not None:
+                callback[0](*callback[1])
+        self.update_idletasks()
+
+    def mainloop(self):
+        while not self.destroyed:
+            self.update()
+            if self.timers:
+                self.sleep(max(0.0, min(1.0, self.timers[0][0] - self.clock())))
+            else:
+                self.sleep(0.1)
+
+    def destroy(self):
+        self.destroyed = True
+        self.timers = []
+        self.callbacks.clear()
+        self.idle = []
+
+    def title(self, *args):
+        pass
+
+    def geometry(self, *args):
+        pass
+
+    def protocol(self, *args):
+        pass
+
+    def bind(self, *args):
+        pass
+
+    def withdraw(self):
+        pass
+
+
+class RecordingRoot(NullRoot):
+    """위젯 호출을 calls 에 (위젯, 메서드, 인자, 키워드 인자) 로 남기는 루트"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = []
+
+    def record(self, widget, method, args, kwargs):
+        self.calls.append((widget, method, args, kwargs))
+
+
+class NullWidget:
+    """옵션 값만 보관하는 위젯 (배치/바인딩은 무시)"""
+
+    def __init__(self, master=None, **options):
+        self.master = master
+        self.root = master.root if isinstance(master, NullWidget) else master
+        self.options = options
+
+    def config(self, **options):
+        self.root.record(self, 'config', (), options)
+        self.options.update(options)
+
+    configure = config
+
+    def cget(self, key):
+        return self.options.get(key, '')
+
+    def after(self, ms, func=None, *args):
+        return self.root.after(ms, func, *args)
+
+    def grid(self, **options):
+        pass
+
+    def bind(self, *args):
+        pass
+
+    def destroy(self):
+        pass
+
+
+class NullToplevel(NullWidget):
+
+    def title(self, *args):
+        pass
+
+    def protocol(self, *args):
+        pass
+
+
+class NullScrollbar(NullWidget):
+
+    def set(self, first, last):
+        pass
+
+
+class NullTreeview(NullWidget):
+    """행 값/태그를 보관하는 트리뷰"""
+
+    def __init__(self, master=None, columns=(), **options):
+        super().__init__(master, **options)
+        self.columns = tuple(columns)
+        self.rows = {}   # iid: {'values': ..., 'tags': ...}
+        self.order = []  # 위에서부터 iid
+
+    def heading(self, *args, **kwargs):
+        pass
+
+    def column(self, *args, **kwargs):
+        pass
+
+    def tag_configure(self, *args, **kwargs):
+        pass
+
+    def yview(self, *args):
+        pass
+
+    def insert(self, parent, index, iid=None, values=(), tags=()):
+        self.root.record(self, 'insert', (parent, index, iid), {'values': values, 'tags': tags})
+        self.rows[iid] = {'values': tuple(values), 'tags': tuple(tags)}
+        if index == 'end':
+            self.order.append(iid)
+        else:
+            self.order.insert(index, iid)
+        return iid
+
+    def exists(self, iid):
+        return iid in self.rows
+
+    def item(self, iid, **options):
+        if not options:
+            return dict(self.rows[iid])
+        self.root.record(self, 'item', (iid,), options)
+        row = self.rows[iid]
+        for key in ('values', 'tags'):
+            if key in options:
+                row[key] = tuple(options[key])
+
+    def set(self, iid, column):
+        return self.rows[iid]['values'][self.columns.index(column)]
+
+    def delete(self, *iids):
+        self.root.record(self, 'delete', iids, {})
+        for iid in iids:
+            del self.rows[iid]
+            self.order.remove(iid)
+
+    def get_children(self, item=''):
+        return tuple(self.order)
+
+
+class NullText(NullWidget):
+    """줄 목록으로 내용을 보관하는 텍스트 위젯 ('줄.열', 'end', 'end-1c' 인덱스만 지원)"""
+
+    def __init__(self, master=None, **options):
+        super().__init__(master, **options)
+        self.lines = ['']
+
+    def _offset(self, index):
+        length = sum(len(line) for line in self.lines) + len(self.lines) - 1
+        if index.startswith(tk.END):
+            return length
+        line, column = (int(part) for part in index.split('.'))
+        if line > len(self.lines):
+            return length
+        return min(length, sum(len(text) + 1 for text in self.lines[:line - 1]) + column)
+
+    def index(self, index):
+        if index.startswith(tk.END):
+            return f"{len(self.lines)}.{len(self.lines[-1])}"
+        return index
+
+    def insert(self, index, text):
+        self.root.record(self, 'insert', (index, text), {})
+        parts = text.split('\n')
+        if index == tk.END:  # 끝에 추가 (가장 흔한 경우라 전체를 다시 만들지 않음)
+            self.lines[-1] += parts[0]
+            self.lines.extend(parts[1:])
+            return
+        content = '\n'.join(self.lines)
+        offset = self._offset(index)
+        self.lines = (content[:offset] + text + content[offset:]).split('\n')
+
+    def get(self, start, end=None):
+        content = '\n'.join(self.lines)
+        start_offset = self._offset(start)
+        return content[start_offset:self._offset(end) if end is not None else start_offset + 1]
+
+    def delete(self, start, end=None):
+        self.root.record(self, 'delete', (start, end), {})
+        content = '\n'.join(self.lines)
+        start_offset = self._offset(start)
+        end_offset = self._offset(end) if end is not None else start_offset + 1
+        self.lines = (content[:start_offset] + content[end_offset:]).split('\n')
+
+    def see(self, index):
+        pass
+
+    def yview(self, *args):
+        pass
+
+
+class NullVariable:
+    """tk.StringVar 대신 쓰는 값 (trace_add 콜백 지원)"""
+
+    def __init__(self, master=None, value=''):
+        self.value = value
+        self.traces = []
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+        for callback in self.traces:
+            callback('', '', 'write')
+
+    def trace_add(self, mode, callback):
+        self.traces.append(callback)
+
+
+class NullStyle:
+
+    def __init__(self, *args):
+        pass
+
+    def configure(self, *args, **kwargs):
+        pass
+
+
+class NullView:
+    """화면 없이 LadderGameGUI 를 실행하는 위젯 모음 (그리기 비용 없음)"""
+
+    Frame = NullWidget
+    LabelFrame = NullWidget
+    Label = NullWidget
+    Button = NullWidget
+    Radiobutton = NullWidget
+    Combobox = NullWidget
+    Scrollbar = NullScrollbar
+    Treeview = NullTreeview
+    Style = NullStyle
+    Text = NullText
+    Toplevel = NullToplevel
+    StringVar = NullVariable
+
+    def __init__(self, root=None):
+        self.root = root if root is not None else NullRoot()
+
+
+class RecordingView(NullView):
+    """NullView + 위젯 호출 기록 (view.calls)"""
+
+    def __init__(self, root=None):
+        super().__init__(root if root is not None else RecordingRoot())
+
+    @property
+    def calls(self):
+        return self.root.calls
+
+
+# 이름으로 고르는 화면 계층 (bench.py --backend, test.py --headless)
+VIEWS = {'tk': TkView, 'null': NullView, 'recording': RecordingView}
+
+
+def create_view(name='tk'):
+    return VIEWS[name]()